@@ -1,1069 +1,412 @@
 import streamlit as st
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor, Cm
-from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
-from docx.enum.section import WD_ORIENT
-from docx.enum.table import WD_TABLE_ALIGNMENT, WD_ROW_HEIGHT_RULE
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
-import io
-from datetime import datetime, timedelta
-import calendar
+import logging
+import os
+import tempfile
+import uuid
+from datetime import datetime
 
-from docx.enum.section import WD_SECTION
+from notegen import (
+    COMPACT_TYPES,
+    GENERATION_PHASES,
+    LEAN_TYPES,
+    NOTEBOOK_TYPES,
+    PDF_TYPES,
+    PREVIEW_TYPES,
+    STREAM_MAX_PAGES,
+    STREAMABLE_TYPES,
+    SPILL_BYTES,
+    ArtifactReader,
+    ArtifactStore,
+    DocumentCache,
+    GenerationScheduler,
+    JobRejected,
+    SessionArtifacts,
+    config_key,
+    estimate_cost,
+    notebook_filename,
+    option_ranges,
+    preview_svg,
+)
 
-def add_footer(doc):
-    """페이지 하단에 푸터 추가"""
-    # 모든 섹션에 푸터 추가
-    for section in doc.sections:
-        footer = section.footer
-        
-        # 푸터가 비어있으면 새 단락 추가
-        if not footer.paragraphs:
-            footer_para = footer.add_paragraph()
-        else:
-            footer_para = footer.paragraphs[0]
-            footer_para.clear()
-        
-        # 푸터 텍스트 추가
-        footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        footer_run = footer_para.add_run("세계교육 표준으로 삶의 힘을 키우는 따뜻한 경북교육")
-        footer_run.font.size = Pt(9)
-        footer_run.font.color.rgb = RGBColor(128, 128, 128)
-        footer_run.font.italic = True
-        
-        # 여백 조정
-        footer_para.paragraph_format.space_before = Pt(12)
+# 생성 로그(notegen 로거의 한 줄 JSON)를 표준 에러로 출력
+logging.basicConfig(format="%(asctime)s %(name)s %(levelname)s %(message)s")
+logging.getLogger("notegen").setLevel(os.environ.get("NOTEGEN_LOG_LEVEL", "INFO"))
+logger = logging.getLogger("notegen.app")
 
-def add_user_info(doc, school_name="", grade="", class_num="", student_name=""):
-    """페이지 상단에 사용자 정보 추가"""
-    if any([school_name, grade, class_num, student_name]):
-        # 사용자 정보 테이블
-        info_table = doc.add_table(rows=1, cols=4)
-        info_table.style = 'Normal Table'
-        info_table.alignment = WD_TABLE_ALIGNMENT.RIGHT
-        
-        # 학교명
-        if school_name:
-            school_cell = info_table.cell(0, 0)
-            school_cell.width = Inches(2)
-            school_p = school_cell.paragraphs[0]
-            school_p.add_run(school_name)
-            school_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # 학년
-        if grade:
-            grade_cell = info_table.cell(0, 1)
-            grade_cell.width = Inches(1)
-            grade_p = grade_cell.paragraphs[0]
-            grade_p.add_run(grade)
-            grade_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # 반
-        if class_num:
-            class_cell = info_table.cell(0, 2)
-            class_cell.width = Inches(1)
-            class_p = class_cell.paragraphs[0]
-            class_p.add_run(class_num)
-            class_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # 이름
-        if student_name:
-            name_cell = info_table.cell(0, 3)
-            name_cell.width = Inches(1.5)
-            name_p = name_cell.paragraphs[0]
-            name_p.add_run(f"이름: {student_name}")
-            name_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # 테이블 스타일 조정
-        for row in info_table.rows:
-            for cell in row.cells:
-                # 테두리 제거
-                tc = cell._element
-                tcPr = tc.get_or_add_tcPr()
-                tcBorders = OxmlElement('w:tcBorders')
-                for border in ['top', 'left', 'bottom', 'right']:
-                    side = OxmlElement(f'w:{border}')
-                    side.set(qn('w:val'), 'nil')
-                    tcBorders.append(side)
-                tcPr.append(tcBorders)
-                
-                # 폰트 크기 조정
-                for paragraph in cell.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.size = Pt(10)
-        
-        # 구분선
-        line_para = doc.add_paragraph("─" * 80)
-        line_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        line_para.paragraph_format.space_before = Pt(6)
-        line_para.paragraph_format.space_after = Pt(12)
-        
-        return True
-    return False
+# 파일 형식별 다운로드 표시
+OUTPUT_FORMATS = {
+    "docx": ("Word (.docx)", "📥 Word 파일 다운로드",
+             "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    "pdf": ("PDF (인쇄용)", "📥 PDF 파일 다운로드", "application/pdf"),
+}
 
-def create_lined_notebook(doc, lines_per_page=25, num_pages=5, user_info=None):
-    """줄공책 양식 생성 - 테이블 방식"""
-    for page in range(num_pages):
-        if page > 0:
-            doc.add_page_break()
-        
-        # 사용자 정보 추가
-        if user_info and page == 0:
-            add_user_info(doc, **user_info)
-        
-        # 페이지 상단 여백
-        top_para = doc.add_paragraph()
-        top_para.paragraph_format.space_after = Pt(10)
-        
-        # 테이블을 사용한 줄 생성
-        table = doc.add_table(rows=lines_per_page, cols=1)
-        table.autofit = False
-        table.style = 'Normal Table'
-        
-        for i, row in enumerate(table.rows):
-            # 행 높이 설정
-            row.height = Pt(28)
-            row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-            
-            cell = row.cells[0]
-            cell.width = Inches(7.5)
-            
-            # 셀 내부 단락 설정
-            if cell.paragraphs:
-                p = cell.paragraphs[0]
-                p.paragraph_format.space_before = Pt(0)
-                p.paragraph_format.space_after = Pt(0)
-                p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
-            
-            # 셀 테두리 설정
-            tc = cell._element
-            tcPr = tc.get_or_add_tcPr()
-            
-            # 기존 테두리 제거
-            tcBorders = tcPr.find(qn('w:tcBorders'))
-            if tcBorders is not None:
-                tcPr.remove(tcBorders)
-            
-            # 새 테두리 설정
-            tcBorders = OxmlElement('w:tcBorders')
-            
-            # 하단 선만 추가
-            bottom = OxmlElement('w:bottom')
-            bottom.set(qn('w:val'), 'single')
-            bottom.set(qn('w:sz'), '4')
-            bottom.set(qn('w:space'), '0')
-            bottom.set(qn('w:color'), '808080')
-            tcBorders.append(bottom)
-            
-            # 나머지 테두리는 없음
-            for border in ['top', 'left', 'right']:
-                side = OxmlElement(f'w:{border}')
-                side.set(qn('w:val'), 'nil')
-                tcBorders.append(side)
-            
-            tcPr.append(tcBorders)
-            
-            # 셀 여백 설정
-            tcMar = tcPr.find(qn('w:tcMar'))
-            if tcMar is not None:
-                tcPr.remove(tcMar)
-                
-            tcMar = OxmlElement('w:tcMar')
-            for margin_name in ['top', 'left', 'bottom', 'right']:
-                margin = OxmlElement(f'w:{margin_name}')
-                margin.set(qn('w:w'), '50')
-                margin.set(qn('w:type'), 'dxa')
-                tcMar.append(margin)
-            tcPr.append(tcMar)
+# 캐시 바이트 예산 (환경 변수 NOTEGEN_CACHE_BYTES로 조정)
+CACHE_MAX_BYTES = int(os.environ.get("NOTEGEN_CACHE_BYTES", 256 * 1024 * 1024))
 
-def create_grid_notebook(doc, rows=15, cols=15, num_pages=5, user_info=None):
-    """칸공책 양식 생성"""
-    # 첫 페이지에서 푸터 설정
-    add_footer(doc)
-    
-    for page in range(num_pages):
-        if page > 0:
-            doc.add_page_break()
-        
-        # 사용자 정보 추가
-        if user_info and page == 0:
-            add_user_info(doc, **user_info)
-        
-        # 페이지 크기 계산 (A4 기준)
-        page_width = 8.27 - 1.0  # 인치 (여백 제외)
-        page_height = 11.69 - 1.0
-        
-        cell_width = page_width / cols
-        cell_height = page_height / rows
-        
-        # 테이블 생성
-        table = doc.add_table(rows=rows, cols=cols)
-        table.style = 'Table Grid'
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        table.autofit = False
-        table.allow_autofit = False
-        
-        # 각 행 설정
-        for row in table.rows:
-            # 행 높이 설정
-            tr = row._element
-            trPr = tr.get_or_add_trPr()
-            
-            # 기존 높이 설정 제거
-            for child in trPr:
-                if child.tag.endswith('trHeight'):
-                    trPr.remove(child)
-            
-            # 새 높이 설정
-            trHeight = OxmlElement('w:trHeight')
-            trHeight.set(qn('w:val'), str(int(cell_height * 1440)))  # twips
-            trHeight.set(qn('w:hRule'), 'exact')
-            trPr.append(trHeight)
-            
-            # 각 셀 설정
-            for cell in row.cells:
-                # 셀 너비 설정
-                cell.width = Inches(cell_width)
-                
-                # 셀 내용 설정
-                if cell.paragraphs:
-                    p = cell.paragraphs[0]
-                    p.paragraph_format.space_before = Pt(0)
-                    p.paragraph_format.space_after = Pt(0)
-                    p.paragraph_format.line_spacing = Pt(0)
-                
-                # 셀 여백 최소화
-                tc = cell._element
-                tcPr = tc.get_or_add_tcPr()
-                
-                # 기존 여백 제거
-                tcMar = tcPr.find(qn('w:tcMar'))
-                if tcMar is not None:
-                    tcPr.remove(tcMar)
-                
-                # 새 여백 설정
-                tcMar = OxmlElement('w:tcMar')
-                for margin_name in ['top', 'left', 'bottom', 'right']:
-                    margin = OxmlElement(f'w:{margin_name}')
-                    margin.set(qn('w:w'), '10')
-                    margin.set(qn('w:type'), 'dxa')
-                    tcMar.append(margin)
-                tcPr.append(tcMar)
+# 이보다 큰 문서는 임시 파일에 두고 내려받을 때 디스크에서 읽음 (환경 변수 NOTEGEN_SPILL_BYTES로 조정)
+MAX_MEMORY_BYTES = int(os.environ.get("NOTEGEN_SPILL_BYTES", SPILL_BYTES))
 
-def create_english_notebook(doc, lines_per_page=12, num_pages=5, user_info=None):
-    """영어노트 양식 생성 (4선 노트)"""
-    # 첫 페이지에서 푸터 설정
-    add_footer(doc)
-    
-    for page in range(num_pages):
-        if page > 0:
-            doc.add_page_break()
-        
-        # 사용자 정보 추가
-        if user_info and page == 0:
-            add_user_info(doc, **user_info)
-        
-        # 페이지 상단 여백
-        top_margin = doc.add_paragraph()
-        top_margin.paragraph_format.space_after = Pt(20)
-        
-        # 페이지 높이 계산 (A4 기준, 여백 제외)
-        available_height = 11.69 - 1.0  # 인치
-        header_space = 1.5  # 상단 여백
-        remaining_height = available_height - header_space
-        
-        # 줄 간격 계산 (줄 수에 따라 동적으로 조정)
-        total_spacing = remaining_height / lines_per_page
-        line_spacing = total_spacing * 0.8  # 80%는 줄 간격
-        between_spacing = total_spacing * 0.2  # 20%는 줄 사이 간격
-        
-        for i in range(lines_per_page):
-            # 4선을 위한 테이블 생성
-            table = doc.add_table(rows=4, cols=1)
-            table.autofit = False
-            table.style = 'Normal Table'
-            
-            # 각 선의 높이 비율
-            line_heights = [
-                line_spacing * 0.2,  # 상단 점선
-                line_spacing * 0.2,  # 상단 실선
-                line_spacing * 0.3,  # 기준선 (더 넓게)
-                line_spacing * 0.3   # 하단 실선
-            ]
-            
-            # 첫 번째 선 (상단 점선)
-            row1 = table.rows[0]
-            row1.height = Pt(line_heights[0] * 72)  # 인치를 포인트로 변환
-            row1.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-            cell1 = row1.cells[0]
-            cell1.width = Inches(7.5)
-            
-            # 점선 스타일
-            tc1 = cell1._element
-            tcPr1 = tc1.get_or_add_tcPr()
-            tcBorders1 = OxmlElement('w:tcBorders')
-            bottom1 = OxmlElement('w:bottom')
-            bottom1.set(qn('w:val'), 'dotted')
-            bottom1.set(qn('w:sz'), '4')
-            bottom1.set(qn('w:color'), 'CCCCCC')
-            tcBorders1.append(bottom1)
-            tcPr1.append(tcBorders1)
-            
-            # 두 번째 선 (상단 실선)
-            row2 = table.rows[1]
-            row2.height = Pt(line_heights[1] * 72)
-            row2.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-            cell2 = row2.cells[0]
-            
-            tc2 = cell2._element
-            tcPr2 = tc2.get_or_add_tcPr()
-            tcBorders2 = OxmlElement('w:tcBorders')
-            bottom2 = OxmlElement('w:bottom')
-            bottom2.set(qn('w:val'), 'single')
-            bottom2.set(qn('w:sz'), '4')
-            bottom2.set(qn('w:color'), '808080')
-            tcBorders2.append(bottom2)
-            tcPr2.append(tcBorders2)
-            
-            # 세 번째 선 (기준선 - 굵은 실선)
-            row3 = table.rows[2]
-            row3.height = Pt(line_heights[2] * 72)
-            row3.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-            cell3 = row3.cells[0]
-            
-            tc3 = cell3._element
-            tcPr3 = tc3.get_or_add_tcPr()
-            tcBorders3 = OxmlElement('w:tcBorders')
-            bottom3 = OxmlElement('w:bottom')
-            bottom3.set(qn('w:val'), 'single')
-            bottom3.set(qn('w:sz'), '6')
-            bottom3.set(qn('w:color'), '000000')
-            tcBorders3.append(bottom3)
-            tcPr3.append(tcBorders3)
-            
-            # 네 번째 선 (하단 실선)
-            row4 = table.rows[3]
-            row4.height = Pt(line_heights[3] * 72)
-            row4.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-            cell4 = row4.cells[0]
-            
-            tc4 = cell4._element
-            tcPr4 = tc4.get_or_add_tcPr()
-            tcBorders4 = OxmlElement('w:tcBorders')
-            bottom4 = OxmlElement('w:bottom')
-            bottom4.set(qn('w:val'), 'single')
-            bottom4.set(qn('w:sz'), '4')
-            bottom4.set(qn('w:color'), '808080')
-            tcBorders4.append(bottom4)
-            tcPr4.append(tcBorders4)
-            
-            # 모든 셀의 다른 테두리 제거
-            for row in table.rows:
-                cell = row.cells[0]
-                tc = cell._element
-                tcPr = tc.get_or_add_tcPr()
-                tcBorders = tcPr.find(qn('w:tcBorders'))
-                if tcBorders is not None:
-                    for border in ['top', 'left', 'right']:
-                        side = tcBorders.find(qn(f'w:{border}'))
-                        if side is None:
-                            side = OxmlElement(f'w:{border}')
-                            side.set(qn('w:val'), 'nil')
-                            tcBorders.append(side)
-            
-            # 줄 사이 간격 (마지막 줄 제외)
-            if i < lines_per_page - 1:
-                spacing = doc.add_paragraph()
-                spacing.paragraph_format.space_after = Pt(between_spacing * 72)
+# 같은 서버의 모든 Streamlit 프로세스가 함께 쓰는 디스크 저장소
+# (환경 변수 NOTEGEN_STORE_DIR, NOTEGEN_STORE_BYTES로 조정)
+STORE_DIR = os.environ.get("NOTEGEN_STORE_DIR", os.path.join(tempfile.gettempdir(), "notegen-artifacts"))
+STORE_MAX_BYTES = int(os.environ.get("NOTEGEN_STORE_BYTES", 1024 * 1024 * 1024))
+
+# 학교 서식 .docx 경로 (머리글 로고, 바닥글을 모든 노트에 사용, 환경 변수 NOTEGEN_LETTERHEAD로 지정)
+LETTERHEAD = os.environ.get("NOTEGEN_LETTERHEAD") or None
+
+@st.cache_resource
+def get_document_cache():
+    """모든 세션이 함께 쓰는 문서 캐시"""
+    return DocumentCache(CACHE_MAX_BYTES)
+
+@st.cache_resource
+def get_artifact_store():
+    """이 프로세스의 디스크 저장소 핸들 (파일은 다른 프로세스와 공유)"""
+    return ArtifactStore(STORE_DIR, STORE_MAX_BYTES)
+
+@st.cache_resource
+def load_generator():
+    """python-docx 생성 기능을 프로세스마다 처음 생성할 때 한 번 불러와 반환
+
+    위젯만 바꾸는 재실행에서는 python-docx를 불러오지 않는다.
+    용지 방향별 기본 문서(템플릿, 여백, 푸터)도 이때 미리 읽어 둔다.
+    """
+    from notegen import new_document, spool_notebook
+    for orientation in ("세로", "가로"):
+        new_document(orientation, LETTERHEAD)
+    return spool_notebook
+
+# 생성 진단 정보에 문서 복잡도(표, 셀, 문단 수)도 셀지 (본문 전체를 세므로 큰 문서는 느려짐,
+# 환경 변수 NOTEGEN_DOCUMENT_STATS=1로 켬)
+DOCUMENT_STATS = os.environ.get("NOTEGEN_DOCUMENT_STATS") == "1"
+
+# 세션마다 마지막 결과를 재실행 사이에 보관 (환경 변수로 조정)
+#   NOTEGEN_SESSION_BYTES: 세션 하나가 메모리에 들고 있는 결과 크기 한도 (넘으면 캐시/저장소 참조만)
+#   NOTEGEN_SESSIONS_BYTES: 모든 세션이 메모리에 들고 있는 결과 합계 한도
+#   NOTEGEN_SESSION_MAX_IDLE: 이 시간(초) 동안 화면을 다시 그리지 않은 세션의 결과는 지움
+SESSION_MAX_BYTES = int(os.environ.get("NOTEGEN_SESSION_BYTES", 16 * 1024 * 1024))
+SESSIONS_MAX_BYTES = int(os.environ.get("NOTEGEN_SESSIONS_BYTES", 128 * 1024 * 1024))
+SESSION_MAX_IDLE = float(os.environ.get("NOTEGEN_SESSION_MAX_IDLE", 3600))
 
-def create_cornell_notebook(doc, num_pages=5, user_info=None):
-    """코넬노트 양식 생성"""
-    # 첫 페이지에서 푸터 설정
-    add_footer(doc)
+@st.cache_resource
+def get_session_artifacts():
+    """모든 세션의 마지막 결과 보관소"""
+    return SessionArtifacts(SESSION_MAX_BYTES, SESSIONS_MAX_BYTES, SESSION_MAX_IDLE)
+
+def session_id():
+    """이 브라우저 세션의 보관소 ID"""
+    return st.session_state.setdefault("session_id", uuid.uuid4().hex)
+
+def find_artifact(key):
+    """메모리 캐시, 디스크 저장소 순서로 찾은 문서 (없으면 None)
+
+    디스크에서 찾은 작은 문서는 다음부터 메모리 캐시에서 바로 쓰도록 올려 둔다.
+    """
+    cache = get_document_cache()
+    artifact = cache.get(key)
+    if artifact is not None:
+        return artifact
+    # 디스크 저장소는 있으면 좋은 캐시: 읽기 오류는 기록만 하고 없는 것으로 봄
+    try:
+        stored = get_artifact_store().get(key)
+        if stored is None or os.fstat(stored.fileno()).st_size > MAX_MEMORY_BYTES:
+            return stored
+        with stored:
+            artifact = stored.read()
+    except OSError:
+        logger.warning("artifact store read failed", exc_info=True)
+        return None
+    cache.put(key, artifact)
+    return artifact
+
+def session_artifact(key):
+    """이 세션의 key 결과: 세션 보관소, 캐시, 디스크 저장소 순서로 찾음 (없으면 None, 새로 만들지 않음)"""
+    artifacts = get_session_artifacts()
+    artifact = artifacts.get(session_id(), key)
+    if artifact is None:
+        artifact = find_artifact(key)
+        if artifact is not None:
+            artifacts.put(session_id(), key, artifact)
+    return artifact
+
+def download_data(artifact):
+    """download_button에 넘길 내용
+
+    bytes는 그대로(캐시와 같은 객체라 복사되지 않음) 넘기고,
+    임시 파일은 누를 때 디스크에서 읽는 함수로 넘긴다 (세션에 바이트를 두지 않음).
+    같은 파일을 든 다른 세션과 읽기 위치가 섞이지 않도록 누를 때마다 따로 읽는 ArtifactReader를 만든다.
+    """
+    if isinstance(artifact, bytes):
+        return artifact
     
-    for page in range(num_pages):
-        if page > 0:
-            doc.add_page_break()
-        
-        # 사용자 정보 추가
-        if user_info and page == 0:
-            add_user_info(doc, **user_info)
-        
-        # 상단 영역 (제목, 날짜)
-        header_table = doc.add_table(rows=1, cols=2)
-        header_table.style = 'Table Grid'
-        header_table.columns[0].width = Inches(4)
-        header_table.columns[1].width = Inches(2.5)
-        
-        # 제목 셀
-        title_cell = header_table.cell(0, 0)
-        title_p = title_cell.paragraphs[0]
-        title_p.add_run("제목: ").bold = True
-        
-        # 날짜 셀
-        date_cell = header_table.cell(0, 1)
-        date_p = date_cell.paragraphs[0]
-        date_p.add_run("날짜: ").bold = True
-        
-        # 간격
-        doc.add_paragraph().paragraph_format.space_after = Pt(12)
-        
-        # 메인 영역 (핵심어 | 노트)
-        main_table = doc.add_table(rows=1, cols=2)
-        main_table.style = 'Table Grid'
-        main_table.columns[0].width = Inches(2)
-        main_table.columns[1].width = Inches(4.5)
-        
-        # 핵심어 열
-        key_cell = main_table.cell(0, 0)
-        key_p = key_cell.paragraphs[0]
-        key_p.add_run("핵심어/질문").bold = True
-        key_p.add_run("\n\n")
-        
-        # 노트 열
-        note_cell = main_table.cell(0, 1)
-        note_p = note_cell.paragraphs[0]
-        note_p.add_run("노트 영역").bold = True
-        note_p.add_run("\n\n")
-        
-        # 셀 높이 설정
-        tr = main_table.rows[0]._element
-        trPr = tr.get_or_add_trPr()
-        trHeight = OxmlElement('w:trHeight')
-        trHeight.set(qn('w:val'), '8000')  # 약 5.5인치
-        trHeight.set(qn('w:hRule'), 'atLeast')
-        trPr.append(trHeight)
-        
-        # 간격
-        doc.add_paragraph().paragraph_format.space_after = Pt(12)
-        
-        # 하단 요약 영역
-        summary_title = doc.add_paragraph("요약:")
-        summary_title.runs[0].font.bold = True
-        summary_title.paragraph_format.space_after = Pt(6)
-        
-        # 요약 박스
-        summary_table = doc.add_table(rows=1, cols=1)
-        summary_table.style = 'Table Grid'
-        summary_cell = summary_table.cell(0, 0)
-        
-        # 요약 영역 높이 설정
-        tr = summary_table.rows[0]._element
-        trPr = tr.get_or_add_trPr()
-        trHeight = OxmlElement('w:trHeight')
-        trHeight.set(qn('w:val'), '2000')  # 약 1.5인치
-        trHeight.set(qn('w:hRule'), 'atLeast')
-        trPr.append(trHeight)
+    def reader():
+        return ArtifactReader(artifact)
+    
+    return reader
+
+# 미리보기 표시 너비 (픽셀)
+PREVIEW_WIDTH = 420
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def get_preview(config):
+    """설정별로 캐시되는 첫 페이지 SVG 미리보기"""
+    return preview_svg(config, width=PREVIEW_WIDTH)
+
+# 생성 진행률을 다시 그리는 간격(초), 화면이 이만큼 진행률을 보지 않으면 방치된 작업으로 보고 멈춤
+# (환경 변수 NOTEGEN_JOB_MAX_IDLE로 조정)
+PROGRESS_INTERVAL = 0.5
+JOB_MAX_IDLE = float(os.environ.get("NOTEGEN_JOB_MAX_IDLE", 10))
+
+# 생성 작업 스케줄러 설정 (비용 단위는 대략 셀 하나, estimate_cost 참고)
+#   NOTEGEN_MAX_RUNNING: 동시에 실행하는 작업 수
+#   NOTEGEN_COST_BUDGET: 동시에 실행 중인 작업 비용 합계 한도 (큰 작업만 기다림)
+#   NOTEGEN_MAX_JOB_COST: 이보다 비싼 작업은 거절
+#   NOTEGEN_LIGHT_COST: 이 이하의 작은 작업은 빠른 대기열로
+#   NOTEGEN_MAX_QUEUE: 대기열 길이 한도
+SCHEDULER_SETTINGS = {
+    "max_running": int(os.environ.get("NOTEGEN_MAX_RUNNING", 3)),
+    "cost_budget": int(os.environ.get("NOTEGEN_COST_BUDGET", 80000)),
+    "max_job_cost": int(os.environ.get("NOTEGEN_MAX_JOB_COST", 200000)),
+    "light_cost": int(os.environ.get("NOTEGEN_LIGHT_COST", 5000)),
+    "max_queue": int(os.environ.get("NOTEGEN_MAX_QUEUE", 100)),
+}
+
+@st.cache_resource
+def get_scheduler():
+    """모든 세션이 함께 쓰는 생성 작업 스케줄러"""
+    return GenerationScheduler(**SCHEDULER_SETTINGS)
+
+# 진행률 표시 단위
+PROGRESS_UNITS = {"다이어리": "일", "달력": "개월"}
 
-def create_music_staff(doc, staves_per_page=12, num_pages=5, user_info=None):
-    """음악 오선지 생성"""
-    # 첫 페이지에서 푸터 설정
-    add_footer(doc)
+def start_generation(config):
+    """캐시나 저장소에 있으면 바로 결과로, 없으면 생성 작업을 스케줄러에 맡김 (거절되면 오류로)
+
+    같은 설정을 이미 누가 생성하고 있으면 그 작업에 합류하여 결과를 함께 쓴다.
+    """
+    key = config_key(config)
+    if session_artifact(key) is not None:
+        return {"config": config, "key": key, "report": {}}
     
-    for page in range(num_pages):
-        if page > 0:
-            doc.add_page_break()
-        
-        # 사용자 정보 추가
-        if user_info and page == 0:
-            add_user_info(doc, **user_info)
-        
-        # 페이지 상단 여백
-        top_para = doc.add_paragraph()
-        top_para.paragraph_format.space_after = Pt(20)
-        
-        # 페이지 높이 계산 (A4 기준, 여백 제외)
-        available_height = 11.69 - 1.0  # 인치
-        header_space = 1.5  # 상단 여백
-        remaining_height = available_height - header_space
-        
-        # 오선지당 높이 계산
-        staff_total_height = remaining_height / staves_per_page
-        staff_height = staff_total_height * 0.4  # 40%는 오선지
-        spacing_height = staff_total_height * 0.6  # 60%는 간격
-        
-        for staff_num in range(staves_per_page):
-            # 5선을 위한 테이블 생성
-            table = doc.add_table(rows=5, cols=1)
-            table.autofit = False
-            table.style = 'Normal Table'
-            
-            # 각 선의 간격 계산
-            line_spacing = staff_height / 5
-            
-            for i, row in enumerate(table.rows):
-                # 행 높이 설정
-                row.height = Pt(line_spacing * 72)  # 인치를 포인트로 변환
-                row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-                
-                cell = row.cells[0]
-                cell.width = Inches(7.5)
-                
-                # 셀 테두리 설정 (하단 선만)
-                tc = cell._element
-                tcPr = tc.get_or_add_tcPr()
-                
-                # 기존 테두리 제거
-                tcBorders = tcPr.find(qn('w:tcBorders'))
-                if tcBorders is not None:
-                    tcPr.remove(tcBorders)
-                
-                # 새 테두리 설정
-                tcBorders = OxmlElement('w:tcBorders')
-                
-                # 하단 선만 추가
-                bottom = OxmlElement('w:bottom')
-                bottom.set(qn('w:val'), 'single')
-                bottom.set(qn('w:sz'), '6')
-                bottom.set(qn('w:space'), '0')
-                bottom.set(qn('w:color'), '000000')
-                tcBorders.append(bottom)
-                
-                # 나머지 테두리는 없음
-                for border in ['top', 'left', 'right']:
-                    side = OxmlElement(f'w:{border}')
-                    side.set(qn('w:val'), 'nil')
-                    tcBorders.append(side)
-                
-                tcPr.append(tcBorders)
-                
-                # 셀 여백 제거
-                tcMar = OxmlElement('w:tcMar')
-                for margin_name in ['top', 'left', 'bottom', 'right']:
-                    margin = OxmlElement(f'w:{margin_name}')
-                    margin.set(qn('w:w'), '0')
-                    margin.set(qn('w:type'), 'dxa')
-                    tcMar.append(margin)
-                tcPr.append(tcMar)
-            
-            # 오선 사이 간격 (마지막 오선 제외)
-            if staff_num < staves_per_page - 1:
-                spacing = doc.add_paragraph()
-                spacing.paragraph_format.space_after = Pt(spacing_height * 72)
+    spool_notebook = load_generator()
+    cache = get_document_cache()
+    store = get_artifact_store()
+    
+    def run(report):
+        # 생성 스레드에서 결과를 캐시와 저장소에 넣은 뒤 끝냄 (합류한 세션은 거기서 꺼내 씀)
+        artifact = spool_notebook(config, report, MAX_MEMORY_BYTES, stats=DOCUMENT_STATS)
+        try:
+            store.put(key, artifact)
+        except OSError:
+            # 디스크가 가득 찼거나 권한이 없어도 생성 결과는 그대로 씀
+            logger.warning("artifact store write failed", exc_info=True)
+        if isinstance(artifact, bytes):
+            cache.put(key, artifact)
+        return artifact
+    
+    try:
+        job = get_scheduler().submit(run, estimate_cost(config), max_idle=JOB_MAX_IDLE, key=key)
+    except JobRejected as e:
+        return {"config": config, "key": key, "error": str(e)}
+    return {"config": config, "key": key, "job": job}
 
-def create_chinese_notebook(doc, rows_per_page=6, chars_per_row=8, num_pages=5, user_info=None):
-    """한자 노트 생성 - 한국식 한자 쓰기 노트"""
-    # 첫 페이지에서 푸터 설정
-    add_footer(doc)
+def finish_generation(generation):
+    """끝난 작업의 결과를 이 세션에 보관하고 generation을 결과 상태로 바꿈"""
+    job = generation.pop("job")
+    if job.status == "done":
+        # 세션마다 캐시/저장소에서 따로 꺼냄 (저장소보다 커서 저장되지 않은 결과만 작업의 것을 씀)
+        if session_artifact(generation["key"]) is None:
+            get_session_artifacts().put(session_id(), generation["key"], job.result)
+        generation["report"] = job.report
+    elif job.status == "cancelled":
+        generation["cancelled"] = True
+    else:
+        generation["error"] = str(job.error)
+
+def job_progress_text(job, working, unit):
+    """대기열 차례 또는 진행 개수를 붙인 진행률 문구"""
+    position = get_scheduler().position(job)
+    if position is not None:
+        return f"차례를 기다리고 있습니다... (앞에 {position}개 작업)" if position else "곧 생성을 시작합니다..."
+    if job.total:
+        return f"{working} ({job.done}/{job.total}{unit})"
+    return working
+
+@st.fragment(run_every=PROGRESS_INTERVAL)
+def show_job_progress(generation):
+    """진행 중인 작업의 진행률과 취소 버튼 (끝나면 전체 화면을 다시 그림)"""
+    job = generation["job"]
+    job.touch()
+    if job.finished:
+        finish_generation(generation)
+        st.rerun()
     
-    for page in range(num_pages):
-        if page > 0:
-            doc.add_page_break()
-        
-        # 사용자 정보 추가
-        if user_info and page == 0:
-            add_user_info(doc, **user_info)
-        
-        # 페이지 상단 여백
-        top_para = doc.add_paragraph()
-        top_para.paragraph_format.space_after = Pt(20)
-        
-        # 페이지 높이 계산 (A4 기준, 여백 제외)
-        available_height = 11.69 - 1.0  # 인치
-        header_space = 1.5  # 상단 여백
-        remaining_height = available_height - header_space
-        
-        # 행당 높이 계산
-        row_total_height = remaining_height / rows_per_page
-        hanja_cell_height = row_total_height * 0.7  # 70%는 한자 칸
-        meaning_cell_height = row_total_height * 0.2  # 20%는 뜻 칸
-        spacing_height = row_total_height * 0.1  # 10%는 간격
-        
-        # 한자 연습용 테이블 생성 (한자칸 + 뜻칸)
-        for row_idx in range(rows_per_page):
-            # 한 줄에 한자칸과 뜻칸을 함께 생성
-            line_table = doc.add_table(rows=2, cols=chars_per_row)
-            line_table.style = 'Table Grid'
-            line_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-            line_table.autofit = False
-            
-            # 첫 번째 행: 한자 쓰기 칸
-            hanja_row = line_table.rows[0]
-            hanja_row.height = Pt(hanja_cell_height * 72)  # 인치를 포인트로 변환
-            hanja_row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-            
-            for col_idx in range(chars_per_row):
-                cell = hanja_row.cells[col_idx]
-                cell.width = Pt(hanja_cell_height * 72)  # 정사각형으로 만들기
-                
-                # 십자 가이드라인을 위한 2x2 내부 테이블
-                guide_table = cell.add_table(rows=2, cols=2)
-                guide_table.autofit = False
-                
-                # 4개의 셀로 십자 만들기
-                for i in range(2):
-                    for j in range(2):
-                        guide_cell = guide_table.cell(i, j)
-                        
-                        # 열 너비 설정 (왼쪽을 살짝 좁게)
-                        if j == 0:
-                            guide_cell.width = Pt(hanja_cell_height * 72 * 0.45)  # 왼쪽 열: 살짝 좁게
-                        else:
-                            guide_cell.width = Pt(hanja_cell_height * 72 * 0.55)  # 오른쪽 열: 살짝 넓게
-                        
-                        tc = guide_cell._element
-                        tcPr = tc.get_or_add_tcPr()
-                        
-                        # 행 높이 설정 (위쪽 행을 살짝 작게)
-                        if i == 0:
-                            tcH = OxmlElement('w:tcH')
-                            tcH.set(qn('w:val'), str(int(hanja_cell_height * 72 * 0.45)))  # 위쪽 행: 살짝 작게
-                            tcH.set(qn('w:hRule'), 'exact')
-                            tcPr.append(tcH)
-                        else:
-                            tcH = OxmlElement('w:tcH')
-                            tcH.set(qn('w:val'), str(int(hanja_cell_height * 72 * 0.55)))  # 아래쪽 행: 살짝 크게
-                            tcH.set(qn('w:hRule'), 'exact')
-                            tcPr.append(tcH)
-                        
-                        # 테두리 설정 - 내부 선만 점선으로
-                        tcBorders = OxmlElement('w:tcBorders')
-                        
-                        # 왼쪽 위 셀
-                        if i == 0 and j == 0:
-                            borders = {'right': 'dotted', 'bottom': 'dotted'}
-                        # 오른쪽 위 셀
-                        elif i == 0 and j == 1:
-                            borders = {'left': 'dotted', 'bottom': 'dotted'}
-                        # 왼쪽 아래 셀
-                        elif i == 1 and j == 0:
-                            borders = {'right': 'dotted', 'top': 'dotted'}
-                        # 오른쪽 아래 셀
-                        else:
-                            borders = {'left': 'dotted', 'top': 'dotted'}
-                        
-                        # 점선 테두리 추가
-                        for border, style in borders.items():
-                            side = OxmlElement(f'w:{border}')
-                            side.set(qn('w:val'), style)
-                            side.set(qn('w:sz'), '6')
-                            side.set(qn('w:color'), 'CCCCCC')
-                            tcBorders.append(side)
-                        
-                        # 외곽선은 없음
-                        for border in ['top', 'bottom', 'left', 'right']:
-                            if border not in borders:
-                                side = OxmlElement(f'w:{border}')
-                                side.set(qn('w:val'), 'nil')
-                                tcBorders.append(side)
-                        
-                        tcPr.append(tcBorders)
-                        
-                        # 여백 제거
-                        tcMar = OxmlElement('w:tcMar')
-                        for margin in ['top', 'left', 'bottom', 'right']:
-                            m = OxmlElement(f'w:{margin}')
-                            m.set(qn('w:w'), '0')
-                            m.set(qn('w:type'), 'dxa')
-                            tcMar.append(m)
-                        tcPr.append(tcMar)
-            
-            # 두 번째 행: 뜻 쓰기 칸
-            meaning_row = line_table.rows[1]
-            meaning_row.height = Pt(meaning_cell_height * 72)
-            meaning_row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-            
-            for col_idx in range(chars_per_row):
-                cell = meaning_row.cells[col_idx]
-                cell.width = Pt(hanja_cell_height * 72)
-                
-                # 뜻 칸 스타일
-                p = cell.paragraphs[0]
-                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                p.paragraph_format.space_before = Pt(2)
-                p.paragraph_format.space_after = Pt(2)
-                
-                # 연한 배경색
-                tc = cell._element
-                tcPr = tc.get_or_add_tcPr()
-                shading = OxmlElement('w:shd')
-                shading.set(qn('w:val'), 'clear')
-                shading.set(qn('w:color'), 'auto')
-                shading.set(qn('w:fill'), 'F5F5F5')
-                tcPr.append(shading)
-            
-            # 줄 간격 (마지막 줄 제외)
-            if row_idx < rows_per_page - 1:
-                spacing = doc.add_paragraph()
-                spacing.paragraph_format.space_after = Pt(spacing_height * 72)
+    unit = PROGRESS_UNITS.get(generation["config"]["notebook_type"], "페이지")
+    text = job_progress_text(job, "노트를 생성하고 있습니다...", unit)
+    if job.waiters > 1:
+        text += f" · 같은 설정으로 {job.waiters}명이 함께 기다리는 중"
+    st.progress(job.fraction, text=text)
+    if st.button("⏹️ 생성 취소", use_container_width=True):
+        # 함께 기다리는 사용자가 있으면 작업은 계속되고 이 세션만 빠짐
+        job.cancel()
+        generation.pop("job")
+        generation["cancelled"] = True
+        st.rerun()
 
-def create_diary(doc, start_date, num_days, user_info=None):
-    """다이어리 양식 생성"""
-    # 첫 페이지에서 푸터 설정
-    add_footer(doc)
+def show_generation_result(generation):
+    """생성 결과: 다운로드 버튼, 캐시 사용량, 진단 정보 (취소/오류면 안내)"""
+    if generation.get("cancelled"):
+        st.warning("생성을 취소했습니다.")
+        return
+    if "error" in generation:
+        st.error(f"❌ 오류가 발생했습니다: {generation['error']}")
+        st.info("다른 설정으로 다시 시도해보세요.")
+        return
     
-    # 첫 페이지에 사용자 정보 추가
-    if user_info:
-        add_user_info(doc, **user_info)
-        doc.add_page_break()
+    config = generation["config"]
+    report = generation["report"]
+    artifact = session_artifact(generation["key"])
+    if artifact is None:
+        st.warning("보관 기간이 지나 문서가 지워졌습니다. '노트 생성'을 다시 눌러주세요.")
+        return
     
-    for day in range(num_days):
-        if day > 0:
-            doc.add_page_break()
-        
-        current_date = start_date + timedelta(days=day)
-        
-        # 날짜 헤더
-        date_header = doc.add_paragraph()
-        date_header.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        date_run = date_header.add_run(current_date.strftime("%Y년 %m월 %d일 %A"))
-        date_run.font.size = Pt(16)
-        date_run.font.bold = True
-        
-        # 날씨, 기분, 중요도
-        info_table = doc.add_table(rows=1, cols=3)
-        info_table.style = 'Light List'
-        
-        weather_cell = info_table.cell(0, 0)
-        weather_cell.text = "날씨: ☀️ ☁️ 🌧️ ❄️"
-        
-        mood_cell = info_table.cell(0, 1)
-        mood_cell.text = "기분: 😊 😐 😢 😡"
-        
-        importance_cell = info_table.cell(0, 2)
-        importance_cell.text = "중요도: ⭐⭐⭐⭐⭐"
-        
-        # 간격
-        doc.add_paragraph().paragraph_format.space_after = Pt(12)
-        
-        # 일정 표
-        schedule_title = doc.add_paragraph("📅 오늘의 일정")
-        schedule_title.runs[0].font.bold = True
-        
-        schedule_table = doc.add_table(rows=10, cols=2)
-        schedule_table.style = 'Light Grid'
-        
-        # 시간대별 일정
-        times = ["오전 7-9시", "오전 9-11시", "오전 11시-오후 1시", 
-                "오후 1-3시", "오후 3-5시", "오후 5-7시", "오후 7-9시", 
-                "오후 9-11시", "기타", "메모"]
-        
-        for i, time in enumerate(times):
-            time_cell = schedule_table.cell(i, 0)
-            time_cell.text = time
-            time_cell.width = Inches(1.5)
-            
-            content_cell = schedule_table.cell(i, 1)
-            content_cell.width = Inches(5)
-        
-        # 간격
-        doc.add_paragraph().paragraph_format.space_after = Pt(20)
-        
-        # 일기 작성 공간
-        diary_title = doc.add_paragraph("✍️ 오늘의 일기")
-        diary_title.runs[0].font.bold = True
-        diary_title.paragraph_format.space_after = Pt(12)
-        
-        # 줄 노트 추가
-        diary_table = doc.add_table(rows=15, cols=1)
-        diary_table.style = 'Normal Table'
-        
-        for row in diary_table.rows:
-            row.height = Pt(25)
-            cell = row.cells[0]
-            
-            # 하단 선 추가
-            tc = cell._element
-            tcPr = tc.get_or_add_tcPr()
-            tcBorders = OxmlElement('w:tcBorders')
-            
-            bottom = OxmlElement('w:bottom')
-            bottom.set(qn('w:val'), 'single')
-            bottom.set(qn('w:sz'), '2')
-            bottom.set(qn('w:color'), 'CCCCCC')
-            tcBorders.append(bottom)
-            
-            for border in ['top', 'left', 'right']:
-                side = OxmlElement(f'w:{border}')
-                side.set(qn('w:val'), 'nil')
-                tcBorders.append(side)
-            
-            tcPr.append(tcBorders)
-        
-        # 감사 일기
-        doc.add_paragraph()
-        gratitude_title = doc.add_paragraph("🙏 오늘 감사한 일 3가지")
-        gratitude_title.runs[0].font.bold = True
-        
-        for i in range(3):
-            gratitude = doc.add_paragraph(f"{i+1}. ", style='List Number')
-            gratitude.paragraph_format.space_after = Pt(12)
-        
-def create_calendar(doc, year, month, num_months=12, user_info=None):
-    """달력 양식 생성"""
-    # 첫 페이지에서 푸터 설정
-    add_footer(doc)
+    # 다운로드 버튼 (눌러도 화면을 다시 실행하지 않음)
+    _, download_label, mime = OUTPUT_FORMATS[config["output_format"]]
+    st.download_button(
+        label=download_label,
+        data=download_data(artifact),
+        file_name=notebook_filename(config),
+        mime=mime,
+        on_click="ignore",
+        use_container_width=True
+    )
     
-    # 첫 페이지에 사용자 정보 추가
-    if user_info:
-        add_user_info(doc, **user_info)
-        doc.add_page_break()
+    st.success("✅ 노트가 성공적으로 생성되었습니다!")
     
-    for i in range(num_months):
-        if i > 0:
-            doc.add_page_break()
-        
-        current_month = month + i
-        current_year = year
-        if current_month > 12:
-            current_year += (current_month - 1) // 12
-            current_month = ((current_month - 1) % 12) + 1
-        
-        # 월 제목
-        month_names = ['', '1월', '2월', '3월', '4월', '5월', '6월', 
-                      '7월', '8월', '9월', '10월', '11월', '12월']
-        title = doc.add_paragraph()
-        title_run = title.add_run(f"{current_year}년 {month_names[current_month]}")
-        title_run.font.size = Pt(20)
-        title_run.font.bold = True
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        title.paragraph_format.space_after = Pt(12)
-        
-        # 요일 헤더
-        weekdays = ['월', '화', '수', '목', '금', '토', '일']
-        
-        # 달력 테이블 생성 (요일 + 최대 6주)
-        table = doc.add_table(rows=7, cols=7)
-        table.style = 'Table Grid'
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        
-        # 요일 헤더 설정
-        header_row = table.rows[0]
-        for j, day in enumerate(weekdays):
-            cell = header_row.cells[j]
-            cell.text = day
-            cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-            cell.paragraphs[0].runs[0].font.bold = True
-            
-            # 토요일은 파란색, 일요일은 빨간색
-            if j == 5:  # 토요일
-                cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(0, 0, 255)
-            elif j == 6:  # 일요일
-                cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 0, 0)
-        
-        # 달력 날짜 채우기
-        cal = calendar.monthcalendar(current_year, current_month)
-        
-        for week_num, week in enumerate(cal):
-            row = table.rows[week_num + 1]
-            for day_num, day in enumerate(week):
-                cell = row.cells[day_num]
-                
-                if day != 0:
-                    # 날짜 추가
-                    p = cell.paragraphs[0]
-                    p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                    date_run = p.add_run(str(day))
-                    date_run.font.size = Pt(10)
-                    date_run.font.bold = True
-                    
-                    # 주말 색상
-                    if day_num == 5:  # 토요일
-                        date_run.font.color.rgb = RGBColor(0, 0, 255)
-                    elif day_num == 6:  # 일요일
-                        date_run.font.color.rgb = RGBColor(255, 0, 0)
-                    
-                    # 메모 공간을 위한 줄바꿈
-                    p.add_run('\n\n\n')
-                
-                # 셀 크기 설정
-                cell.width = Inches(1)
-                tc = cell._element
-                tcPr = tc.get_or_add_tcPr()
-                tcH = OxmlElement('w:tcH')
-                tcH.set(qn('w:val'), '1500')
-                tcH.set(qn('w:hRule'), 'atLeast')
-                tcPr.append(tcH)
-        
-        # 하단 메모 영역
-        doc.add_paragraph()
-        memo_title = doc.add_paragraph("📝 이달의 메모")
-        memo_title.runs[0].font.bold = True
-        memo_title.paragraph_format.space_after = Pt(6)
-        
-        memo_table = doc.add_table(rows=3, cols=1)
-        memo_table.style = 'Light List'
-        for row in memo_table.rows:
-            row.height = Pt(40)
+    cache_stats = get_document_cache().stats()
+    try:
+        store_stats = get_artifact_store().stats()
+    except OSError:
+        store_stats = {"hits": 0, "entries": 0, "bytes": 0}
+    session_stats = get_session_artifacts().stats()
+    scheduler_stats = get_scheduler().stats()
+    st.caption(
+        f"캐시 적중 {cache_stats['hits']}회 / 미스 {cache_stats['misses']}회 · "
+        f"{cache_stats['entries']}개 문서, {cache_stats['bytes'] / 1024 / 1024:.1f}MB 사용 · "
+        f"디스크 저장소 적중 {store_stats['hits']}회, "
+        f"{store_stats['entries']}개 문서, {store_stats['bytes'] / 1024 / 1024:.1f}MB 사용 · "
+        f"세션 보관 {session_stats['sessions']}개, {session_stats['bytes'] / 1024 / 1024:.1f}MB 사용 · "
+        f"같은 설정 동시 요청 합류 {scheduler_stats['coalesced']}회"
+    )
+    
+    # 생성 진단 정보 (단계별 시간과 문서 복잡도)
+    with st.expander("🔍 생성 진단 정보"):
+        if not report:
+            st.markdown("캐시에 저장된 문서를 사용하여 새로 생성하지 않았습니다.")
+        else:
+            phase_names = {
+                "document": "Document 생성",
+                "build": "본문 생성",
+                "stats": "복잡도 계산",
+                "save": "저장",
+                "getvalue": "바이트 복사",
+            }
+            stat_names = {
+                "tables": "표",
+                "cells": "셀",
+                "paragraphs": "문단",
+                "elements": "XML 요소",
+                "pages": "페이지",
+                "content_streams": "페이지 내용",
+                "shapes": "도형",
+            }
+            st.table([
+                {"단계": phase_names[phase], "시간(초)": f"{report['seconds'][phase]:.3f}"}
+                for phase in GENERATION_PHASES if phase in report["seconds"]
+            ])
+            summary = f"- 전체 {report['total_seconds']:.3f}초, 파일 크기 {report['bytes'] / 1024:.1f}KB"
+            if "stats" in report:
+                summary += "\n- " + ", ".join(
+                    f"{stat_names[name]} {count:,}개" for name, count in report["stats"].items()
+                )
+            st.markdown(summary)
+            if "stats" not in report:
+                st.caption("문서 복잡도는 환경 변수 NOTEGEN_DOCUMENT_STATS=1로 켜면 함께 보여 줍니다.")
+            elif config["streaming"]:
+                st.caption("스트리밍 모드에서는 직접 만든 두 페이지까지만 복잡도에 포함됩니다.")
 
-def create_math_error_notebook(doc, problems_per_page=3, num_pages=5, user_info=None):
-    """수학 오답 노트 생성"""
-    # 첫 페이지에서 푸터 설정
-    add_footer(doc)
+def start_roster(config, students):
+    """학급 명단 일괄 생성 작업을 스케줄러에 맡김 (비용은 학생 수만큼 곱함, 거절되면 오류로)"""
+    from notegen import generate_roster_zip
     
-    for page in range(num_pages):
-        if page > 0:
-            doc.add_page_break()
-        
-        # 사용자 정보 추가
-        if user_info and page == 0:
-            add_user_info(doc, **user_info)
-        
-        # 페이지 헤더
-        header = doc.add_paragraph()
-        header_run = header.add_run(f"수학 오답 노트 - {page + 1}페이지")
-        header_run.font.size = Pt(14)
-        header_run.font.bold = True
-        header.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        header.paragraph_format.space_after = Pt(20)
-        
-        # 페이지 높이 계산 (A4 기준, 여백 제외)
-        available_height = 11.69 - 1.0  # 인치
-        header_space = 1.5  # 헤더와 여백
-        remaining_height = available_height - header_space
-        
-        # 문제당 할당 높이 계산
-        section_height = remaining_height / problems_per_page
-        
-        # 각 섹션의 구성 요소별 높이 비율
-        info_height = section_height * 0.08
-        prob_height = section_height * 0.25
-        solution_height = section_height * 0.45
-        analysis_height = section_height * 0.17
-        separator_height = section_height * 0.05
-        
-        # 각 문제별 섹션
-        for prob_num in range(problems_per_page):
-            # 문제 정보 테이블
-            info_table = doc.add_table(rows=1, cols=4)
-            info_table.style = 'Table Grid'
-            
-            # 문제 번호
-            prob_cell = info_table.cell(0, 0)
-            prob_cell.width = Inches(1.5)
-            prob_p = prob_cell.paragraphs[0]
-            prob_p.add_run("문제 번호:").bold = True
-            
-            # 날짜
-            date_cell = info_table.cell(0, 1)
-            date_cell.width = Inches(1.5)
-            date_p = date_cell.paragraphs[0]
-            date_p.add_run("날짜:").bold = True
-            
-            # 출처
-            source_cell = info_table.cell(0, 2)
-            source_cell.width = Inches(2)
-            source_p = source_cell.paragraphs[0]
-            source_p.add_run("출처:").bold = True
-            
-            # 난이도
-            level_cell = info_table.cell(0, 3)
-            level_cell.width = Inches(1.5)
-            level_p = level_cell.paragraphs[0]
-            level_p.add_run("난이도: ⭐⭐⭐⭐⭐").bold = True
-            
-            # 간격
-            spacing1 = doc.add_paragraph()
-            spacing1.paragraph_format.space_after = Pt(6)
-            
-            # 문제 영역
-            prob_title = doc.add_paragraph("📝 문제")
-            prob_title.runs[0].font.bold = True
-            prob_title.runs[0].font.size = Pt(11)
-            prob_title.paragraph_format.space_after = Pt(4)
-            
-            prob_table = doc.add_table(rows=1, cols=1)
-            prob_table.style = 'Table Grid'
-            prob_content_cell = prob_table.cell(0, 0)
-            
-            # 문제 영역 높이 설정 (문제 수에 따라 조정)
-            tc = prob_content_cell._element
-            tcPr = tc.get_or_add_tcPr()
-            tcH = OxmlElement('w:tcH')
-            tcH.set(qn('w:val'), str(int(prob_height * 1440)))  # twips 변환
-            tcH.set(qn('w:hRule'), 'exact')
-            tcPr.append(tcH)
-            
-            # 문제 영역 배경색
-            shading = OxmlElement('w:shd')
-            shading.set(qn('w:val'), 'clear')
-            shading.set(qn('w:color'), 'auto')
-            shading.set(qn('w:fill'), 'F0F8FF')
-            tcPr.append(shading)
-            
-            # 간격
-            spacing2 = doc.add_paragraph()
-            spacing2.paragraph_format.space_after = Pt(6)
-            
-            # 풀이 과정 영역
-            solution_title = doc.add_paragraph("✏️ 풀이 과정")
-            solution_title.runs[0].font.bold = True
-            solution_title.runs[0].font.size = Pt(11)
-            solution_title.paragraph_format.space_after = Pt(4)
-            
-            # 격자 노트 스타일 테이블 (문제 수에 따라 행 수 조정)
-            grid_rows = max(6, int(20 / problems_per_page))
-            solution_table = doc.add_table(rows=grid_rows, cols=15)
-            solution_table.style = 'Table Grid'
-            solution_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-            
-            # 각 행의 높이를 문제 수에 따라 조정
-            row_height = int(solution_height * 1440 / grid_rows)
-            
-            for row in solution_table.rows:
-                # 행 높이 설정
-                tr = row._element
-                trPr = tr.get_or_add_trPr()
-                trHeight = OxmlElement('w:trHeight')
-                trHeight.set(qn('w:val'), str(row_height))
-                trHeight.set(qn('w:hRule'), 'exact')
-                trPr.append(trHeight)
-                
-                for cell in row.cells:
-                    cell.width = Pt(30)
-                    
-                    # 연한 격자선
-                    tc = cell._element
-                    tcPr = tc.get_or_add_tcPr()
-                    tcBorders = OxmlElement('w:tcBorders')
-                    
-                    for border in ['top', 'left', 'bottom', 'right']:
-                        side = OxmlElement(f'w:{border}')
-                        side.set(qn('w:val'), 'single')
-                        side.set(qn('w:sz'), '2')
-                        side.set(qn('w:color'), 'E0E0E0')
-                        tcBorders.append(side)
-                    
-                    tcPr.append(tcBorders)
-            
-            # 간격
-            spacing3 = doc.add_paragraph()
-            spacing3.paragraph_format.space_after = Pt(6)
-            
-            # 오답 원인 및 핵심 포인트
-            analysis_table = doc.add_table(rows=1, cols=2)
-            analysis_table.style = 'Table Grid'
-            
-            # 오답 원인
-            cause_cell = analysis_table.cell(0, 0)
-            cause_cell.width = Inches(3.25)
-            cause_p = cause_cell.paragraphs[0]
-            cause_p.add_run("❌ 오답 원인").bold = True
-            cause_p.add_run("\n\n□ 개념 이해 부족\n□ 계산 실수\n□ 문제 해석 오류\n□ 시간 부족\n□ 기타:")
-            
-            # 핵심 포인트
-            point_cell = analysis_table.cell(0, 1)
-            point_cell.width = Inches(3.25)
-            point_p = point_cell.paragraphs[0]
-            point_p.add_run("💡 핵심 포인트").bold = True
-            point_p.add_run("\n\n")
-            
-            # 셀 높이 설정
-            for cell in [cause_cell, point_cell]:
-                tc = cell._element
-                tcPr = tc.get_or_add_tcPr()
-                tcH = OxmlElement('w:tcH')
-                tcH.set(qn('w:val'), str(int(analysis_height * 1440)))
-                tcH.set(qn('w:hRule'), 'exact')
-                tcPr.append(tcH)
-            
-            # 문제 구분선 (마지막 문제 제외)
-            if prob_num < problems_per_page - 1:
-                separator = doc.add_paragraph("─" * 50)
-                separator.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                separator.paragraph_format.space_before = Pt(8)
-                separator.paragraph_format.space_after = Pt(8)
+    def run(report):
+        # ZIP은 메모리 대신 임시 파일에 기록 (취소나 오류면 닫아서 지움)
+        roster_zip = tempfile.TemporaryFile()
+        try:
+            generate_roster_zip(config, students, roster_zip)
+        except BaseException:
+            roster_zip.close()
+            raise
+        return roster_zip
+    
+    roster = {"config": config, "count": len(students)}
+    try:
+        roster["job"] = get_scheduler().submit(run, estimate_cost(config) * len(students), max_idle=JOB_MAX_IDLE)
+    except JobRejected as e:
+        roster["error"] = str(e)
+    return roster
+
+def discard_roster():
+    """이 세션의 이전 일괄 생성 작업은 취소하고 결과 파일은 닫음"""
+    roster = st.session_state.pop("roster", None)
+    if roster is None:
+        return
+    if "job" in roster:
+        roster["job"].cancel()
+    elif roster.get("result") is not None:
+        roster["result"].close()
+
+@st.fragment(run_every=PROGRESS_INTERVAL)
+def show_roster_progress(roster):
+    """진행 중인 일괄 생성의 진행률과 취소 버튼 (끝나면 전체 화면을 다시 그림)"""
+    job = roster["job"]
+    job.touch()
+    if job.finished:
+        roster.pop("job")
+        if job.status == "done":
+            roster["result"] = job.result
+        elif job.status == "cancelled":
+            roster["cancelled"] = True
+        else:
+            roster["error"] = str(job.error)
+        st.rerun()
+    
+    st.progress(job.fraction, text=job_progress_text(job, "학생별 노트를 생성하고 있습니다...", "명"))
+    if st.button("⏹️ 일괄 생성 취소", use_container_width=True):
+        job.cancel()
+        roster.pop("job")
+        roster["cancelled"] = True
+        st.rerun()
+
+def show_roster_result(roster):
+    """일괄 생성 결과: ZIP 다운로드 버튼 (취소/오류면 안내)"""
+    if roster.get("cancelled"):
+        st.warning("일괄 생성을 취소했습니다.")
+        return
+    if "error" in roster:
+        st.error(f"❌ 오류가 발생했습니다: {roster['error']}")
+        return
+    
+    count = roster["count"]
+    st.download_button(
+        label=f"📥 {count}명 노트 ZIP 다운로드",
+        data=download_data(roster["result"]),
+        file_name=f"{roster['config']['notebook_type']}_학급명단_{count}명.zip",
+        mime="application/zip",
+        on_click="ignore",
+        use_container_width=True
+    )
+    st.success(f"✅ {count}명의 노트가 생성되었습니다!")
 
 # Streamlit 앱 설정
 st.set_page_config(page_title="노트 양식 생성기", page_icon="📝", layout="wide")
@@ -1077,11 +420,7 @@ with col1:
     st.subheader("⚙️ 설정")
     
     # 노트 종류 선택
-    notebook_type = st.selectbox(
-        "노트 종류 선택",
-        ["줄공책", "칸공책", "영어노트 (4선)", "코넬노트", "음악 오선지", 
-         "한자노트", "다이어리", "달력", "수학 오답노트"]
-    )
+    notebook_type = st.selectbox("노트 종류 선택", NOTEBOOK_TYPES)
     
     # 사용자 정보 입력
     st.subheader("👤 사용자 정보")
@@ -1096,121 +435,172 @@ with col1:
             grade = st.text_input("학년", placeholder="예: 3학년")
             class_num = st.text_input("반", placeholder="예: 2반")
     
+    # 대용량 스트리밍 모드 (기하학 노트만)
+    streaming = False
+    if notebook_type in STREAMABLE_TYPES:
+        streaming = st.checkbox(
+            "대용량 스트리밍 모드",
+            help=f"페이지를 XML로 직접 기록하여 최대 {STREAM_MAX_PAGES}페이지까지 만들 수 있습니다."
+        )
+    
+    # 노트별 설정값
+    options = {}
+    
+    # 압축 스타일 모드
+    if notebook_type in COMPACT_TYPES:
+        options["compact"] = st.checkbox(
+            "압축 스타일 모드",
+            help="셀마다 넣던 선과 여백 서식을 표 스타일 하나로 처리하여 파일이 작아지고 Word에서 빨리 열립니다."
+        )
+    
+    # 경량 그리기 모드
+    if notebook_type in LEAN_TYPES:
+        options["lean"] = st.checkbox(
+            "경량 그리기 모드",
+            help="선과 격자를 표 대신 도형으로 그려 문서가 훨씬 가볍고 빨리 만들어집니다."
+        )
+    
+    # 설정값 허용 범위 (명령줄과 같음)
+    ranges = option_ranges(notebook_type, streaming)
+    
     # 페이지 수
-    if notebook_type not in ["다이어리", "달력"]:
-        num_pages = st.number_input("페이지 수", min_value=1, max_value=50, value=5)
+    if "num_pages" in ranges:
+        min_pages, max_pages = ranges["num_pages"]
+        options["num_pages"] = st.number_input("페이지 수", min_value=min_pages, max_value=max_pages, value=5)
     
     # 용지 방향
     orientation = st.radio("용지 방향", ["세로", "가로"])
     
+    # 파일 형식 (PDF는 A4 용지에 선을 바로 그림)
+    output_format = "docx"
+    if notebook_type in PDF_TYPES:
+        output_format = st.radio(
+            "파일 형식", list(OUTPUT_FORMATS), format_func=lambda name: OUTPUT_FORMATS[name][0], horizontal=True
+        )
+    
     # 노트별 추가 설정
     if notebook_type == "줄공책":
-        lines_per_page = st.slider("페이지당 줄 수", 10, 35, 25)
+        options["lines_per_page"] = st.slider("페이지당 줄 수", *ranges["lines_per_page"], 25)
     elif notebook_type == "칸공책":
-        rows = st.slider("행 수", 5, 25, 15)
-        cols = st.slider("열 수", 5, 25, 15)
+        options["rows"] = st.slider("행 수", *ranges["rows"], 15)
+        options["cols"] = st.slider("열 수", *ranges["cols"], 15)
         st.info("💡 팁: 많은 칸을 만들면 생성 시간이 길어질 수 있습니다.")
     elif notebook_type == "영어노트 (4선)":
-        lines_per_page = st.slider("페이지당 줄 수", 5, 15, 10)
+        options["lines_per_page"] = st.slider("페이지당 줄 수", *ranges["lines_per_page"], 10)
     elif notebook_type == "음악 오선지":
-        staves_per_page = st.slider("페이지당 오선 수", 8, 14, 12)
+        options["staves_per_page"] = st.slider("페이지당 오선 수", *ranges["staves_per_page"], 12)
     elif notebook_type == "한자노트":
-        rows_per_page = st.slider("페이지당 행 수", 5, 10, 8)
-        chars_per_row = st.slider("행당 칸 수", 8, 12, 10)
+        options["rows_per_page"] = st.slider("페이지당 행 수", *ranges["rows_per_page"], 8)
+        options["chars_per_row"] = st.slider("행당 칸 수", *ranges["chars_per_row"], 10)
     elif notebook_type == "다이어리":
-        start_date = st.date_input("시작 날짜", datetime.now())
-        num_days = st.number_input("일수", min_value=1, max_value=365, value=7)
+        options["start_date"] = st.date_input("시작 날짜", datetime.now())
+        options["num_days"] = st.number_input(
+            "일수", min_value=ranges["num_days"][0], max_value=ranges["num_days"][1], value=7
+        )
     elif notebook_type == "달력":
         col_cal1, col_cal2 = st.columns(2)
         with col_cal1:
-            year = st.number_input("연도", min_value=2020, max_value=2030, value=datetime.now().year)
+            options["year"] = st.number_input(
+                "연도", min_value=ranges["year"][0], max_value=ranges["year"][1], value=datetime.now().year
+            )
         with col_cal2:
-            month = st.number_input("시작 월", min_value=1, max_value=12, value=datetime.now().month)
-        num_months = st.number_input("개월 수", min_value=1, max_value=12, value=12)
+            options["month"] = st.number_input(
+                "시작 월", min_value=ranges["month"][0], max_value=ranges["month"][1], value=datetime.now().month
+            )
+        options["num_months"] = st.number_input(
+            "개월 수", min_value=ranges["num_months"][0], max_value=ranges["num_months"][1], value=12
+        )
     elif notebook_type == "수학 오답노트":
-        problems_per_page = st.slider("페이지당 문제 수", 1, 4, 3)
+        options["problems_per_page"] = st.slider("페이지당 문제 수", *ranges["problems_per_page"], 3)
+    
+    # 사용자 정보 준비
+    user_info = None
+    if include_info:
+        user_info = {
+            "school_name": school_name,
+            "grade": grade,
+            "class_num": class_num,
+            "student_name": student_name
+        }
     
     # 생성 버튼
     if st.button("📄 노트 생성", use_container_width=True, type="primary"):
-        with st.spinner("노트를 생성하고 있습니다..."):
+        # 생성 설정 (캐시 키에 모든 입력이 들어감)
+        config = {
+            "notebook_type": notebook_type,
+            "orientation": orientation,
+            "user_info": user_info,
+            "options": options,
+            "streaming": streaming and output_format == "docx",
+            "output_format": output_format,
+        }
+        if LETTERHEAD:
+            config["letterhead"] = LETTERHEAD
+        previous = st.session_state.get("generation")
+        if previous and "job" in previous:
+            previous["job"].cancel()
+        get_session_artifacts().discard(session_id())
+        st.session_state["generation"] = start_generation(config)
+    
+    generation = st.session_state.get("generation")
+    if generation is not None:
+        if "job" in generation:
+            show_job_progress(generation)
+        else:
+            show_generation_result(generation)
+    
+    # 학급 명단 일괄 생성
+    with st.expander("👥 학급 명단으로 일괄 생성"):
+        st.markdown(
+            "`school_name, grade, class_num, student_name` 열이 있는 CSV를 올리면 "
+            "학생마다 사용자 정보가 들어간 노트를 ZIP으로 묶어 드립니다."
+        )
+        roster_file = st.file_uploader("학급 명단 CSV", type=["csv"])
+        
+        if roster_file is not None and st.button("📦 명단으로 일괄 생성", use_container_width=True):
+            discard_roster()
             try:
-                # Document 생성
-                doc = Document()
-                
-                # 용지 방향 설정
-                section = doc.sections[0]
-                if orientation == "가로":
-                    section.orientation = WD_ORIENT.LANDSCAPE
-                    section.page_width, section.page_height = section.page_height, section.page_width
-                
-                # 여백 설정
-                section.top_margin = Inches(0.5)
-                section.bottom_margin = Inches(0.5)
-                section.left_margin = Inches(0.5)
-                section.right_margin = Inches(0.5)
-                
-                # 사용자 정보 준비
-                user_info = None
-                if include_info:
-                    user_info = {
-                        "school_name": school_name,
-                        "grade": grade,
-                        "class_num": class_num,
-                        "student_name": student_name
-                    }
-                
-                # 선택된 노트 종류에 따라 생성
-                if notebook_type == "줄공책":
-                    create_lined_notebook(doc, lines_per_page, num_pages, user_info)
-                elif notebook_type == "칸공책":
-                    create_grid_notebook(doc, rows, cols, num_pages, user_info)
-                elif notebook_type == "영어노트 (4선)":
-                    create_english_notebook(doc, lines_per_page, num_pages, user_info)
-                elif notebook_type == "코넬노트":
-                    create_cornell_notebook(doc, num_pages, user_info)
-                elif notebook_type == "음악 오선지":
-                    create_music_staff(doc, staves_per_page, num_pages, user_info)
-                elif notebook_type == "한자노트":
-                    create_chinese_notebook(doc, rows_per_page, chars_per_row, num_pages, user_info)
-                elif notebook_type == "다이어리":
-                    create_diary(doc, start_date, num_days, user_info)
-                elif notebook_type == "달력":
-                    create_calendar(doc, year, month, num_months, user_info)
-                elif notebook_type == "수학 오답노트":
-                    create_math_error_notebook(doc, problems_per_page, num_pages, user_info)
-                
-                # 모든 페이지에 푸터 추가
-                add_footer(doc)
-                
-                # 메모리에 저장
-                doc_io = io.BytesIO()
-                doc.save(doc_io)
-                doc_io.seek(0)
-                
-                # 파일명 생성
-                if notebook_type == "다이어리":
-                    filename = f"{notebook_type}_{start_date.strftime('%Y%m%d')}_{num_days}일.docx"
-                elif notebook_type == "달력":
-                    filename = f"{notebook_type}_{year}년_{month}월_{num_months}개월.docx"
-                else:
-                    filename = f"{notebook_type}_{num_pages}페이지.docx"
-                
-                # 다운로드 버튼
-                st.download_button(
-                    label="📥 Word 파일 다운로드",
-                    data=doc_io.getvalue(),
-                    file_name=filename,
-                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    use_container_width=True
-                )
-                
-                st.success("✅ 노트가 성공적으로 생성되었습니다!")
-                
-            except Exception as e:
-                st.error(f"❌ 오류가 발생했습니다: {str(e)}")
-                st.info("다른 설정으로 다시 시도해보세요.")
+                from notegen import read_roster
+                students = read_roster(roster_file.getvalue())
+                if not students:
+                    raise ValueError("명단에 학생이 없습니다.")
+            except ValueError as e:
+                st.session_state["roster"] = {"error": str(e)}
+            else:
+                config = {
+                    "notebook_type": notebook_type,
+                    "orientation": orientation,
+                    "user_info": None,
+                    "options": options,
+                    "streaming": streaming and output_format == "docx",
+                    "output_format": output_format,
+                }
+                if LETTERHEAD:
+                    config["letterhead"] = LETTERHEAD
+                # 가장 무거운 작업이므로 한 번의 노트 생성처럼 스케줄러의 동시 실행 수와 비용 한도를 따름
+                st.session_state["roster"] = start_roster(config, students)
+        
+        roster = st.session_state.get("roster")
+        if roster is not None:
+            if "job" in roster:
+                show_roster_progress(roster)
+            else:
+                show_roster_result(roster)
 
 with col2:
+    # 첫 페이지 미리보기 (문서를 만들지 않고 배치 모델로 바로 그림)
+    st.subheader("👀 첫 페이지 미리보기")
+    if notebook_type in PREVIEW_TYPES:
+        preview_config = {
+            "notebook_type": notebook_type,
+            "orientation": orientation,
+            "user_info": user_info,
+            "options": options,
+        }
+        st.image(get_preview(preview_config), caption="설정을 바꾸면 바로 다시 그려집니다.")
+    else:
+        st.caption(f"{notebook_type}는 미리보기를 지원하지 않습니다. 노트를 생성하여 확인하세요.")
+    
     st.subheader("📖 사용 방법")
     st.markdown("""
     1. **노트 종류 선택**: 원하는 노트 양식을 선택하세요.
@@ -1309,7 +699,7 @@ with col2:
     st.markdown("""
     - **인쇄 시**: 프린터 설정에서 '실제 크기'로 인쇄하세요.
     - **양면 인쇄**: 용지 절약을 위해 양면 인쇄를 권장합니다.
-    - **PDF 변환**: Word 파일을 PDF로 변환하면 레이아웃이 더 안정적입니다.
+    - **PDF 변환**: Word 파일을 PDF로 변환하면 레이아웃이 더 안정적입니다. 줄/칸/4선/오선/한자 노트와 달력은 '파일 형식'에서 PDF를 바로 받을 수 있습니다.
     - **문제 해결**: 생성이 안 되면 페이지 수나 칸 수를 줄여보세요.
     - **수학 오답노트 활용법**: 
       - 문제를 풀 때 사용한 개념과 공식을 함께 정리하세요
@@ -0,0 +1,196 @@
+"""노트 종류별 생성 시간/메모리 벤치마크
+
+화면에서 고를 수 있는 설정 범위의 양 끝(최소/최대)에서 각 노트를 만들고
+Document 생성(기본 문서 복제), 본문 생성(create_*), 저장(save_document) 단계를 따로 잰다.
+
+    python -m benchmarks.bench_notebooks -o bench.json
+    python -m benchmarks.bench_notebooks --only grid-max hanja-max --compare bench.json
+"""
+import argparse
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime
+from importlib.metadata import version
+
+from notegen import COMPACT_TYPES, LEAN_TYPES, build_notebook, new_document, save_document
+
+USER_INFO = {"school_name": "경북초등학교", "grade": "3학년", "class_num": "2반", "student_name": "홍길동"}
+
+# (이름, 노트 종류, 설정) - 화면의 슬라이더/입력 범위 양 끝
+CASES = [
+    ("lined-min", "줄공책", {"lines_per_page": 10, "num_pages": 1}),
+    ("lined-max", "줄공책", {"lines_per_page": 35, "num_pages": 50}),
+    ("grid-min", "칸공책", {"rows": 5, "cols": 5, "num_pages": 1}),
+    ("grid-max", "칸공책", {"rows": 25, "cols": 25, "num_pages": 50}),
+    ("english-min", "영어노트 (4선)", {"lines_per_page": 5, "num_pages": 1}),
+    ("english-max", "영어노트 (4선)", {"lines_per_page": 15, "num_pages": 50}),
+    ("cornell-min", "코넬노트", {"num_pages": 1}),
+    ("cornell-max", "코넬노트", {"num_pages": 50}),
+    ("music-min", "음악 오선지", {"staves_per_page": 8, "num_pages": 1}),
+    ("music-max", "음악 오선지", {"staves_per_page": 14, "num_pages": 50}),
+    ("hanja-min", "한자노트", {"rows_per_page": 5, "chars_per_row": 8, "num_pages": 1}),
+    ("hanja-max", "한자노트", {"rows_per_page": 10, "chars_per_row": 12, "num_pages": 50}),
+    ("diary-min", "다이어리", {"start_date": date(2026, 1, 1), "num_days": 1}),
+    ("diary-max", "다이어리", {"start_date": date(2026, 1, 1), "num_days": 365}),
+    ("calendar-min", "달력", {"year": 2026, "month": 1, "num_months": 1}),
+    ("calendar-max", "달력", {"year": 2026, "month": 1, "num_months": 12}),
+    ("math-min", "수학 오답노트", {"problems_per_page": 1, "num_pages": 1}),
+    ("math-max", "수학 오답노트", {"problems_per_page": 4, "num_pages": 50}),
+]
+
+PHASES = ["document", "build", "save"]
+
+# 측정 모드 -> 지원하는 노트 종류 (--compact, --lean)
+MODE_TYPES = {"compact": COMPACT_TYPES, "lean": LEAN_TYPES}
+
+def run_phases(notebook_type, options):
+    """단계별 경과 시간(초)과 저장된 파일 크기를 반환"""
+    timings = {}
+
+    start = time.perf_counter()
+    doc = new_document()
+    timings["document"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    build_notebook(doc, notebook_type, options, USER_INFO)
+    timings["build"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    doc_io = io.BytesIO()
+    save_document(doc, doc_io)
+    timings["save"] = time.perf_counter() - start
+
+    return timings, doc_io.tell()
+
+def measure_memory(notebook_type, options):
+    """tracemalloc으로 전체 생성 과정의 최대 Python 메모리 사용량(바이트)을 잰다
+
+    lxml이 C에서 할당하는 XML 트리는 포함되지 않으므로 measure_rss()와 함께 본다.
+    """
+    tracemalloc.start()
+    try:
+        run_phases(notebook_type, options)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def measure_rss(name, modes=()):
+    """새 프로세스에서 케이스 하나를 실행하여 최대 RSS 증가량(바이트)을 잰다"""
+    command = [sys.executable, "-m", "benchmarks.bench_notebooks", "--rss-child", name]
+    command += [f"--{mode}" for mode in modes]
+    completed = subprocess.run(command, capture_output=True, text=True, check=True)
+    return int(completed.stdout.strip())
+
+def case_options(notebook_type, options, modes):
+    """선택한 모드(compact, lean) 중 노트가 지원하는 모드를 설정에 더함"""
+    options = dict(options)
+    for mode in modes:
+        if notebook_type in MODE_TYPES[mode]:
+            options[mode] = True
+    return options
+
+def _peak_rss():
+    # 현재 프로세스의 최대 RSS(바이트)
+    # Linux의 ru_maxrss는 fork한 부모의 값을 이어받으므로 /proc의 VmHWM을 우선 사용
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def _rss_child(name, modes):
+    # 모듈 import 이후를 기준으로 최대 RSS 증가량을 출력
+    _, notebook_type, options = next(case for case in CASES if case[0] == name)
+    options = case_options(notebook_type, options, modes)
+    baseline = _peak_rss()
+    run_phases(notebook_type, options)
+    print(_peak_rss() - baseline)
+
+def bench_case(name, notebook_type, options, repeat, modes=()):
+    """시간은 repeat번 중 최솟값, 메모리는 별도 실행 한 번으로 측정"""
+    options = case_options(notebook_type, options, modes)
+    runs = [run_phases(notebook_type, options) for _ in range(repeat)]
+    timings = {phase: min(run[0][phase] for run in runs) for phase in PHASES}
+    return {
+        "name": name,
+        "notebook_type": notebook_type,
+        "options": options,
+        "seconds": timings,
+        "total_seconds": sum(timings.values()),
+        "bytes": runs[0][1],
+        "peak_memory_bytes": measure_memory(notebook_type, options),
+        "peak_rss_bytes": measure_rss(name, modes),
+    }
+
+def compare(results, baseline_path):
+    """이전 결과 파일과 단계별 시간 비율을 출력"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {case["name"]: case for case in json.load(f)["results"]}
+    print(f"\n{'case':<20}" + "".join(f"{phase:>10}" for phase in PHASES) + f"{'total':>10}{'rss':>10}")
+    for case in results:
+        old = baseline.get(case["name"])
+        if old is None:
+            continue
+        ratios = [case["seconds"][phase] / max(old["seconds"][phase], 1e-9) for phase in PHASES]
+        ratios.append(case["total_seconds"] / max(old["total_seconds"], 1e-9))
+        ratios.append(case["peak_rss_bytes"] / max(old["peak_rss_bytes"], 1))
+        print(f"{case['name']:<20}" + "".join(f"{ratio:>9.2f}x" for ratio in ratios))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-o", "--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--repeat", type=int, default=3, help="시간 측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--only", nargs="+", metavar="CASE", help="실행할 케이스 이름")
+    parser.add_argument("--compact", action="store_true", help="지원하는 노트는 압축 스타일 모드로 측정")
+    parser.add_argument("--lean", action="store_true", help="지원하는 노트는 경량 그리기 모드로 측정")
+    parser.add_argument("--compare", metavar="JSON", help="이전 결과와 비교")
+    parser.add_argument("--rss-child", metavar="CASE", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    modes = [mode for mode in MODE_TYPES if getattr(args, mode)]
+
+    if args.rss_child:
+        _rss_child(args.rss_child, modes)
+        return 0
+
+    results = []
+    for name, notebook_type, options in CASES:
+        if args.only and name not in args.only:
+            continue
+        result = bench_case(name, notebook_type, options, args.repeat, modes)
+        results.append(result)
+        seconds = result["seconds"]
+        print(
+            f"{name:<20} document {seconds['document']:7.3f}s  build {seconds['build']:7.3f}s  "
+            f"save {seconds['save']:7.3f}s  {result['bytes'] / 1024:9.1f}KB  "
+            f"py-peak {result['peak_memory_bytes'] / 1024 / 1024:6.1f}MB  "
+            f"rss +{result['peak_rss_bytes'] / 1024 / 1024:6.1f}MB",
+            flush=True,
+        )
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "python_docx": version("python-docx"),
+        "modes": modes,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""슬라이더를 움직일 때 Streamlit 재실행 지연 시간 벤치마크
+
+streamlit.testing의 AppTest로 app.py를 띄워 첫 슬라이더 값을 바꿔 가며 재실행 시간을 잰다.
+먼저 부하 없이 재고, 이어서 다른 사용자의 노트 생성을 흉내 내는 스레드를 --load개 돌리며 잰다.
+부하 중 p95가 --budget-ms를 넘거나 위젯만 바꾸는 재실행에서 python-docx를 불러오면 실패(종료 코드 1)로 끝난다.
+생성 스레드는 같은 프로세스에서 GIL을 나눠 쓰므로 부하 중 시간은 부하 스레드 수에 따라 늘어난다.
+
+    python -m benchmarks.bench_rerun
+    python -m benchmarks.bench_rerun --reruns 50 --load 4 --budget-ms 400 -o rerun.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+
+# 부하 스레드가 반복해서 만드는 노트 (화면에서 고를 수 있는 큰 칸공책)
+LOAD_CONFIG = {
+    "notebook_type": "칸공책",
+    "orientation": "세로",
+    "user_info": None,
+    "options": {"rows": 25, "cols": 25, "num_pages": 10, "compact": False, "lean": False},
+    "streaming": False,
+}
+
+def _generate_until(stop):
+    # 부하 스레드: stop이 설정될 때까지 노트를 계속 생성
+    from notegen import generate_notebook
+    while not stop.is_set():
+        generate_notebook(LOAD_CONFIG)
+
+def measure_reruns(app, reruns):
+    """첫 슬라이더 값을 바꿔 가며 재실행한 시간(초) 목록"""
+    slider = app.slider[0]
+    values = list(range(int(slider.min), int(slider.max) + 1, int(slider.step or 1)))
+    timings = []
+    for index in range(reruns):
+        app.slider[0].set_value(values[index % len(values)])
+        start = time.perf_counter()
+        app.run()
+        timings.append(time.perf_counter() - start)
+        if app.exception:
+            raise RuntimeError(app.exception[0].message)
+    return timings
+
+def summarize(timings):
+    """중앙값, p95, 최댓값 (밀리초)"""
+    ordered = sorted(timings)
+    return {
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-o", "--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--reruns", type=int, default=30, help="단계마다 재실행 횟수")
+    parser.add_argument("--load", type=int, default=2, help="동시에 노트를 생성하는 부하 스레드 수")
+    parser.add_argument("--budget-ms", type=float, default=250, help="부하 중 재실행 p95 상한 (밀리초)")
+    args = parser.parse_args(argv)
+
+    app = AppTest.from_file(str(APP_PATH), default_timeout=30).run()
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+
+    idle = summarize(measure_reruns(app, args.reruns))
+    docx_loaded = "docx" in sys.modules
+    print(f"{'idle':<8} median {idle['median_ms']:7.1f}ms  p95 {idle['p95_ms']:7.1f}ms  max {idle['max_ms']:7.1f}ms  "
+          f"python-docx {'loaded' if docx_loaded else 'not loaded'}", flush=True)
+
+    stop = threading.Event()
+    workers = [threading.Thread(target=_generate_until, args=(stop,), daemon=True) for _ in range(args.load)]
+    for worker in workers:
+        worker.start()
+    try:
+        loaded = summarize(measure_reruns(app, args.reruns))
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
+    print(f"{f'load {args.load}':<8} median {loaded['median_ms']:7.1f}ms  p95 {loaded['p95_ms']:7.1f}ms  "
+          f"max {loaded['max_ms']:7.1f}ms  budget {args.budget_ms:.0f}ms", flush=True)
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "reruns": args.reruns,
+        "load": args.load,
+        "budget_ms": args.budget_ms,
+        "idle": idle,
+        "loaded": loaded,
+        "docx_loaded_by_reruns": docx_loaded,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    failures = []
+    if docx_loaded:
+        failures.append("위젯만 바꾸는 재실행에서 python-docx를 불러왔습니다.")
+    if loaded["p95_ms"] > args.budget_ms:
+        failures.append(f"부하 중 재실행 p95 {loaded['p95_ms']:.1f}ms가 예산 {args.budget_ms:.0f}ms를 넘었습니다.")
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""노트 양식 생성기: Streamlit 없이 쓸 수 있는 Word 노트 생성 라이브러리
+
+python-docx를 쓰는 생성 기능(문서, 생성 함수, 명단, 스트리밍)은 처음 꺼낼 때 불러온다.
+그래서 노트 종류 목록, 미리보기, 캐시, 스케줄러만 쓰는 화면 코드는 python-docx를 불러오지 않는다.
+"""
+from importlib import import_module
+
+from .cache import DocumentCache, config_key
+from .catalog import (
+    COMPACT_TYPES,
+    LEAN_TYPES,
+    MAX_PAGES,
+    NOTEBOOK_TYPES,
+    OPTION_RANGES,
+    PDF_TYPES,
+    SPILL_BYTES,
+    STREAM_MAX_PAGES,
+    STREAMABLE_TYPES,
+    notebook_filename,
+    option_ranges,
+    validate_options,
+)
+from .diagnostics import PHASES as GENERATION_PHASES, document_stats
+from .jobs import GenerationJob
+from .pdf import generate_pdf
+from .preview import PREVIEW_TYPES, preview_svg
+from .progress import GenerationCancelled, progress_scope, progress_stage, report_progress
+from .scheduler import GenerationScheduler, JobRejected, estimate_cost
+from .sessions import ArtifactReader, SessionArtifacts
+from .store import ArtifactStore
+
+# python-docx가 필요한 이름 -> 정의된 모듈 (처음 접근할 때 불러옴)
+_DOCX_EXPORTS = {
+    "add_cloned_pages": "document",
+    "add_footer": "document",
+    "add_user_info": "document",
+    "new_document": "document",
+    "save_document": "document",
+    "register_table_styles": "fragments",
+    "build_notebook": "generators",
+    "create_calendar": "generators",
+    "create_chinese_notebook": "generators",
+    "create_cornell_notebook": "generators",
+    "create_diary": "generators",
+    "create_english_notebook": "generators",
+    "create_grid_notebook": "generators",
+    "create_lined_notebook": "generators",
+    "create_math_error_notebook": "generators",
+    "create_music_staff": "generators",
+    "generate_notebook": "notebook",
+    "spool_notebook": "notebook",
+    "write_notebook": "notebook",
+    "OWN_PAGE_INFO_TYPES": "roster",
+    "ROSTER_COLUMNS": "roster",
+    "generate_roster_zip": "roster",
+    "read_roster": "roster",
+    "save_streamed": "streaming",
+}
+
+def __getattr__(name):
+    module = _DOCX_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+__all__ = [
+    "COMPACT_TYPES",
+    "GENERATION_PHASES",
+    "LEAN_TYPES",
+    "MAX_PAGES",
+    "NOTEBOOK_TYPES",
+    "OPTION_RANGES",
+    "OWN_PAGE_INFO_TYPES",
+    "PDF_TYPES",
+    "PREVIEW_TYPES",
+    "ROSTER_COLUMNS",
+    "SPILL_BYTES",
+    "STREAMABLE_TYPES",
+    "STREAM_MAX_PAGES",
+    "ArtifactReader",
+    "ArtifactStore",
+    "DocumentCache",
+    "GenerationCancelled",
+    "GenerationJob",
+    "GenerationScheduler",
+    "JobRejected",
+    "SessionArtifacts",
+    "add_cloned_pages",
+    "add_footer",
+    "add_user_info",
+    "build_notebook",
+    "config_key",
+    "create_calendar",
+    "create_chinese_notebook",
+    "create_cornell_notebook",
+    "create_diary",
+    "create_english_notebook",
+    "create_grid_notebook",
+    "create_lined_notebook",
+    "create_math_error_notebook",
+    "create_music_staff",
+    "document_stats",
+    "estimate_cost",
+    "generate_notebook",
+    "generate_pdf",
+    "generate_roster_zip",
+    "new_document",
+    "notebook_filename",
+    "option_ranges",
+    "preview_svg",
+    "progress_scope",
+    "progress_stage",
+    "read_roster",
+    "register_table_styles",
+    "report_progress",
+    "save_document",
+    "save_streamed",
+    "spool_notebook",
+    "validate_options",
+    "write_notebook",
+]
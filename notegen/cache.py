@@ -0,0 +1,74 @@
+"""설정 해시를 키로 하는 생성 문서 캐시"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+def _format_version():
+    # notegen 소스와 python-docx 버전의 해시: 출력이 달라질 수 있는 코드가 바뀌면 함께 바뀐다
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    try:
+        digest.update(version("python-docx").encode("utf-8"))
+    except PackageNotFoundError:
+        pass
+    return digest.hexdigest()[:16]
+
+# 생성 결과 형식 버전 (재시작 뒤에도 남는 디스크 저장소가 이전 코드의 결과를 내주지 않도록 키에 넣음)
+FORMAT_VERSION = _format_version()
+
+def config_key(config):
+    """형식 버전과 설정 전체를 정규화한 JSON의 SHA-256 해시 (캐시 키)"""
+    canonical = json.dumps({"format": FORMAT_VERSION, "config": config},
+                           sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+class DocumentCache:
+    """생성된 .docx 바이트를 설정 해시로 보관하는 LRU 캐시 (전체 바이트 예산 제한)"""
+    
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """저장된 바이트를 반환하고 최근 사용으로 표시 (없으면 None)"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+    
+    def put(self, key, data):
+        """바이트를 저장하고 예산을 넘으면 가장 오래 쓰지 않은 항목부터 제거"""
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= len(self._entries.pop(key))
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+    
+    def stats(self):
+        """적중/미스 횟수와 현재 사용량"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+            }
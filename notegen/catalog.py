@@ -0,0 +1,81 @@
+"""노트 종류 목록과 종류별 지원 기능, 생성 한도, 파일명
+
+python-docx를 불러오지 않으므로 화면 구성(위젯, 미리보기)만 하는 쪽에서 가볍게 쓸 수 있다.
+"""
+
+# 노트 종류 (화면에 보이는 이름)
+NOTEBOOK_TYPES = ["줄공책", "칸공책", "영어노트 (4선)", "코넬노트", "음악 오선지",
+                  "한자노트", "다이어리", "달력", "수학 오답노트"]
+
+# 셀 서식 대신 표 스타일(COMPACT_TABLE_STYLES)을 쓸 수 있는 노트
+COMPACT_TYPES = ["줄공책", "음악 오선지", "한자노트", "수학 오답노트"]
+
+# 표 셀 대신 도형/단락 테두리로 선을 그리는 경량 그리기 모드를 쓸 수 있는 노트
+LEAN_TYPES = ["줄공책", "칸공책", "한자노트"]
+
+# python-docx 없이 페이지를 반복 기록할 수 있는 기하학 노트 (페이지마다 내용이 같음)
+STREAMABLE_TYPES = ["줄공책", "칸공책", "영어노트 (4선)", "음악 오선지"]
+
+# PDF로 내보낼 수 있는 노트
+PDF_TYPES = ["줄공책", "칸공책", "영어노트 (4선)", "음악 오선지", "한자노트", "달력"]
+
+# 페이지 수 상한 (일반 / 스트리밍 모드)
+MAX_PAGES = 50
+STREAM_MAX_PAGES = 500
+
+# 노트별 설정값의 허용 범위 (화면의 슬라이더/입력 범위와 같음, 양 끝 포함)
+OPTION_RANGES = {
+    "줄공책": {"lines_per_page": (10, 35)},
+    "칸공책": {"rows": (5, 25), "cols": (5, 25)},
+    "영어노트 (4선)": {"lines_per_page": (5, 15)},
+    "음악 오선지": {"staves_per_page": (8, 14)},
+    "한자노트": {"rows_per_page": (5, 10), "chars_per_row": (8, 12)},
+    "다이어리": {"num_days": (1, 365)},
+    "달력": {"year": (2020, 2030), "month": (1, 12), "num_months": (1, 12)},
+    "수학 오답노트": {"problems_per_page": (1, 4)},
+}
+
+# 설정값 이름 (오류 안내용)
+OPTION_LABELS = {
+    "num_pages": "페이지 수",
+    "lines_per_page": "페이지당 줄 수",
+    "rows": "행 수",
+    "cols": "열 수",
+    "staves_per_page": "페이지당 오선 수",
+    "rows_per_page": "페이지당 행 수",
+    "chars_per_row": "행당 칸 수",
+    "num_days": "일수",
+    "year": "연도",
+    "month": "시작 월",
+    "num_months": "개월 수",
+    "problems_per_page": "페이지당 문제 수",
+}
+
+# 이보다 큰 결과는 메모리 대신 임시 파일에 둔다 (spool_notebook 기본값)
+SPILL_BYTES = 8 * 1024 * 1024
+
+def option_ranges(notebook_type, streaming=False):
+    """노트의 숫자 설정값 이름 -> (최솟값, 최댓값), 페이지 수 포함 (다이어리, 달력 제외)"""
+    ranges = {}
+    if notebook_type not in ("다이어리", "달력"):
+        ranges["num_pages"] = (1, STREAM_MAX_PAGES if streaming else MAX_PAGES)
+    ranges.update(OPTION_RANGES.get(notebook_type, {}))
+    return ranges
+
+def validate_options(notebook_type, options, streaming=False):
+    """숫자 설정값이 정수이고 허용 범위 안인지 확인 (아니면 ValueError)"""
+    for name, (low, high) in option_ranges(notebook_type, streaming).items():
+        value = options.get(name)
+        if isinstance(value, bool) or not isinstance(value, int) or not low <= value <= high:
+            raise ValueError(f"{OPTION_LABELS[name]} 값은 {low}~{high} 사이의 정수여야 합니다 (받은 값: {value!r}).")
+
+def notebook_filename(config):
+    """다운로드 파일명 생성"""
+    notebook_type = config["notebook_type"]
+    options = config["options"]
+    extension = config.get("output_format", "docx")
+    if notebook_type == "다이어리":
+        return f"{notebook_type}_{options['start_date'].strftime('%Y%m%d')}_{options['num_days']}일.{extension}"
+    elif notebook_type == "달력":
+        return f"{notebook_type}_{options['year']}년_{options['month']}월_{options['num_months']}개월.{extension}"
+    return f"{notebook_type}_{options['num_pages']}페이지.{extension}"
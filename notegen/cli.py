@@ -0,0 +1,236 @@
+"""명령줄 진입점: python -m notegen grid --rows 25 --cols 25 --pages 50 -o out.docx"""
+import argparse
+import json
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+from .catalog import (
+    COMPACT_TYPES,
+    LEAN_TYPES,
+    PDF_TYPES,
+    STREAM_MAX_PAGES,
+    STREAMABLE_TYPES,
+    notebook_filename,
+    validate_options,
+)
+from .notebook import write_notebook
+
+# 명령줄 이름 -> 노트 종류
+TYPE_NAMES = {
+    "lined": "줄공책",
+    "grid": "칸공책",
+    "english": "영어노트 (4선)",
+    "cornell": "코넬노트",
+    "music": "음악 오선지",
+    "hanja": "한자노트",
+    "diary": "다이어리",
+    "calendar": "달력",
+    "math": "수학 오답노트",
+}
+
+ORIENTATIONS = {"portrait": "세로", "landscape": "가로"}
+
+OUTPUT_FORMATS = ["docx", "pdf"]
+
+def _parse_date(value):
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+def build_parser():
+    """노트 종류별 하위 명령과 batch 명령을 가진 파서"""
+    today = date.today()
+    parser = argparse.ArgumentParser(prog="notegen", description="노트 양식 Word 파일 생성기")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-o", "--output", help="저장할 파일 경로 (기본값: 노트 종류별 파일명)")
+    common.add_argument("--orientation", choices=ORIENTATIONS, default="portrait", help="용지 방향")
+    common.add_argument("--school", default="", help="학교명")
+    common.add_argument("--grade", default="", help="학년")
+    common.add_argument("--class", dest="class_num", default="", help="반")
+    common.add_argument("--name", default="", help="이름")
+
+    paged = argparse.ArgumentParser(add_help=False)
+    paged.add_argument("--pages", type=int, default=5, help="페이지 수")
+
+    compact = argparse.ArgumentParser(add_help=False)
+    compact.add_argument("--compact", action="store_true", help="셀 서식 대신 표 스타일 사용")
+
+    lean = argparse.ArgumentParser(add_help=False)
+    lean.add_argument("--lean", action="store_true", help="표 셀 대신 도형으로 선을 그리는 경량 그리기 모드")
+
+    pdf = argparse.ArgumentParser(add_help=False)
+    pdf.add_argument("--format", dest="output_format", choices=OUTPUT_FORMATS, default="docx",
+                     help="파일 형식 (pdf는 A4 벡터 PDF)")
+
+    stream = argparse.ArgumentParser(add_help=False)
+    stream.add_argument("--stream", action="store_true",
+                        help=f"document.xml을 스트리밍으로 기록 (최대 {STREAM_MAX_PAGES}페이지)")
+
+    lined = commands.add_parser("lined", parents=[common, paged, compact, lean, stream, pdf], help="줄공책")
+    lined.add_argument("--lines", type=int, default=25, help="페이지당 줄 수")
+
+    grid = commands.add_parser("grid", parents=[common, paged, lean, stream, pdf], help="칸공책")
+    grid.add_argument("--rows", type=int, default=15, help="행 수")
+    grid.add_argument("--cols", type=int, default=15, help="열 수")
+
+    english = commands.add_parser("english", parents=[common, paged, stream, pdf], help="영어노트 (4선)")
+    english.add_argument("--lines", type=int, default=10, help="페이지당 줄 수")
+
+    commands.add_parser("cornell", parents=[common, paged], help="코넬노트")
+
+    music = commands.add_parser("music", parents=[common, paged, compact, stream, pdf], help="음악 오선지")
+    music.add_argument("--staves", type=int, default=12, help="페이지당 오선 수")
+
+    hanja = commands.add_parser("hanja", parents=[common, paged, compact, lean, pdf], help="한자노트")
+    hanja.add_argument("--rows", type=int, default=8, help="페이지당 행 수")
+    hanja.add_argument("--chars", type=int, default=10, help="행당 칸 수")
+
+    diary = commands.add_parser("diary", parents=[common], help="다이어리")
+    diary.add_argument("--start", type=_parse_date, default=today, help="시작 날짜 (YYYY-MM-DD)")
+    diary.add_argument("--days", type=int, default=7, help="일수")
+
+    cal = commands.add_parser("calendar", parents=[common, pdf], help="달력")
+    cal.add_argument("--year", type=int, default=today.year, help="연도")
+    cal.add_argument("--month", type=int, default=today.month, help="시작 월")
+    cal.add_argument("--months", type=int, default=12, help="개월 수")
+
+    math = commands.add_parser("math", parents=[common, paged, compact], help="수학 오답노트")
+    math.add_argument("--problems", type=int, default=3, help="페이지당 문제 수")
+
+    batch = commands.add_parser("batch", help="JSON 작업 목록 일괄 생성")
+    batch.add_argument("jobs", help='작업 목록 JSON 파일 (예: [{"type": "grid", "rows": 25, "output": "a.docx"}])')
+
+    return parser
+
+def config_from_args(args):
+    """명령줄 인자를 generate_notebook 설정(config)으로 변환 (설정값이 화면의 허용 범위를 벗어나면 ValueError)"""
+    if args.orientation not in ORIENTATIONS:
+        raise ValueError(f"용지 방향은 {', '.join(ORIENTATIONS)} 중 하나여야 합니다.")
+    if getattr(args, "output_format", "docx") not in OUTPUT_FORMATS:
+        raise ValueError(f"파일 형식은 {', '.join(OUTPUT_FORMATS)} 중 하나여야 합니다.")
+    notebook_type = TYPE_NAMES[args.command]
+
+    options = {}
+    if hasattr(args, "pages"):
+        options["num_pages"] = args.pages
+    if notebook_type in COMPACT_TYPES:
+        options["compact"] = args.compact
+    if notebook_type in LEAN_TYPES:
+        options["lean"] = args.lean
+
+    if args.command in ("lined", "english"):
+        options["lines_per_page"] = args.lines
+    elif args.command == "grid":
+        options["rows"] = args.rows
+        options["cols"] = args.cols
+    elif args.command == "music":
+        options["staves_per_page"] = args.staves
+    elif args.command == "hanja":
+        options["rows_per_page"] = args.rows
+        options["chars_per_row"] = args.chars
+    elif args.command == "diary":
+        options["start_date"] = args.start
+        options["num_days"] = args.days
+    elif args.command == "calendar":
+        options["year"] = args.year
+        options["month"] = args.month
+        options["num_months"] = args.months
+    elif args.command == "math":
+        options["problems_per_page"] = args.problems
+
+    output_format = args.output_format if notebook_type in PDF_TYPES else "docx"
+    streaming = notebook_type in STREAMABLE_TYPES and args.stream and output_format == "docx"
+    validate_options(notebook_type, options, streaming)
+
+    user_info = None
+    if any([args.school, args.grade, args.class_num, args.name]):
+        user_info = {
+            "school_name": args.school,
+            "grade": args.grade,
+            "class_num": args.class_num,
+            "student_name": args.name,
+        }
+
+    return {
+        "notebook_type": notebook_type,
+        "orientation": ORIENTATIONS[args.orientation],
+        "user_info": user_info,
+        "options": options,
+        "streaming": streaming,
+        "output_format": output_format,
+    }
+
+def run_job(args):
+    """노트 하나를 만들어 파일로 저장하고 경로를 반환"""
+    config = config_from_args(args)
+    output = Path(args.output or notebook_filename(config))
+    # 메모리에 바이트를 모으지 않고 파일에 바로 기록 (실패하면 쓰다 만 파일은 지움)
+    try:
+        with output.open("wb") as f:
+            write_notebook(config, f)
+    except BaseException:
+        output.unlink(missing_ok=True)
+        raise
+    return output
+
+def _job_args(parser, job):
+    # JSON 작업을 같은 하위 명령의 기본값 위에 덮어써서 인자로 변환
+    if not isinstance(job, dict) or "type" not in job:
+        raise ValueError('작업은 "type" 항목이 있는 JSON 객체여야 합니다.')
+    job = dict(job)
+    command = job.pop("type")
+    if command not in TYPE_NAMES:
+        raise ValueError(f"알 수 없는 노트 종류: {command}")
+    args = parser.parse_args([command])
+    for key, value in job.items():
+        key = {"class": "class_num"}.get(key, key)
+        if not hasattr(args, key):
+            raise ValueError(f"{command} 작업에 알 수 없는 항목: {key}")
+        if key == "start":
+            if not isinstance(value, str):
+                raise ValueError(f"{command} 작업의 start 값은 YYYY-MM-DD 문자열이어야 합니다.")
+            value = _parse_date(value)
+        elif isinstance(getattr(args, key), bool) and not isinstance(value, bool):
+            raise ValueError(f"{command} 작업의 {key} 값은 true 또는 false여야 합니다.")
+        elif (getattr(args, key) is None or isinstance(getattr(args, key), str)) and not isinstance(value, str):
+            # 파일 경로(output)와 사용자 정보 같은 문자열 항목
+            raise ValueError(f"{command} 작업의 {key} 값은 문자열이어야 합니다.")
+        setattr(args, key, value)
+    return args
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "batch":
+        return _run_batch(parser, args.jobs)
+    try:
+        print(run_job(args))
+    except (OSError, ValueError) as e:
+        print(f"notegen: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+def _run_batch(parser, path):
+    # 작업마다 따로 실행하고 실패한 작업은 번호와 함께 알린 뒤 나머지를 계속 (하나라도 실패하면 1)
+    try:
+        with open(path, encoding="utf-8") as f:
+            jobs = json.load(f)
+        if not isinstance(jobs, list):
+            raise ValueError("작업 목록은 JSON 배열이어야 합니다.")
+    except (OSError, ValueError) as e:
+        print(f"notegen: {e}", file=sys.stderr)
+        return 1
+
+    failed = 0
+    for index, job in enumerate(jobs, 1):
+        try:
+            print(run_job(_job_args(parser, job)))
+        except (OSError, ValueError) as e:
+            failed += 1
+            print(f"notegen: 작업 {index}: {e}", file=sys.stderr)
+    if failed:
+        print(f"notegen: {len(jobs)}개 작업 중 {failed}개 실패", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,44 @@
+"""생성 단계별 시간과 문서 복잡도 측정, 구조화 로그 기록"""
+import json
+import logging
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger("notegen")
+
+# generate_notebook의 측정 단계 (순서대로)
+PHASES = ["document", "build", "stats", "save", "getvalue"]
+
+@contextmanager
+def timed_phase(report, phase):
+    """with 블록의 경과 시간(초)을 report["seconds"][phase]에 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        report.setdefault("seconds", {})[phase] = time.perf_counter() - start
+
+def document_stats(doc):
+    """본문의 표, 셀, 문단, 전체 XML 요소 수
+
+    요소마다 Python 객체를 만들지 않도록 XPath count()로 센다.
+    """
+    body = doc.element.body
+    return {
+        "tables": int(body.xpath('count(.//w:tbl)')),
+        "cells": int(body.xpath('count(.//w:tc)')),
+        "paragraphs": int(body.xpath('count(.//w:p)')),
+        "elements": int(body.xpath('count(.//*)')),
+    }
+
+def log_generation(config, report):
+    """집계용 한 줄 JSON 로그 (notegen 로거, INFO)"""
+    record = {
+        "event": "notebook_generated",
+        "notebook_type": config["notebook_type"],
+        "orientation": config["orientation"],
+        "streaming": bool(config.get("streaming")),
+        "options": config["options"],
+        **report,
+    }
+    logger.info(json.dumps(record, ensure_ascii=False, sort_keys=True, default=str))
@@ -0,0 +1,219 @@
+"""문서 생성, 푸터/사용자 정보, 페이지 복제, 저장 등 모든 노트가 함께 쓰는 기능"""
+import zipfile
+from copy import deepcopy
+from datetime import datetime
+from functools import lru_cache
+
+from docx import Document
+from docx.enum.section import WD_ORIENT
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.opc.pkgwriter import PackageWriter
+from docx.oxml.ns import qn
+from docx.shared import Inches, Pt, RGBColor, Twips
+
+from .fragments import NO_BORDERS, border_fragment
+from .layout import FOOTER_TEXT, page_geometry
+from .progress import report_progress
+
+# 같은 입력이 항상 같은 바이트가 되도록 고정하는 시각
+#   문서 속성(작성/수정 시각)과 zip 항목 시각 (zip이 표현할 수 있는 가장 이른 시각)
+DOCUMENT_TIMESTAMP = datetime(2000, 1, 1)
+ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+
+def new_document(orientation="세로", letterhead=None):
+    """용지 방향, 여백, 푸터가 설정된 새 문서 (미리 만든 기본 문서를 복제)
+
+    letterhead에 학교 서식 .docx 경로를 주면 그 머리글/바닥글과 스타일을 쓴다.
+    """
+    return deepcopy(_base_document(orientation, letterhead))
+
+@lru_cache(maxsize=16)
+def _base_document(orientation, letterhead):
+    # 방향과 서식 파일마다 한 번만 템플릿을 읽고 용지/여백/푸터를 설정
+    # (요청마다 이 문서를 복제하므로 직접 고치지 않는다)
+    doc = Document(letterhead)
+    page = page_geometry(orientation)
+    if letterhead is not None:
+        # 서식 파일의 본문은 비우고 머리글/바닥글과 스타일만 남김
+        body = doc.element.body
+        for child in list(body):
+            if child.tag != qn("w:sectPr"):
+                body.remove(child)
+    
+    # 용지 크기와 방향 설정 (서식 파일도 배치 모델의 용지와 여백을 따름)
+    for section in doc.sections:
+        section.orientation = WD_ORIENT.LANDSCAPE if orientation == "가로" else WD_ORIENT.PORTRAIT
+        section.page_width = Twips(page["width"])
+        section.page_height = Twips(page["height"])
+        
+        # 여백 설정
+        section.top_margin = Twips(page["margin"])
+        section.bottom_margin = Twips(page["margin"])
+        section.left_margin = Twips(page["margin"])
+        section.right_margin = Twips(page["margin"])
+    
+    # 서식 파일에 바닥글 문구가 없을 때만 기본 푸터 추가
+    if letterhead is None or not any(p.text.strip() for p in doc.sections[0].footer.paragraphs):
+        add_footer(doc)
+    
+    # 문서 속성의 시각과 수정 횟수 고정
+    properties = doc.core_properties
+    properties.created = DOCUMENT_TIMESTAMP
+    properties.modified = DOCUMENT_TIMESTAMP
+    properties.revision = 1
+    return doc
+
+class _ZipPackageWriter:
+    # python-docx PackageWriter가 쓰는 물리 패키지 쓰기 객체 (zip 항목 시각만 고정)
+    
+    def __init__(self, output):
+        self._zipf = zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED)
+    
+    def write(self, pack_uri, blob):
+        info = zipfile.ZipInfo(pack_uri.membername, ZIP_TIMESTAMP)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o600 << 16
+        self._zipf.writestr(info, blob)
+    
+    def close(self):
+        self._zipf.close()
+
+def save_document(doc, output):
+    """doc.save와 같은 .docx를 output에 기록 (zip 항목 시각 고정, 같은 문서는 항상 같은 바이트)
+
+    항목 순서는 python-docx와 같다: [Content_Types].xml, 패키지 관계, 관계를 따라간 파트 순서.
+    """
+    package = doc.part.package
+    for part in package.parts:
+        part.before_marshal()
+    writer = _ZipPackageWriter(output)
+    PackageWriter._write_content_types_stream(writer, package.parts)
+    PackageWriter._write_pkg_rels(writer, package.rels)
+    PackageWriter._write_parts(writer, package.parts)
+    writer.close()
+
+def document_orientation(doc):
+    """문서 첫 섹션의 용지 방향 ("세로" 또는 "가로")"""
+    return "가로" if doc.sections[0].orientation == WD_ORIENT.LANDSCAPE else "세로"
+
+def add_footer(doc):
+    """페이지 하단에 푸터 추가"""
+    # 모든 섹션에 푸터 추가
+    for section in doc.sections:
+        footer = section.footer
+        
+        # 푸터가 비어있으면 새 단락 추가
+        if not footer.paragraphs:
+            footer_para = footer.add_paragraph()
+        else:
+            footer_para = footer.paragraphs[0]
+            footer_para.clear()
+        
+        # 푸터 텍스트 추가
+        footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        footer_run = footer_para.add_run(FOOTER_TEXT)
+        footer_run.font.size = Pt(9)
+        footer_run.font.color.rgb = RGBColor(128, 128, 128)
+        footer_run.font.italic = True
+        
+        # 여백 조정
+        footer_para.paragraph_format.space_before = Pt(12)
+
+def add_user_info(doc, school_name="", grade="", class_num="", student_name=""):
+    """페이지 상단에 사용자 정보 추가"""
+    if any([school_name, grade, class_num, student_name]):
+        # 사용자 정보 테이블
+        info_table = doc.add_table(rows=1, cols=4)
+        info_table.style = 'Normal Table'
+        info_table.alignment = WD_TABLE_ALIGNMENT.RIGHT
+        
+        # 학교명
+        if school_name:
+            school_cell = info_table.cell(0, 0)
+            school_cell.width = Inches(2)
+            school_p = school_cell.paragraphs[0]
+            school_p.add_run(school_name)
+            school_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        # 학년
+        if grade:
+            grade_cell = info_table.cell(0, 1)
+            grade_cell.width = Inches(1)
+            grade_p = grade_cell.paragraphs[0]
+            grade_p.add_run(grade)
+            grade_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        # 반
+        if class_num:
+            class_cell = info_table.cell(0, 2)
+            class_cell.width = Inches(1)
+            class_p = class_cell.paragraphs[0]
+            class_p.add_run(class_num)
+            class_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        # 이름
+        if student_name:
+            name_cell = info_table.cell(0, 3)
+            name_cell.width = Inches(1.5)
+            name_p = name_cell.paragraphs[0]
+            name_p.add_run(f"이름: {student_name}")
+            name_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        # 테이블 스타일 조정
+        for row in info_table.rows:
+            for cell in row.cells:
+                # 테두리 제거
+                tcPr = cell._element.get_or_add_tcPr()
+                tcPr.append(border_fragment(**NO_BORDERS))
+                
+                # 폰트 크기 조정
+                for paragraph in cell.paragraphs:
+                    for run in paragraph.runs:
+                        run.font.size = Pt(10)
+        
+        # 구분선
+        line_para = doc.add_paragraph("─" * 80)
+        line_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        line_para.paragraph_format.space_before = Pt(6)
+        line_para.paragraph_format.space_after = Pt(12)
+        
+        return True
+    return False
+
+def add_cloned_pages(doc, num_pages, build_page, patch_page=None):
+    """페이지 본문을 한 번만 만들고 나머지 페이지는 XML을 복제하여 추가
+
+    build_page(page)는 해당 페이지의 본문을 문서 끝에 추가한다 (페이지 나누기 제외).
+    첫 페이지(사용자 정보 포함)와 두 번째 페이지만 직접 만들고, 세 번째 페이지부터는
+    두 번째 페이지의 요소를 복사한다. patch_page(elements, page)가 주어지면
+    복사된 요소에서 페이지마다 달라지는 부분을 고친다.
+    페이지를 하나 마칠 때마다 report_progress로 진행률을 알린다.
+    """
+    body = doc.element.body
+
+    build_page(0)
+    report_progress(1, num_pages)
+    if num_pages < 2:
+        return
+
+    # 두 번째 페이지를 템플릿으로 사용 (앞의 페이지 나누기 포함)
+    start = len(body) - (1 if body.sectPr is not None else 0)
+    doc.add_page_break()
+    build_page(1)
+    end = len(body) - (1 if body.sectPr is not None else 0)
+    template = body[start:end]
+    report_progress(2, num_pages)
+
+    # body.sectPr는 매번 자식 요소를 처음부터 찾으므로 한 번만 조회
+    sectPr = body.sectPr
+    for page in range(2, num_pages):
+        elements = [deepcopy(element) for element in template]
+        if patch_page:
+            patch_page(elements, page)
+        for element in elements:
+            if sectPr is not None:
+                sectPr.addprevious(element)
+            else:
+                body.append(element)
+        report_progress(page + 1, num_pages)
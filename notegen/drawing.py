@@ -0,0 +1,79 @@
+"""표 셀 대신 VML 도형과 단락 테두리로 선을 그리는 경량 그리기 모드 조각"""
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_LINE_SPACING
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Pt
+
+from .fragments import _cached_fragment
+
+# python-docx의 nsdecls()에는 VML 네임스페이스가 없으므로 직접 선언
+_VML_NAMESPACES = (
+    'xmlns:v="urn:schemas-microsoft-com:vml" '
+    'xmlns:o="urn:schemas-microsoft-com:office:office"'
+)
+
+def cross_path(width, height):
+    """가로/세로 가운데를 지나는 십자 경로 (twips 좌표)"""
+    return f"m0,{height // 2}l{width},{height // 2}m{width // 2},0l{width // 2},{height}e"
+
+def grid_path(cell_size, rows, cols):
+    """rows x cols 정사각형 격자의 가로/세로 선 경로 (twips 좌표)"""
+    width, height = cell_size * cols, cell_size * rows
+    horizontal = "".join(f"m0,{row * cell_size}l{width},{row * cell_size}" for row in range(rows + 1))
+    vertical = "".join(f"m{col * cell_size},0l{col * cell_size},{height}" for col in range(cols + 1))
+    return horizontal + vertical + "e"
+
+def line_shape_run(width, height, path, color='CCCCCC', weight=6, dash=None, left=0, horizontal_relative='text'):
+    """선 경로 하나를 그리는 VML 도형을 담은 w:r 조각
+
+    width, height, left와 path 좌표는 twips, weight는 테두리 굵기처럼 1/8pt 단위다.
+    dash는 VML 선 모양 (예: 'dot', 'dash'), None이면 실선.
+    도형은 이 run이 들어간 단락의 위쪽, horizontal_relative('text' 또는 'margin') 왼쪽에서
+    left만큼 떨어진 곳에 글자 뒤로 놓인다.
+    """
+    key = ('vml', width, height, path, color, weight, dash, left, horizontal_relative)
+
+    def build():
+        stroke = f'<v:stroke dashstyle="{dash}"/>' if dash else ''
+        style = (
+            f"position:absolute;margin-left:{left / 20:g}pt;margin-top:0;"
+            f"width:{width / 20:g}pt;height:{height / 20:g}pt;z-index:-251658240;"
+            f"mso-position-horizontal-relative:{horizontal_relative};mso-position-vertical-relative:text"
+        )
+        return parse_xml(
+            f'<w:r {nsdecls("w")} {_VML_NAMESPACES}><w:pict>'
+            f'<v:shape coordsize="{width},{height}" path="{path}" style="{style}" '
+            f'filled="f" stroked="t" strokecolor="#{color}" strokeweight="{weight / 8:g}pt" '
+            f'o:allowincell="t">{stroke}</v:shape>'
+            f'</w:pict></w:r>'
+        )
+
+    return _cached_fragment(key, build)
+
+def register_ruled_style(doc, name, line_height, color='808080', weight=4):
+    """빈 단락 하나가 밑줄 한 줄이 되는 단락 스타일을 등록 (이미 있으면 건너뜀)
+
+    줄 간격을 line_height로 고정하고 아래/사이 테두리를 두어, 이 스타일의 단락이 이어지면
+    줄마다 같은 선이 그려진다 (사이 테두리가 없으면 Word가 연속 단락의 테두리를 하나로 묶는다).
+    """
+    styles = doc.styles
+    if styles.element.get_by_name(name) is not None:
+        return
+    
+    style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = styles['Normal']
+    style.paragraph_format.line_spacing_rule = WD_LINE_SPACING.EXACTLY
+    style.paragraph_format.line_spacing = line_height
+    style.paragraph_format.space_before = Pt(0)
+    style.paragraph_format.space_after = Pt(0)
+    
+    pBdr = OxmlElement('w:pBdr')
+    for side in ('bottom', 'between'):
+        border = OxmlElement(f'w:{side}')
+        border.set(qn('w:val'), 'single')
+        border.set(qn('w:sz'), str(weight))
+        border.set(qn('w:space'), '0')
+        border.set(qn('w:color'), color)
+        pBdr.append(border)
+    style.element.get_or_add_pPr().insert_element_before(pBdr, 'w:shd', 'w:tabs', 'w:spacing', 'w:ind', 'w:jc')
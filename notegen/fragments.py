@@ -0,0 +1,207 @@
+"""셀/행 속성 XML 조각 캐시와 압축 스타일 모드용 표 스타일"""
+from copy import deepcopy
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+# 셀/행 속성 조각 캐시: 같은 조합은 한 번만 만들고 복사본을 나눠준다
+_fragment_cache = {}
+
+BORDER_SIDES = ('top', 'left', 'bottom', 'right')
+TABLE_BORDER_SIDES = BORDER_SIDES + ('insideH', 'insideV')
+NO_BORDERS = {side: 'nil' for side in BORDER_SIDES}
+
+def _cached_fragment(key, build):
+    """key에 해당하는 XML 조각을 한 번만 만들고 복사본을 반환"""
+    fragment = _fragment_cache.get(key)
+    if fragment is None:
+        fragment = _fragment_cache[key] = build()
+    return deepcopy(fragment)
+
+def _border_key(borders):
+    # 각 변은 'nil' 또는 (val, sz, color) / (val, sz, color, space)
+    return tuple((side, borders[side]) for side in TABLE_BORDER_SIDES if side in borders)
+
+def _build_borders(border_key, tag='w:tcBorders'):
+    tcBorders = OxmlElement(tag)
+    for side, spec in border_key:
+        element = OxmlElement(f'w:{side}')
+        if spec == 'nil':
+            element.set(qn('w:val'), 'nil')
+        else:
+            val, sz, color = spec[:3]
+            element.set(qn('w:val'), val)
+            element.set(qn('w:sz'), str(sz))
+            if len(spec) > 3:
+                element.set(qn('w:space'), str(spec[3]))
+            element.set(qn('w:color'), color)
+        tcBorders.append(element)
+    return tcBorders
+
+def _build_margins(width, tag='w:tcMar'):
+    tcMar = OxmlElement(tag)
+    for side in BORDER_SIDES:
+        margin = OxmlElement(f'w:{side}')
+        margin.set(qn('w:w'), str(width))
+        margin.set(qn('w:type'), 'dxa')
+        tcMar.append(margin)
+    return tcMar
+
+def _build_spacing(spacing_key):
+    spacing = OxmlElement('w:spacing')
+    for name, value in spacing_key:
+        spacing.set(qn(f'w:{name}'), str(value))
+    return spacing
+
+def _build_height(tag, height, rule):
+    element = OxmlElement(tag)
+    element.set(qn('w:val'), str(height))
+    if rule:
+        element.set(qn('w:hRule'), rule)
+    return element
+
+def border_fragment(**borders):
+    """w:tcBorders 조각 (예: bottom=('single', 4, '808080'), top='nil')"""
+    key = _border_key(borders)
+    return _cached_fragment(('tcBorders', key), lambda: _build_borders(key))
+
+def cell_height_fragment(height, rule='exact'):
+    """w:tcH 조각 (height는 twips)"""
+    return _cached_fragment(('tcH', height, rule), lambda: _build_height('w:tcH', height, rule))
+
+def shading_fragment(fill):
+    """w:shd 배경색 조각"""
+    def build():
+        shading = OxmlElement('w:shd')
+        shading.set(qn('w:val'), 'clear')
+        shading.set(qn('w:color'), 'auto')
+        shading.set(qn('w:fill'), fill)
+        return shading
+    return _cached_fragment(('shd', fill), build)
+
+def row_fragment(height, rule='exact'):
+    """w:trPr 조각 (height는 twips)"""
+    def build():
+        trPr = OxmlElement('w:trPr')
+        trPr.append(_build_height('w:trHeight', height, rule))
+        return trPr
+    return _cached_fragment(('trPr', height, rule), build)
+
+def set_table_cell_margin(table, width):
+    """표 전체의 기본 셀 여백(w:tblCellMar, twips)을 설정하여 셀마다 tcMar를 두지 않게 한다"""
+    tblPr = table._tbl.tblPr
+    existing = tblPr.find(qn('w:tblCellMar'))
+    if existing is not None:
+        tblPr.remove(existing)
+    margins = _cached_fragment(('tblCellMar', width), lambda: _build_margins(width, 'w:tblCellMar'))
+    tblPr.insert_element_before(margins, 'w:tblLook', 'w:tblCaption', 'w:tblDescription', 'w:tblPrChange')
+
+def cell_fragment(width=None, borders=None, shading=None, margin=None, height=None,
+                  spacing=None, align=None):
+    """빈 셀(w:tc) 조각: 너비/테두리/배경/여백/높이/단락 간격을 한 번에 담는다
+
+    width, margin, height와 spacing 값은 twips 단위다.
+    spacing은 w:spacing 속성 dict (예: {'before': 0, 'after': 0, 'line': 240, 'lineRule': 'auto'}).
+    """
+    border_key = _border_key(borders) if borders else None
+    spacing_key = tuple(spacing.items()) if spacing else None
+    key = ('tc', width, border_key, shading, margin, height, spacing_key, align)
+
+    def build():
+        tc = OxmlElement('w:tc')
+        tcPr = OxmlElement('w:tcPr')
+        if width is not None:
+            tcW = OxmlElement('w:tcW')
+            tcW.set(qn('w:w'), str(width))
+            tcW.set(qn('w:type'), 'dxa')
+            tcPr.append(tcW)
+        if border_key:
+            tcPr.append(_build_borders(border_key))
+        if shading:
+            tcPr.append(shading_fragment(shading))
+        if margin is not None:
+            tcPr.append(_build_margins(margin))
+        if height is not None:
+            tcPr.append(_build_height('w:tcH', *height))
+        tc.append(tcPr)
+
+        p = OxmlElement('w:p')
+        if spacing_key or align:
+            pPr = OxmlElement('w:pPr')
+            if spacing_key:
+                pPr.append(_build_spacing(spacing_key))
+            if align:
+                jc = OxmlElement('w:jc')
+                jc.set(qn('w:val'), align)
+                pPr.append(jc)
+            p.append(pPr)
+        tc.append(p)
+        return tc
+
+    return _cached_fragment(key, build)
+
+def format_table_rows(table, row_height, height_rule='exact', **cell_spec):
+    """표의 모든 행에 같은 높이를 주고 모든 셀을 cell_fragment 복사본으로 교체"""
+    for tr in table._tbl.tr_lst:
+        format_row(tr, row_height, height_rule, **cell_spec)
+
+def format_row(tr, row_height, height_rule='exact', **cell_spec):
+    """행(w:tr) 하나의 높이와 셀 속성을 조각 복사로 설정"""
+    if tr.trPr is not None:
+        tr.remove(tr.trPr)
+    if row_height is not None:
+        tr.insert(0, row_fragment(row_height, height_rule))
+    for tc in tr.tc_lst:
+        tr.replace(tc, cell_fragment(**cell_spec))
+
+# 압축 스타일 모드에서 styles.xml에 등록하는 표 스타일
+# 셀마다 넣던 테두리/여백/단락 간격을 표 스타일 하나로 대신한다
+COMPACT_TABLE_STYLES = {
+    # 줄공책: 행마다 회색 하단 선
+    'Ruled Line': {
+        'borders': {'top': 'nil', 'left': 'nil', 'bottom': ('single', 4, '808080', 0),
+                    'right': 'nil', 'insideH': ('single', 4, '808080', 0), 'insideV': 'nil'},
+        'margin': 50,
+        'spacing': {'before': 0, 'after': 0, 'line': 240, 'lineRule': 'auto'},
+    },
+    # 음악 오선지: 행마다 검은 하단 선, 여백 없음
+    'Staff Line': {
+        'borders': {'top': 'nil', 'left': 'nil', 'bottom': ('single', 6, '000000', 0),
+                    'right': 'nil', 'insideH': ('single', 6, '000000', 0), 'insideV': 'nil'},
+        'margin': 0,
+    },
+    # 한자노트 십자 가이드: 내부 선만 점선, 여백 없음
+    'Hanja Guide': {
+        'borders': {'top': 'nil', 'left': 'nil', 'bottom': 'nil', 'right': 'nil',
+                    'insideH': ('dotted', 6, 'CCCCCC'), 'insideV': ('dotted', 6, 'CCCCCC')},
+        'margin': 0,
+    },
+    # 수학 오답노트 풀이 격자: 연한 격자선
+    'Light Grid Line': {
+        'borders': {side: ('single', 2, 'E0E0E0') for side in TABLE_BORDER_SIDES},
+    },
+}
+
+def register_table_styles(doc):
+    """압축 스타일 모드용 표 스타일을 문서의 styles.xml에 등록 (이미 있으면 건너뜀)"""
+    styles = doc.styles
+    for name, spec in COMPACT_TABLE_STYLES.items():
+        if styles.element.get_by_name(name) is not None:
+            continue
+        
+        style = styles.add_style(name, WD_STYLE_TYPE.TABLE)
+        style.base_style = styles['Normal Table']
+        
+        # 표 안의 단락 간격
+        if 'spacing' in spec:
+            pPr = OxmlElement('w:pPr')
+            pPr.append(_build_spacing(tuple(spec['spacing'].items())))
+            style.element.append(pPr)
+        
+        # 표 테두리와 셀 여백
+        tblPr = OxmlElement('w:tblPr')
+        tblPr.append(_build_borders(_border_key(spec['borders']), 'w:tblBorders'))
+        if 'margin' in spec:
+            tblPr.append(_build_margins(spec['margin'], 'w:tblCellMar'))
+        style.element.append(tblPr)
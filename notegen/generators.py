@@ -0,0 +1,721 @@
+"""노트 종류별 생성 함수"""
+import calendar
+from copy import deepcopy
+from datetime import timedelta
+
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Inches, Pt, RGBColor, Twips
+
+from .document import add_cloned_pages, add_user_info, document_orientation
+from .drawing import cross_path, grid_path, line_shape_run, register_ruled_style
+from .fragments import (
+    BORDER_SIDES,
+    NO_BORDERS,
+    cell_fragment,
+    cell_height_fragment,
+    format_row,
+    format_table_rows,
+    register_table_styles,
+    set_table_cell_margin,
+    shading_fragment,
+)
+from .layout import heights, notebook_layout
+from .progress import report_progress
+
+def create_lined_notebook(doc, lines_per_page=25, num_pages=5, user_info=None, compact=False, lean=False):
+    """줄공책 양식 생성 - 테이블 방식
+
+    compact=True이면 셀 서식 대신 표 스타일을 쓰고,
+    lean=True이면 표 대신 아래 테두리가 있는 고정 간격 단락으로 줄을 만든다.
+    줄 간격은 배치 모델을 따른다 (28pt, 줄이 많으면 한 페이지에 맞게 줄임).
+    """
+    layout = notebook_layout("줄공책", {"lines_per_page": lines_per_page}, document_orientation(doc))
+    pitch = layout["pitch"]
+    if lean:
+        register_ruled_style(doc, 'Ruled Paragraph', Pt(pitch / 20))
+    elif compact:
+        register_table_styles(doc)
+    
+    def build_page(page):
+        # 사용자 정보 추가
+        if user_info and page == 0:
+            add_user_info(doc, **user_info)
+        
+        # 페이지 상단 여백
+        top_para = doc.add_paragraph()
+        top_para.paragraph_format.space_after = Pt(10)
+        
+        if lean:
+            # 한 줄 = 'Ruled Paragraph' 스타일의 빈 단락 하나 (첫 단락을 복사하여 줄 수만큼)
+            ruled = doc.add_paragraph(style='Ruled Paragraph')._p
+            for _ in range(lines_per_page - 1):
+                ruled.addnext(deepcopy(ruled))
+            return
+        
+        # 테이블을 사용한 줄 생성
+        table = doc.add_table(rows=lines_per_page, cols=1)
+        table.autofit = False
+        
+        if compact:
+            # 선과 여백은 'Ruled Line' 스타일이 담당
+            table.style = 'Ruled Line'
+            format_table_rows(table, pitch, width=layout["width"])
+            return
+        
+        table.style = 'Normal Table'
+        
+        # 행 높이는 줄 간격, 하단 선만 있는 셀
+        format_table_rows(
+            table, pitch,
+            width=layout["width"],
+            borders={'top': 'nil', 'left': 'nil', 'bottom': ('single', 4, '808080', 0), 'right': 'nil'},
+            margin=50,
+            spacing={'before': 0, 'after': 0, 'line': 240, 'lineRule': 'auto'},
+        )
+    
+    add_cloned_pages(doc, num_pages, build_page)
+
+def create_grid_notebook(doc, rows=15, cols=15, num_pages=5, user_info=None, lean=False):
+    """칸공책 양식 생성
+
+    lean=True이면 표 대신 페이지마다 정사각형 격자 도형 하나를 그린다 (칸 수와 무관한 크기).
+    """
+    layout = notebook_layout("칸공책", {"rows": rows, "cols": cols}, document_orientation(doc))
+    
+    if lean:
+        # 본문 영역에 들어가는 가장 큰 정사각형 칸
+        cell_size = layout["cell_size"]
+        pattern = line_shape_run(
+            cell_size * cols, cell_size * rows, grid_path(cell_size, rows, cols),
+            color='000000', weight=4,
+            left=layout["square_left"], horizontal_relative='margin',
+        )
+    
+    def build_page(page):
+        # 사용자 정보 추가
+        if user_info and page == 0:
+            add_user_info(doc, **user_info)
+        
+        if lean:
+            # 격자 도형을 담은 빈 단락 (도형은 글자 뒤, 가로 가운데)
+            doc.add_paragraph()._p.append(deepcopy(pattern))
+            return
+        
+        # 테이블 생성
+        table = doc.add_table(rows=rows, cols=cols)
+        table.style = 'Table Grid'
+        table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        table.autofit = False
+        table.allow_autofit = False
+        
+        # 각 행 높이(배치 모델의 행 경계 간격)와 셀 너비/여백 설정
+        for tr, height in zip(table._tbl.tr_lst, heights(layout["row_ys"])):
+            format_row(
+                tr, height,
+                width=layout["cell_width"],
+                margin=10,
+                spacing={'before': 0, 'after': 0, 'line': 0, 'lineRule': 'exact'},
+            )
+    
+    add_cloned_pages(doc, num_pages, build_page)
+
+def create_english_notebook(doc, lines_per_page=12, num_pages=5, user_info=None):
+    """영어노트 양식 생성 (4선 노트)"""
+    layout = notebook_layout("영어노트 (4선)", {"lines_per_page": lines_per_page}, document_orientation(doc))
+    
+    def build_page(page):
+        # 사용자 정보 추가
+        if user_info and page == 0:
+            add_user_info(doc, **user_info)
+        
+        # 페이지 상단 여백
+        top_margin = doc.add_paragraph()
+        top_margin.paragraph_format.space_after = Pt(20)
+        
+        # 페이지 전체를 표 하나로 만들고 4선마다 4행을 씀
+        table = doc.add_table(rows=4 * lines_per_page, cols=1)
+        table.autofit = False
+        table.style = 'Normal Table'
+        
+        # 각 선의 하단 테두리 (상단 점선, 상단 실선, 굵은 기준선, 하단 실선)
+        line_borders = [
+            ('dotted', 4, 'CCCCCC'),
+            ('single', 4, '808080'),
+            ('single', 6, '000000'),
+            ('single', 4, '808080')
+        ]
+        
+        # 행 높이는 배치 모델의 선 위치 간격 (줄 사이 간격은 다음 줄 첫 행에 포함)
+        line_ys = [y for ys in layout["line_ys"] for y in ys]
+        row_heights = heights([layout["top"]] + line_ys)
+        
+        for index, (tr, height) in enumerate(zip(table._tbl.tr_lst, row_heights)):
+            format_row(
+                tr, height,
+                width=layout["width"],
+                borders={'top': 'nil', 'left': 'nil', 'bottom': line_borders[index % 4], 'right': 'nil'},
+            )
+    
+    add_cloned_pages(doc, num_pages, build_page)
+
+def create_cornell_notebook(doc, num_pages=5, user_info=None):
+    """코넬노트 양식 생성"""
+    def build_page(page):
+        # 사용자 정보 추가
+        if user_info and page == 0:
+            add_user_info(doc, **user_info)
+        
+        # 상단 영역 (제목, 날짜)
+        header_table = doc.add_table(rows=1, cols=2)
+        header_table.style = 'Table Grid'
+        header_table.columns[0].width = Inches(4)
+        header_table.columns[1].width = Inches(2.5)
+        
+        # 제목 셀
+        title_cell = header_table.cell(0, 0)
+        title_p = title_cell.paragraphs[0]
+        title_p.add_run("제목: ").bold = True
+        
+        # 날짜 셀
+        date_cell = header_table.cell(0, 1)
+        date_p = date_cell.paragraphs[0]
+        date_p.add_run("날짜: ").bold = True
+        
+        # 간격
+        doc.add_paragraph().paragraph_format.space_after = Pt(12)
+        
+        # 메인 영역 (핵심어 | 노트)
+        main_table = doc.add_table(rows=1, cols=2)
+        main_table.style = 'Table Grid'
+        main_table.columns[0].width = Inches(2)
+        main_table.columns[1].width = Inches(4.5)
+        
+        # 핵심어 열
+        key_cell = main_table.cell(0, 0)
+        key_p = key_cell.paragraphs[0]
+        key_p.add_run("핵심어/질문").bold = True
+        key_p.add_run("\n\n")
+        
+        # 노트 열
+        note_cell = main_table.cell(0, 1)
+        note_p = note_cell.paragraphs[0]
+        note_p.add_run("노트 영역").bold = True
+        note_p.add_run("\n\n")
+        
+        # 셀 높이 설정
+        tr = main_table.rows[0]._element
+        trPr = tr.get_or_add_trPr()
+        trHeight = OxmlElement('w:trHeight')
+        trHeight.set(qn('w:val'), '8000')  # 약 5.5인치
+        trHeight.set(qn('w:hRule'), 'atLeast')
+        trPr.append(trHeight)
+        
+        # 간격
+        doc.add_paragraph().paragraph_format.space_after = Pt(12)
+        
+        # 하단 요약 영역
+        summary_title = doc.add_paragraph("요약:")
+        summary_title.runs[0].font.bold = True
+        summary_title.paragraph_format.space_after = Pt(6)
+        
+        # 요약 박스
+        summary_table = doc.add_table(rows=1, cols=1)
+        summary_table.style = 'Table Grid'
+        summary_cell = summary_table.cell(0, 0)
+        
+        # 요약 영역 높이 설정
+        tr = summary_table.rows[0]._element
+        trPr = tr.get_or_add_trPr()
+        trHeight = OxmlElement('w:trHeight')
+        trHeight.set(qn('w:val'), '2000')  # 약 1.5인치
+        trHeight.set(qn('w:hRule'), 'atLeast')
+        trPr.append(trHeight)
+    
+    add_cloned_pages(doc, num_pages, build_page)
+
+def create_music_staff(doc, staves_per_page=12, num_pages=5, user_info=None, compact=False):
+    """음악 오선지 생성 (compact=True이면 셀 서식 대신 표 스타일 사용)"""
+    if compact:
+        register_table_styles(doc)
+    layout = notebook_layout("음악 오선지", {"staves_per_page": staves_per_page}, document_orientation(doc))
+    
+    def build_page(page):
+        # 사용자 정보 추가
+        if user_info and page == 0:
+            add_user_info(doc, **user_info)
+        
+        # 페이지 상단 여백
+        top_para = doc.add_paragraph()
+        top_para.paragraph_format.space_after = Pt(20)
+        
+        # 페이지 전체를 표 하나로 만들고 오선마다 5행을 씀 (모든 행은 하단 선 하나)
+        table = doc.add_table(rows=5 * staves_per_page, cols=1)
+        table.autofit = False
+        
+        if compact:
+            # 선과 여백은 'Staff Line' 스타일이 담당
+            table.style = 'Staff Line'
+            cell_spec = {'width': layout["width"]}
+        else:
+            table.style = 'Normal Table'
+            
+            # 하단 선만 있고 여백이 없는 셀
+            cell_spec = {
+                'width': layout["width"],
+                'borders': {'top': 'nil', 'left': 'nil', 'bottom': ('single', 6, '000000', 0), 'right': 'nil'},
+                'margin': 0,
+            }
+        
+        # 행 높이는 배치 모델의 선 위치 간격 (오선 사이 간격은 다음 오선 첫 행에 포함)
+        line_ys = [y for ys in layout["staff_ys"] for y in ys]
+        for tr, height in zip(table._tbl.tr_lst, heights([layout["top"]] + line_ys)):
+            format_row(tr, height, **cell_spec)
+    
+    add_cloned_pages(doc, num_pages, build_page)
+
+def create_chinese_notebook(doc, rows_per_page=6, chars_per_row=8, num_pages=5, user_info=None, compact=False,
+                            lean=False):
+    """한자 노트 생성 - 한국식 한자 쓰기 노트
+
+    compact=True이면 가이드 선을 표 스타일로 처리하고,
+    lean=True이면 내부 표 대신 칸마다 VML 십자 도형 하나로 가이드 선을 그린다.
+    """
+    if compact:
+        register_table_styles(doc)
+        # 스타일 이름 조회는 스타일 목록을 매번 훑으므로 내부 표마다 하지 않고 ID를 한 번만 찾아 둠
+        guide_style_id = doc.styles['Hanja Guide'].style_id
+    layout = notebook_layout("한자노트", {"rows_per_page": rows_per_page, "chars_per_row": chars_per_row},
+                             document_orientation(doc))
+    cell_size = layout["cell_size"]  # 정사각형 한자 칸
+    
+    def build_page(page):
+        # 사용자 정보 추가
+        if user_info and page == 0:
+            add_user_info(doc, **user_info)
+        
+        # 페이지 상단 여백
+        top_para = doc.add_paragraph()
+        top_para.paragraph_format.space_after = Pt(20)
+        
+        # 한자 연습용 테이블 생성 (한자칸 + 뜻칸)
+        for row_idx in range(rows_per_page):
+            # 한 줄에 한자칸과 뜻칸을 함께 생성
+            line_table = doc.add_table(rows=2, cols=chars_per_row)
+            line_table.style = 'Table Grid'
+            line_table.alignment = WD_TABLE_ALIGNMENT.CENTER
+            line_table.autofit = False
+            
+            hanja_tr, meaning_tr = line_table._tbl.tr_lst
+            
+            # 첫 번째 행: 한자 쓰기 칸
+            if lean:
+                # 여백 없는 칸마다 칸 크기의 점선 십자 도형 하나를 글자 뒤에 놓음
+                # 여백은 셀마다 두지 않고 표 전체에 한 번만 설정
+                set_table_cell_margin(line_table, 0)
+                format_row(hanja_tr, cell_size, width=cell_size)
+                for hanja_tc in hanja_tr.tc_lst:
+                    hanja_tc.p_lst[0].append(
+                        line_shape_run(cell_size, cell_size, cross_path(cell_size, cell_size), dash='dot')
+                    )
+            else:
+                format_row(hanja_tr, cell_size, width=cell_size)
+                
+                for cell in line_table.rows[0].cells:
+                    # 십자 가이드라인을 위한 2x2 내부 테이블
+                    guide_table = cell.add_table(rows=2, cols=2)
+                    guide_table.autofit = False
+                    if compact:
+                        # 점선과 여백은 'Hanja Guide' 스타일이 담당
+                        guide_table._tbl.tblStyle_val = guide_style_id
+                    
+                    # 4개의 셀로 십자 만들기 (내부 선만 점선, 외곽선은 없음)
+                    # 열 너비와 행 높이는 왼쪽/위쪽을 살짝 작게
+                    for i, guide_tr in enumerate(guide_table._tbl.tr_lst):
+                        for j, guide_tc in enumerate(guide_tr.tc_lst):
+                            guide_spec = {
+                                'width': int(cell_size * (0.45 if j == 0 else 0.55)),
+                                'height': (int(cell_size * (0.45 if i == 0 else 0.55)), 'exact'),
+                            }
+                            if not compact:
+                                borders = dict(NO_BORDERS)
+                                borders['bottom' if i == 0 else 'top'] = ('dotted', 6, 'CCCCCC')
+                                borders['right' if j == 0 else 'left'] = ('dotted', 6, 'CCCCCC')
+                                guide_spec.update(borders=borders, margin=0)
+                            guide_tr.replace(guide_tc, cell_fragment(**guide_spec))
+            
+            # 두 번째 행: 뜻 쓰기 칸 (가운데 정렬, 연한 배경색)
+            format_row(
+                meaning_tr, layout["meaning_height"],
+                width=cell_size,
+                shading='F5F5F5',
+                spacing={'before': Pt(2).twips, 'after': Pt(2).twips},
+                align='center',
+            )
+            
+            # 줄 간격 (마지막 줄 제외): 줄 높이를 간격에 고정한 빈 단락
+            if row_idx < rows_per_page - 1:
+                spacing = doc.add_paragraph().paragraph_format
+                spacing.line_spacing_rule = WD_LINE_SPACING.EXACTLY
+                spacing.line_spacing = Twips(layout["spacing"][row_idx])
+                spacing.space_after = Pt(0)
+    
+    add_cloned_pages(doc, num_pages, build_page)
+
+def create_diary(doc, start_date, num_days, user_info=None):
+    """다이어리 양식 생성"""
+    # 첫 페이지에 사용자 정보 추가
+    if user_info:
+        add_user_info(doc, **user_info)
+        doc.add_page_break()
+    
+    def build_day(day):
+        current_date = start_date + timedelta(days=day)
+        
+        # 날짜 헤더
+        date_header = doc.add_paragraph()
+        date_header.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        date_run = date_header.add_run(current_date.strftime("%Y년 %m월 %d일 %A"))
+        date_run.font.size = Pt(16)
+        date_run.font.bold = True
+        
+        # 날씨, 기분, 중요도
+        info_table = doc.add_table(rows=1, cols=3)
+        info_table.style = 'Light List'
+        
+        weather_cell = info_table.cell(0, 0)
+        weather_cell.text = "날씨: ☀️ ☁️ 🌧️ ❄️"
+        
+        mood_cell = info_table.cell(0, 1)
+        mood_cell.text = "기분: 😊 😐 😢 😡"
+        
+        importance_cell = info_table.cell(0, 2)
+        importance_cell.text = "중요도: ⭐⭐⭐⭐⭐"
+        
+        # 간격
+        doc.add_paragraph().paragraph_format.space_after = Pt(12)
+        
+        # 일정 표
+        schedule_title = doc.add_paragraph("📅 오늘의 일정")
+        schedule_title.runs[0].font.bold = True
+        
+        schedule_table = doc.add_table(rows=10, cols=2)
+        schedule_table.style = 'Light Grid'
+        
+        # 시간대별 일정
+        times = ["오전 7-9시", "오전 9-11시", "오전 11시-오후 1시", 
+                "오후 1-3시", "오후 3-5시", "오후 5-7시", "오후 7-9시", 
+                "오후 9-11시", "기타", "메모"]
+        
+        for i, time in enumerate(times):
+            time_cell = schedule_table.cell(i, 0)
+            time_cell.text = time
+            time_cell.width = Inches(1.5)
+            
+            content_cell = schedule_table.cell(i, 1)
+            content_cell.width = Inches(5)
+        
+        # 간격
+        doc.add_paragraph().paragraph_format.space_after = Pt(20)
+        
+        # 일기 작성 공간
+        diary_title = doc.add_paragraph("✍️ 오늘의 일기")
+        diary_title.runs[0].font.bold = True
+        diary_title.paragraph_format.space_after = Pt(12)
+        
+        # 줄 노트 추가
+        diary_table = doc.add_table(rows=15, cols=1)
+        diary_table.style = 'Normal Table'
+        
+        # 하단 선만 있는 줄
+        format_table_rows(
+            diary_table, Pt(25).twips, None,
+            width=diary_table.columns[0].width.twips,
+            borders={'top': 'nil', 'left': 'nil', 'bottom': ('single', 2, 'CCCCCC'), 'right': 'nil'},
+        )
+        
+        # 감사 일기
+        doc.add_paragraph()
+        gratitude_title = doc.add_paragraph("🙏 오늘 감사한 일 3가지")
+        gratitude_title.runs[0].font.bold = True
+        
+        for i in range(3):
+            gratitude = doc.add_paragraph(f"{i+1}. ", style='List Number')
+            gratitude.paragraph_format.space_after = Pt(12)
+    
+    def patch_date(elements, day):
+        # elements[0]은 페이지 나누기, elements[1]은 날짜 헤더
+        current_date = start_date + timedelta(days=day)
+        for t in elements[1].iter(qn('w:t')):
+            t.text = current_date.strftime("%Y년 %m월 %d일 %A")
+    
+    add_cloned_pages(doc, num_days, build_day, patch_date)
+        
+def create_calendar(doc, year, month, num_months=12, user_info=None):
+    """달력 양식 생성"""
+    layout = notebook_layout("달력", {}, document_orientation(doc))
+    
+    # 첫 페이지에 사용자 정보 추가
+    if user_info:
+        add_user_info(doc, **user_info)
+        doc.add_page_break()
+    
+    for i in range(num_months):
+        if i > 0:
+            doc.add_page_break()
+        
+        current_month = month + i
+        current_year = year
+        if current_month > 12:
+            current_year += (current_month - 1) // 12
+            current_month = ((current_month - 1) % 12) + 1
+        
+        # 월 제목
+        month_names = ['', '1월', '2월', '3월', '4월', '5월', '6월', 
+                      '7월', '8월', '9월', '10월', '11월', '12월']
+        title = doc.add_paragraph()
+        title_run = title.add_run(f"{current_year}년 {month_names[current_month]}")
+        title_run.font.size = Pt(20)
+        title_run.font.bold = True
+        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        title.paragraph_format.space_after = Pt(12)
+        
+        # 요일 헤더
+        weekdays = ['월', '화', '수', '목', '금', '토', '일']
+        
+        # 달력 테이블 생성 (요일 + 최대 6주)
+        table = doc.add_table(rows=7, cols=7)
+        table.style = 'Table Grid'
+        table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        
+        # 요일 헤더 설정
+        header_row = table.rows[0]
+        for j, day in enumerate(weekdays):
+            cell = header_row.cells[j]
+            cell.text = day
+            cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+            cell.paragraphs[0].runs[0].font.bold = True
+            
+            # 토요일은 파란색, 일요일은 빨간색
+            if j == 5:  # 토요일
+                cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(0, 0, 255)
+            elif j == 6:  # 일요일
+                cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 0, 0)
+        
+        # 달력 날짜 채우기
+        cal = calendar.monthcalendar(current_year, current_month)
+        
+        for week_num, week in enumerate(cal):
+            row = table.rows[week_num + 1]
+            for day_num, day in enumerate(week):
+                cell = row.cells[day_num]
+                
+                if day != 0:
+                    # 날짜 추가
+                    p = cell.paragraphs[0]
+                    p.alignment = WD_ALIGN_PARAGRAPH.LEFT
+                    date_run = p.add_run(str(day))
+                    date_run.font.size = Pt(10)
+                    date_run.font.bold = True
+                    
+                    # 주말 색상
+                    if day_num == 5:  # 토요일
+                        date_run.font.color.rgb = RGBColor(0, 0, 255)
+                    elif day_num == 6:  # 일요일
+                        date_run.font.color.rgb = RGBColor(255, 0, 0)
+                    
+                    # 메모 공간을 위한 줄바꿈
+                    p.add_run('\n\n\n')
+                
+                # 셀 크기 설정 (가로 용지에서는 배치 모델이 주 칸 높이를 줄임)
+                cell.width = Twips(layout["cell_width"])
+                cell._element.get_or_add_tcPr().append(cell_height_fragment(layout["week_height"], 'atLeast'))
+        
+        # 하단 메모 영역
+        doc.add_paragraph()
+        memo_title = doc.add_paragraph("📝 이달의 메모")
+        memo_title.runs[0].font.bold = True
+        memo_title.paragraph_format.space_after = Pt(6)
+        
+        memo_table = doc.add_table(rows=3, cols=1)
+        memo_table.style = 'Light List'
+        for row, height in zip(memo_table.rows, heights(layout["memo_ys"])):
+            row.height = Twips(height)
+        
+        report_progress(i + 1, num_months)
+
+def create_math_error_notebook(doc, problems_per_page=3, num_pages=5, user_info=None, compact=False):
+    """수학 오답 노트 생성 (compact=True이면 풀이 격자선을 표 스타일로 처리)"""
+    if compact:
+        register_table_styles(doc)
+    layout = notebook_layout("수학 오답노트", {"problems_per_page": problems_per_page}, document_orientation(doc))
+    
+    def build_page(page):
+        # 사용자 정보 추가
+        if user_info and page == 0:
+            add_user_info(doc, **user_info)
+        
+        # 페이지 헤더
+        header = doc.add_paragraph()
+        header_run = header.add_run(f"수학 오답 노트 - {page + 1}페이지")
+        header_run.font.size = Pt(14)
+        header_run.font.bold = True
+        header.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        header.paragraph_format.space_after = Pt(20)
+        
+        # 문제당 높이와 구성 요소별 높이는 배치 모델을 따름 (twips)
+        prob_height = layout["problem_height"]
+        solution_height = layout["solution_height"]
+        analysis_height = layout["analysis_height"]
+        
+        # 각 문제별 섹션
+        for prob_num in range(problems_per_page):
+            # 문제 정보 테이블
+            info_table = doc.add_table(rows=1, cols=4)
+            info_table.style = 'Table Grid'
+            
+            # 문제 번호
+            prob_cell = info_table.cell(0, 0)
+            prob_cell.width = Inches(1.5)
+            prob_p = prob_cell.paragraphs[0]
+            prob_p.add_run("문제 번호:").bold = True
+            
+            # 날짜
+            date_cell = info_table.cell(0, 1)
+            date_cell.width = Inches(1.5)
+            date_p = date_cell.paragraphs[0]
+            date_p.add_run("날짜:").bold = True
+            
+            # 출처
+            source_cell = info_table.cell(0, 2)
+            source_cell.width = Inches(2)
+            source_p = source_cell.paragraphs[0]
+            source_p.add_run("출처:").bold = True
+            
+            # 난이도
+            level_cell = info_table.cell(0, 3)
+            level_cell.width = Inches(1.5)
+            level_p = level_cell.paragraphs[0]
+            level_p.add_run("난이도: ⭐⭐⭐⭐⭐").bold = True
+            
+            # 간격
+            spacing1 = doc.add_paragraph()
+            spacing1.paragraph_format.space_after = Pt(6)
+            
+            # 문제 영역
+            prob_title = doc.add_paragraph("📝 문제")
+            prob_title.runs[0].font.bold = True
+            prob_title.runs[0].font.size = Pt(11)
+            prob_title.paragraph_format.space_after = Pt(4)
+            
+            prob_table = doc.add_table(rows=1, cols=1)
+            prob_table.style = 'Table Grid'
+            prob_content_cell = prob_table.cell(0, 0)
+            
+            # 문제 영역 높이 설정 (문제 수에 따라 조정)
+            tcPr = prob_content_cell._element.get_or_add_tcPr()
+            tcPr.append(cell_height_fragment(prob_height))
+            
+            # 문제 영역 배경색
+            tcPr.append(shading_fragment('F0F8FF'))
+            
+            # 간격
+            spacing2 = doc.add_paragraph()
+            spacing2.paragraph_format.space_after = Pt(6)
+            
+            # 풀이 과정 영역
+            solution_title = doc.add_paragraph("✏️ 풀이 과정")
+            solution_title.runs[0].font.bold = True
+            solution_title.runs[0].font.size = Pt(11)
+            solution_title.paragraph_format.space_after = Pt(4)
+            
+            # 격자 노트 스타일 테이블 (문제 수에 따라 행 수 조정)
+            grid_rows = max(6, int(20 / problems_per_page))
+            solution_table = doc.add_table(rows=grid_rows, cols=15)
+            solution_table.style = 'Light Grid Line' if compact else 'Table Grid'
+            solution_table.alignment = WD_TABLE_ALIGNMENT.CENTER
+            
+            # 각 행의 높이를 문제 수에 따라 조정
+            row_height = solution_height // grid_rows
+            
+            if compact:
+                # 연한 격자선은 'Light Grid Line' 스타일이 담당
+                format_table_rows(solution_table, row_height, width=Pt(30).twips)
+            else:
+                # 연한 격자선
+                format_table_rows(
+                    solution_table, row_height,
+                    width=Pt(30).twips,
+                    borders={side: ('single', 2, 'E0E0E0') for side in BORDER_SIDES},
+                )
+            
+            # 간격
+            spacing3 = doc.add_paragraph()
+            spacing3.paragraph_format.space_after = Pt(6)
+            
+            # 오답 원인 및 핵심 포인트
+            analysis_table = doc.add_table(rows=1, cols=2)
+            analysis_table.style = 'Table Grid'
+            
+            # 오답 원인
+            cause_cell = analysis_table.cell(0, 0)
+            cause_cell.width = Inches(3.25)
+            cause_p = cause_cell.paragraphs[0]
+            cause_p.add_run("❌ 오답 원인").bold = True
+            cause_p.add_run("\n\n□ 개념 이해 부족\n□ 계산 실수\n□ 문제 해석 오류\n□ 시간 부족\n□ 기타:")
+            
+            # 핵심 포인트
+            point_cell = analysis_table.cell(0, 1)
+            point_cell.width = Inches(3.25)
+            point_p = point_cell.paragraphs[0]
+            point_p.add_run("💡 핵심 포인트").bold = True
+            point_p.add_run("\n\n")
+            
+            # 셀 높이 설정
+            for cell in [cause_cell, point_cell]:
+                cell._element.get_or_add_tcPr().append(cell_height_fragment(analysis_height))
+            
+            # 문제 구분선 (마지막 문제 제외)
+            if prob_num < problems_per_page - 1:
+                separator = doc.add_paragraph("─" * 50)
+                separator.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                separator.paragraph_format.space_before = Pt(8)
+                separator.paragraph_format.space_after = Pt(8)
+    
+    def patch_header(elements, page):
+        # elements[0]은 페이지 나누기, elements[1]은 페이지 헤더
+        for t in elements[1].iter(qn('w:t')):
+            t.text = f"수학 오답 노트 - {page + 1}페이지"
+    
+    add_cloned_pages(doc, num_pages, build_page, patch_header)
+
+def build_notebook(doc, notebook_type, options, user_info=None):
+    """노트 종류에 맞는 생성 함수로 본문 작성"""
+    if notebook_type == "줄공책":
+        create_lined_notebook(doc, options["lines_per_page"], options["num_pages"], user_info,
+                              compact=options.get("compact", False), lean=options.get("lean", False))
+    elif notebook_type == "칸공책":
+        create_grid_notebook(doc, options["rows"], options["cols"], options["num_pages"], user_info,
+                             lean=options.get("lean", False))
+    elif notebook_type == "영어노트 (4선)":
+        create_english_notebook(doc, options["lines_per_page"], options["num_pages"], user_info)
+    elif notebook_type == "코넬노트":
+        create_cornell_notebook(doc, options["num_pages"], user_info)
+    elif notebook_type == "음악 오선지":
+        create_music_staff(doc, options["staves_per_page"], options["num_pages"], user_info,
+                           compact=options.get("compact", False))
+    elif notebook_type == "한자노트":
+        create_chinese_notebook(doc, options["rows_per_page"], options["chars_per_row"],
+                                options["num_pages"], user_info, compact=options.get("compact", False),
+                                lean=options.get("lean", False))
+    elif notebook_type == "다이어리":
+        create_diary(doc, options["start_date"], options["num_days"], user_info)
+    elif notebook_type == "달력":
+        create_calendar(doc, options["year"], options["month"], options["num_months"], user_info)
+    elif notebook_type == "수학 오답노트":
+        create_math_error_notebook(doc, options["problems_per_page"], options["num_pages"], user_info,
+                                   compact=options.get("compact", False))
+    else:
+        raise ValueError(f"알 수 없는 노트 종류: {notebook_type}")
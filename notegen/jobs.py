@@ -0,0 +1,104 @@
+"""노트 생성을 백그라운드 스레드에서 돌리고 진행률, 취소, 방치된 작업 정리를 맡는 작업 객체"""
+import threading
+import time
+
+from .progress import GenerationCancelled, progress_scope
+
+class GenerationJob:
+    """함수 하나를 백그라운드에서 실행하며 진행률을 모으고 취소를 받는 작업
+
+    run(report)은 생성 함수(예: spool_notebook을 감싼 함수)로, 안에서 부르는
+    report_progress(done, total)가 이 작업의 진행률이 된다.
+    cancel()을 부르거나 max_idle초 동안 touch()가 없으면(화면을 떠난 사용자)
+    다음 페이지 경계에서 GenerationCancelled로 생성을 멈춘다.
+    같은 작업을 여러 사용자가 기다리면(add_waiter) 모두 cancel()해야 멈춘다.
+    on_finish(job)가 주어지면 실행을 마친 뒤(성공, 취소, 실패 모두) 생성 스레드에서 호출한다.
+    """
+    
+    def __init__(self, run, max_idle=None, on_finish=None):
+        self.status = "pending"  # pending, running, done, cancelled, failed
+        self.done = 0
+        self.total = 0
+        self.report = {}
+        self.result = None
+        self.error = None
+        self.waiters = 1
+        self._run = run
+        self._max_idle = max_idle
+        self._on_finish = on_finish
+        self._cancel = threading.Event()
+        self._waiters_lock = threading.Lock()
+        self._finished = threading.Event()
+        self._last_seen = time.monotonic()
+        self._thread = threading.Thread(target=self._work, name="notegen-job", daemon=True)
+    
+    def start(self):
+        """백그라운드 스레드에서 실행 시작"""
+        self.status = "running"
+        self._thread.start()
+        return self
+    
+    def touch(self):
+        """작업을 아직 기다리는 사용자가 있음을 알림"""
+        self._last_seen = time.monotonic()
+    
+    def add_waiter(self):
+        """같은 작업을 기다리는 사용자를 하나 더함"""
+        with self._waiters_lock:
+            self.waiters += 1
+    
+    def cancel(self):
+        """기다리는 사용자 하나의 취소 (마지막 사용자가 취소하면 abort)"""
+        with self._waiters_lock:
+            self.waiters -= 1
+            if self.waiters > 0:
+                return
+        self.abort()
+    
+    def abort(self):
+        """기다리는 사용자와 관계없이 다음 페이지 경계에서 멈추도록 요청 (아직 시작 전이면 바로 취소됨)"""
+        self._cancel.set()
+        if self.status == "pending":
+            self.status = "cancelled"
+            self._finished.set()
+    
+    def wait(self, timeout=None):
+        """작업이 끝날 때까지 기다리고 끝났는지 반환"""
+        return self._finished.wait(timeout)
+    
+    @property
+    def finished(self):
+        return self._finished.is_set()
+    
+    @property
+    def idle(self):
+        """max_idle초 넘게 touch()가 없었는지 (화면을 떠난 사용자의 작업)"""
+        return self._max_idle is not None and time.monotonic() - self._last_seen > self._max_idle
+    
+    @property
+    def fraction(self):
+        """0~1 사이 진행률 (아직 알림이 없으면 0)"""
+        return self.done / self.total if self.total else 0.0
+    
+    def _on_progress(self, done, total):
+        # 생성 스레드에서 페이지마다 호출: 진행률 기록과 취소 확인
+        self.done, self.total = done, total
+        if self.idle:
+            self._cancel.set()
+        if self._cancel.is_set():
+            raise GenerationCancelled()
+    
+    def _work(self):
+        try:
+            with progress_scope(self._on_progress):
+                self.result = self._run(self.report)
+            self.status = "done"
+        except GenerationCancelled:
+            self.status = "cancelled"
+        except Exception as e:
+            self.error = e
+            self.status = "failed"
+        finally:
+            self._finished.set()
+            if self._on_finish is not None:
+                self._on_finish(self)
@@ -0,0 +1,189 @@
+"""용지, 여백과 노트별 선/행/칸 위치를 정하는 공통 배치 모델
+
+docx 생성 함수, PDF, 미리보기가 모두 같은 배치를 쓴다.
+좌표와 길이는 모두 정수 twips(1/1440인치)이고 왼쪽 위가 원점이다.
+반복되는 선의 위치는 간격을 더해 나가지 않고 영역 전체를 나눠 한 번에 계산하므로
+줄 수가 많아도 반올림 오차가 쌓이지 않고 마지막 선이 영역 끝에 정확히 맞는다.
+"""
+from functools import lru_cache
+
+# 용지 크기 (A4 세로, twips)
+A4_TWIPS = (11906, 16838)
+MARGIN = 720  # 0.5인치
+
+# 본문 위/아래에 남겨 두는 공간 (twips)
+#   줄공책, 칸공책: 페이지 상단 빈 단락 (칸공책은 사용자 정보 자리 포함)
+#   그 밖의 노트: 페이지 상단 빈 단락과 사용자 정보 (1.5인치)
+TOP_SPACE = {"줄공책": 800, "칸공책": 1040}
+HEADER_SPACE = 2160
+FOOTER_SPACE = 400  # 푸터 단락이 아래 여백을 넘어 본문을 밀어 올리는 만큼
+
+# 모든 페이지 하단 문구
+FOOTER_TEXT = "세계교육 표준으로 삶의 힘을 키우는 따뜻한 경북교육"
+
+LINE_PITCH = 560  # 줄공책 줄 간격 28pt
+
+# 줄/오선/한자 행 하나에서 각 부분이 차지하는 비율
+ENGLISH_LINE_RATIOS = (0.2, 0.2, 0.3, 0.3)  # 상단 점선, 상단 실선, 기준선, 하단 실선
+ENGLISH_LINE_SHARE = 0.8  # 나머지 20%는 줄 사이 간격
+STAFF_SHARE = 0.4  # 나머지 60%는 오선 사이 간격
+HANJA_CELL_SHARE, HANJA_MEANING_SHARE = 0.7, 0.2  # 나머지 10%는 행 사이 간격
+
+# 달력 칸 크기 (twips)
+CALENDAR_CELL_WIDTH = 1440  # 1인치
+CALENDAR_HEADER_HEIGHT = 400
+CALENDAR_WEEK_HEIGHT = 1500
+CALENDAR_TITLE_SPACE = 1200  # 월 제목
+CALENDAR_MEMO_SPACE = 3200  # 이달의 메모 제목과 3줄
+CALENDAR_MEMO_ROW_HEIGHT = 800
+
+def page_geometry(orientation="세로"):
+    """용지 방향에 맞는 용지 크기, 여백과 본문 영역 (twips)"""
+    width, height = A4_TWIPS
+    if orientation == "가로":
+        width, height = height, width
+    return {
+        "width": width,
+        "height": height,
+        "margin": MARGIN,
+        "area_width": width - 2 * MARGIN,
+        "area_height": height - 2 * MARGIN,
+    }
+
+def divide(start, length, parts):
+    """start부터 length를 parts 칸으로 나눈 경계 parts+1개 (정수, 끝은 정확히 start+length)"""
+    return tuple(start + length * i // parts for i in range(parts + 1))
+
+def heights(boundaries):
+    """경계 목록에서 칸마다의 높이 (docx 행 높이용)"""
+    return [b - a for a, b in zip(boundaries, boundaries[1:])]
+
+def _body(page, notebook_type):
+    # 선을 그리는 본문 영역의 위/아래 경계
+    top = page["margin"] + TOP_SPACE.get(notebook_type, HEADER_SPACE)
+    bottom = page["height"] - page["margin"] - FOOTER_SPACE
+    return top, bottom
+
+def _lined(page, top, bottom, options):
+    # 28pt 간격, 줄이 많아 본문을 넘으면 간격을 줄여 한 페이지에 맞춤
+    lines = options["lines_per_page"]
+    pitch = min(LINE_PITCH, (bottom - top) // lines)
+    return {
+        "pitch": pitch,
+        "left": page["margin"],
+        "width": page["area_width"],
+        "line_ys": tuple(top + pitch * (line + 1) for line in range(lines)),
+    }
+
+def _grid(page, top, bottom, options):
+    # 본문 전체를 rows x cols로 나눈 격자 (열은 같은 너비로 가운데), 경량 모드는 가운데 정사각형 격자
+    rows, cols = options["rows"], options["cols"]
+    area_width = page["area_width"]
+    cell_width = area_width // cols
+    left = page["margin"] + (area_width - cell_width * cols) // 2
+    cell_size = min(cell_width, (bottom - top) // rows)
+    return {
+        "cell_width": cell_width,
+        "col_xs": tuple(left + cell_width * col for col in range(cols + 1)),
+        "row_ys": divide(top, bottom - top, rows),
+        "cell_size": cell_size,
+        "square_left": (area_width - cell_size * cols) // 2,
+    }
+
+def _english(page, top, bottom, options):
+    # 줄마다 4선의 y 위치 (줄의 시작은 본문을 줄 수로 나눈 경계)
+    lines = options["lines_per_page"]
+    starts = divide(top, bottom - top, lines)
+    line_ys = []
+    for start, end in zip(starts, starts[1:]):
+        line_height = (end - start) * ENGLISH_LINE_SHARE
+        offset = 0
+        ys = []
+        for ratio in ENGLISH_LINE_RATIOS:
+            offset += ratio
+            ys.append(start + round(line_height * offset))
+        line_ys.append(tuple(ys))
+    return {"left": page["margin"], "width": page["area_width"], "line_ys": tuple(line_ys)}
+
+def _music(page, top, bottom, options):
+    # 오선마다 다섯 줄의 y 위치
+    staves = options["staves_per_page"]
+    starts = divide(top, bottom - top, staves)
+    staff_ys = tuple(
+        tuple(start + round((end - start) * STAFF_SHARE * (line + 1) / 5) for line in range(5))
+        for start, end in zip(starts, starts[1:])
+    )
+    return {"left": page["margin"], "width": page["area_width"], "staff_ys": staff_ys}
+
+def _hanja(page, top, bottom, options):
+    # 행마다 정사각형 한자 칸 + 뜻 칸, 칸 수가 많으면 본문 너비에 맞게 칸을 줄임
+    rows, chars = options["rows_per_page"], options["chars_per_row"]
+    starts = divide(top, bottom - top, rows)
+    row_height = (bottom - top) // rows
+    cell_size = min(int(row_height * HANJA_CELL_SHARE), page["area_width"] // chars)
+    meaning_height = int(row_height * HANJA_MEANING_SHARE)
+    return {
+        "chars_per_row": chars,
+        "cell_size": cell_size,
+        "meaning_height": meaning_height,
+        "left": (page["width"] - cell_size * chars) // 2,
+        "row_ys": starts[:-1],
+        "spacing": tuple(end - start - cell_size - meaning_height for start, end in zip(starts, starts[1:])),
+    }
+
+def _calendar(page, top, bottom, options):
+    # 월 제목 아래 요일 머리행과 6주 칸, 그 아래 이달의 메모
+    # 가로 용지처럼 높이가 모자라면 주 칸 높이를 줄여 한 페이지에 맞춤
+    top = page["margin"] + CALENDAR_TITLE_SPACE
+    week_height = min(CALENDAR_WEEK_HEIGHT,
+                      (bottom - top - CALENDAR_HEADER_HEIGHT - CALENDAR_MEMO_SPACE) // 6)
+    row_ys = (top,) + divide(top + CALENDAR_HEADER_HEIGHT, 6 * week_height, 6)
+    memo_top = row_ys[-1] + CALENDAR_MEMO_ROW_HEIGHT
+    return {
+        "cell_width": CALENDAR_CELL_WIDTH,
+        "header_height": CALENDAR_HEADER_HEIGHT,
+        "week_height": week_height,
+        "left": (page["width"] - 7 * CALENDAR_CELL_WIDTH) // 2,
+        "top": top,
+        "row_ys": row_ys,
+        "memo_ys": divide(memo_top, 3 * CALENDAR_MEMO_ROW_HEIGHT, 3),
+    }
+
+def _math(page, top, bottom, options):
+    # 문제마다 같은 높이, 그 안을 정보/문제/풀이/분석/구분선 비율로 나눔
+    problems = options["problems_per_page"]
+    section_height = (bottom - top) // problems
+    return {
+        "section_height": section_height,
+        "problem_height": int(section_height * 0.25),
+        "solution_height": int(section_height * 0.45),
+        "analysis_height": int(section_height * 0.17),
+    }
+
+_LAYOUTS = {
+    "줄공책": _lined,
+    "칸공책": _grid,
+    "영어노트 (4선)": _english,
+    "음악 오선지": _music,
+    "한자노트": _hanja,
+    "달력": _calendar,
+    "수학 오답노트": _math,
+}
+
+@lru_cache(maxsize=256)
+def _cached_layout(notebook_type, orientation, option_items):
+    page = page_geometry(orientation)
+    top, bottom = _body(page, notebook_type)
+    layout = {"page": page, "top": top, "bottom": bottom}
+    build = _LAYOUTS.get(notebook_type)
+    if build is not None:
+        layout.update(build(page, top, bottom, dict(option_items)))
+    return layout
+
+def notebook_layout(notebook_type, options, orientation="세로"):
+    """노트 종류, 옵션, 용지 방향에 맞는 배치 (twips)
+
+    같은 설정이면 캐시된 같은 dict를 돌려주므로 값을 바꾸지 말고 읽기만 한다.
+    배치가 정해지지 않은 노트(코넬노트, 다이어리)는 용지와 본문 경계만 들어 있다.
+    """
+    return _cached_layout(notebook_type, orientation, tuple(sorted(options.items())))
@@ -0,0 +1,115 @@
+"""설정(config) 하나로 노트 문서를 만드는 진입점"""
+import io
+import tempfile
+
+from .catalog import SPILL_BYTES, STREAMABLE_TYPES
+from .diagnostics import document_stats, log_generation, timed_phase
+from .document import new_document, save_document
+from .generators import build_notebook
+from .pdf import notebook_pages, page_size, write_pdf
+from .progress import progress_scope
+from .streaming import save_streamed
+
+def generate_notebook(config, report=None, stats=False):
+    """설정(config)대로 노트를 만들어 .docx 바이트로 반환
+
+    config는 notebook_type, orientation, user_info, options, streaming 키를 가진다.
+    output_format이 "pdf"이면 python-docx 없이 PDF로 그린다 (PDF_TYPES만).
+    streaming은 STREAMABLE_TYPES만 쓸 수 있고, 그 밖의 노트에 켜면 ValueError.
+    report에 dict를 넘기면 단계별 시간(seconds), 바이트 크기(bytes)를 채운다.
+    문서 복잡도(report["stats"])는 본문 전체를 세느라 큰 문서에서 시간이 꽤 들므로 stats=True일 때만 센다
+    (PDF는 그린 도형 수라서 늘 채움).
+    같은 내용은 notegen 로거에 한 줄 JSON으로도 기록된다.
+    """
+    if report is None:
+        report = {}
+    output = io.BytesIO()
+    _write_notebook(config, output, report, stats)
+    with timed_phase(report, "getvalue"):
+        data = output.getvalue()
+    _finish_report(config, report, len(data))
+    return data
+
+def write_notebook(config, output, report=None, stats=False):
+    """설정(config)대로 만든 노트를 바이너리 파일 객체 output에 바로 기록하고 바이트 수를 반환
+
+    BytesIO를 거쳐 한 번 더 복사하지 않으므로 큰 문서를 파일이나 응답 스트림에 쓸 때 쓴다.
+    config, report, stats는 generate_notebook과 같다.
+    """
+    if report is None:
+        report = {}
+    start = output.tell()
+    _write_notebook(config, output, report, stats)
+    size = output.tell() - start
+    _finish_report(config, report, size)
+    return size
+
+def spool_notebook(config, report=None, max_memory=SPILL_BYTES, stats=False):
+    """노트를 만들어 max_memory 바이트 이하면 bytes로, 넘으면 처음으로 되감은 임시 파일로 반환
+
+    큰 문서는 디스크의 임시 파일에만 있으므로 메모리에 한 벌도 남지 않는다.
+    임시 파일은 닫거나 참조가 사라지면 지워진다.
+    """
+    if report is None:
+        report = {}
+    output = tempfile.SpooledTemporaryFile(max_size=max_memory)
+    size = write_notebook(config, output, report, stats)
+    output.seek(0)
+    if size > max_memory:
+        return output
+    with output:
+        return output.read()
+
+def _write_notebook(config, output, report, stats):
+    # 문서를 만들어 output에 저장 (report에 단계별 시간, stats이면 복잡도도 기록)
+    if config.get("output_format") == "pdf":
+        _write_pdf(config, output, report)
+        return
+    options = config["options"]
+    
+    with timed_phase(report, "document"):
+        doc = new_document(config["orientation"], config.get("letterhead"))
+    
+    if config.get("streaming"):
+        if config["notebook_type"] not in STREAMABLE_TYPES:
+            raise ValueError(f"스트리밍으로 기록할 수 없는 노트 종류: {config['notebook_type']}")
+        # 두 페이지만 만들고 나머지는 스트리밍으로 기록
+        # (진행률은 전체 페이지 기준인 스트리밍 기록에서만 알림)
+        with timed_phase(report, "build"), progress_scope(None):
+            build_notebook(doc, config["notebook_type"], dict(options, num_pages=min(options["num_pages"], 2)),
+                           config["user_info"])
+        if stats:
+            with timed_phase(report, "stats"):
+                report["stats"] = document_stats(doc)
+        with timed_phase(report, "save"):
+            save_streamed(doc, options["num_pages"], output, config["notebook_type"])
+    else:
+        # 선택된 노트 종류에 따라 생성
+        with timed_phase(report, "build"):
+            build_notebook(doc, config["notebook_type"], options, config["user_info"])
+        if stats:
+            with timed_phase(report, "stats"):
+                report["stats"] = document_stats(doc)
+        
+        # output에 바로 저장
+        with timed_phase(report, "save"):
+            save_document(doc, output)
+
+def _write_pdf(config, output, report):
+    # PDF 경로: 페이지별 도형 계산(build)과 PDF 기록(save)
+    with timed_phase(report, "build"):
+        pages = notebook_pages(config)
+    with timed_phase(report, "save"):
+        write_pdf(pages, page_size(config["orientation"]), output)
+    unique_pages = {id(shapes): shapes for shapes in pages}.values()
+    report["stats"] = {
+        "pages": len(pages),
+        "content_streams": len(unique_pages),
+        "shapes": sum(len(shapes) for shapes in unique_pages),
+    }
+
+def _finish_report(config, report, size):
+    # 전체 시간과 크기를 채우고 로그 기록
+    report["total_seconds"] = sum(report["seconds"].values())
+    report["bytes"] = size
+    log_generation(config, report)
@@ -0,0 +1,305 @@
+"""python-docx 없이 노트 양식을 벡터 PDF로 바로 그리는 출력 백엔드
+
+선, 격자, 오선, 한자 가이드, 달력 칸을 PDF 경로 연산자로 그린다.
+내용이 같은 페이지는 content stream 하나를 함께 참조하므로 페이지 수가 늘어도 파일이 거의 커지지 않는다.
+한글은 글꼴을 넣지 않는 Adobe 표준 한글 CID 글꼴(HYSMyeongJo-Medium)로 표시한다.
+"""
+import calendar
+import io
+import zlib
+
+from .layout import FOOTER_TEXT, MARGIN as MARGIN_TWIPS, notebook_layout, page_geometry
+
+# 용지 여백 (pt)
+MARGIN = MARGIN_TWIPS / 20
+
+# 도형 (좌표는 왼쪽 위 기준 pt)
+#   ('line', x1, y1, x2, y2, width, color, dash)
+#   ('rect', x, y, w, h, width, color, fill)      width가 0이면 채우기만
+#   ('text', x, y, text, size, color, align, bold)  y는 글자 기준선, align은 'left'/'center'/'right'
+
+def page_size(orientation="세로"):
+    """용지 방향에 맞는 (가로, 세로) pt (배치 모델의 A4 용지)"""
+    page = page_geometry(orientation)
+    return (page["width"] / 20, page["height"] / 20)
+
+def _pt(twips):
+    return twips / 20
+
+def _text_width(text, size):
+    # 영문/숫자는 반각, 나머지(한글)는 전각으로 계산 (/W 배열과 같은 값)
+    return size * sum(0.5 if ord(char) < 128 else 1.0 for char in text)
+
+def _frame_shapes(size, page, user_info):
+    # 모든 페이지 공통: 첫 페이지 사용자 정보와 하단 문구
+    width, height = size
+    shapes = []
+    if user_info and page == 0:
+        info = [user_info.get("school_name"), user_info.get("grade"), user_info.get("class_num")]
+        if user_info.get("student_name"):
+            info.append(f"이름: {user_info['student_name']}")
+        text = "   ".join(item for item in info if item)
+        if text:
+            shapes.append(('text', width - MARGIN, MARGIN + 12, text, 10, '000000', 'right', False))
+            shapes.append(('line', MARGIN, MARGIN + 22, width - MARGIN, MARGIN + 22, 0.5, '808080', None))
+    shapes.append(('text', width / 2, height - 22, FOOTER_TEXT, 9, '808080', 'center', False))
+    return shapes
+
+def _lined_shapes(layout):
+    # 배치 모델의 줄 간격(28pt, 줄이 많으면 줄임)으로 그린 회색 줄
+    left, right = _pt(layout["left"]), _pt(layout["left"] + layout["width"])
+    return [('line', left, _pt(y), right, _pt(y), 0.5, '808080', None) for y in layout["line_ys"]]
+
+def _grid_shapes(layout):
+    # 본문 영역을 rows x cols로 나눈 검은 격자
+    row_ys, col_xs = layout["row_ys"], layout["col_xs"]
+    top, bottom = _pt(row_ys[0]), _pt(row_ys[-1])
+    left, right = _pt(col_xs[0]), _pt(col_xs[-1])
+    shapes = [('line', left, _pt(y), right, _pt(y), 0.5, '000000', None) for y in row_ys]
+    shapes.extend(('line', _pt(x), top, _pt(x), bottom, 0.5, '000000', None) for x in col_xs)
+    return shapes
+
+def _square_grid_shapes(layout):
+    # 경량 모드 칸공책: docx 격자 도형과 같은 정사각형 칸 (본문 위쪽, 여백 기준 square_left만큼 안쪽)
+    rows, cols = len(layout["row_ys"]) - 1, len(layout["col_xs"]) - 1
+    cell_size = layout["cell_size"]
+    left = layout["page"]["margin"] + layout["square_left"]
+    top = layout["row_ys"][0]
+    row_ys = [top + cell_size * row for row in range(rows + 1)]
+    col_xs = [left + cell_size * col for col in range(cols + 1)]
+    shapes = [('line', _pt(left), _pt(y), _pt(col_xs[-1]), _pt(y), 0.5, '000000', None) for y in row_ys]
+    shapes.extend(('line', _pt(x), _pt(top), _pt(x), _pt(row_ys[-1]), 0.5, '000000', None) for x in col_xs)
+    return shapes
+
+def _english_shapes(layout):
+    # 줄마다 상단 점선, 상단 실선, 굵은 기준선, 하단 실선
+    line_styles = [
+        (0.5, 'CCCCCC', 'dot'),
+        (0.5, '808080', None),
+        (0.75, '000000', None),
+        (0.5, '808080', None),
+    ]
+    left, right = _pt(layout["left"]), _pt(layout["left"] + layout["width"])
+    shapes = []
+    for ys in layout["line_ys"]:
+        for y, (line_width, color, dash) in zip(ys, line_styles):
+            shapes.append(('line', left, _pt(y), right, _pt(y), line_width, color, dash))
+    return shapes
+
+def _music_shapes(layout):
+    # 오선마다 다섯 줄
+    left, right = _pt(layout["left"]), _pt(layout["left"] + layout["width"])
+    return [('line', left, _pt(y), right, _pt(y), 0.75, '000000', None)
+            for ys in layout["staff_ys"] for y in ys]
+
+def _hanja_shapes(layout):
+    # 행마다 정사각형 한자 칸(점선 십자)과 뜻 칸
+    chars_per_row = layout["chars_per_row"]
+    cell_size, meaning_height = _pt(layout["cell_size"]), _pt(layout["meaning_height"])
+    left = _pt(layout["left"])
+    right = left + cell_size * chars_per_row
+    shapes = []
+    for row_y in layout["row_ys"]:
+        y = _pt(row_y)
+        for char in range(chars_per_row):
+            x = left + char * cell_size
+            shapes.append(('rect', x, y + cell_size, cell_size, meaning_height, 0, None, 'F5F5F5'))
+            shapes.append(('line', x, y + cell_size / 2, x + cell_size, y + cell_size / 2, 0.75, 'CCCCCC', 'dot'))
+            shapes.append(('line', x + cell_size / 2, y, x + cell_size / 2, y + cell_size, 0.75, 'CCCCCC', 'dot'))
+        # 칸 테두리는 행 전체를 선으로 한 번에
+        for line_y in (y, y + cell_size, y + cell_size + meaning_height):
+            shapes.append(('line', left, line_y, right, line_y, 0.5, '000000', None))
+        for char in range(chars_per_row + 1):
+            x = left + char * cell_size
+            shapes.append(('line', x, y, x, y + cell_size + meaning_height, 0.5, '000000', None))
+    return shapes
+
+def _calendar_shapes(size, layout, year, month):
+    # 월 제목, 요일 머리행, 6주 날짜 칸, 이달의 메모 3줄 (칸 크기와 위치는 배치 모델)
+    width, _ = size
+    colors = {5: '0000FF', 6: 'FF0000'}  # 토요일 파란색, 일요일 빨간색
+    cell_width = _pt(layout["cell_width"])
+    left = _pt(layout["left"])
+    right = left + 7 * cell_width
+    row_ys = [_pt(y) for y in layout["row_ys"]]
+    top = row_ys[0]
+
+    shapes = [('text', width / 2, top - 8, f"{year}년 {month}월", 20, '000000', 'center', True)]
+    for day, name in enumerate(['월', '화', '수', '목', '금', '토', '일']):
+        x = left + day * cell_width + cell_width / 2
+        shapes.append(('text', x, top + 14, name, 11, colors.get(day, '000000'), 'center', True))
+    for week, days in enumerate(calendar.monthcalendar(year, month)):
+        y = row_ys[week + 1]
+        for day_num, day in enumerate(days):
+            if day:
+                shapes.append(('text', left + day_num * cell_width + 5, y + 13, str(day), 10,
+                               colors.get(day_num, '000000'), 'left', True))
+
+    for row_y in row_ys:
+        shapes.append(('line', left, row_y, right, row_y, 0.5, '000000', None))
+    for col in range(8):
+        x = left + col * cell_width
+        shapes.append(('line', x, top, x, row_ys[-1], 0.5, '000000', None))
+
+    memo_ys = [_pt(y) for y in layout["memo_ys"]]
+    shapes.append(('text', left, memo_ys[0] - 8, "이달의 메모", 11, '000000', 'left', True))
+    for row, y in enumerate(memo_ys):
+        shapes.append(('line', left, y, right, y, 1 if row in (0, 3) else 0.5, '000000', None))
+    return shapes
+
+def notebook_pages(config):
+    """config의 페이지마다 도형 목록을 반환 (내용이 같은 페이지는 같은 목록 객체를 공유)"""
+    notebook_type = config["notebook_type"]
+    options = config["options"]
+    user_info = config["user_info"]
+    size = page_size(config["orientation"])
+    layout = notebook_layout(notebook_type, options, config["orientation"])
+
+    if notebook_type == "달력":
+        # docx처럼 사용자 정보는 따로 첫 페이지에 두고 달마다 한 페이지
+        pages = [_frame_shapes(size, 0, user_info)] if user_info else []
+        for i in range(options["num_months"]):
+            year = options["year"] + (options["month"] + i - 1) // 12
+            month = (options["month"] + i - 1) % 12 + 1
+            pages.append(_frame_shapes(size, 1, user_info) + _calendar_shapes(size, layout, year, month))
+        return pages
+
+    body = {
+        "줄공책": _lined_shapes,
+        "칸공책": _grid_shapes,
+        "영어노트 (4선)": _english_shapes,
+        "음악 오선지": _music_shapes,
+        "한자노트": _hanja_shapes,
+    }.get(notebook_type)
+    if body is None:
+        raise ValueError(f"PDF로 만들 수 없는 노트 종류: {notebook_type}")
+
+    if notebook_type == "칸공책" and options.get("lean"):
+        shapes = _square_grid_shapes(layout)
+    else:
+        shapes = body(layout)
+    first_page = _frame_shapes(size, 0, user_info) + shapes
+    other_pages = _frame_shapes(size, 1, user_info) + shapes
+    return [first_page] + [other_pages] * (options["num_pages"] - 1)
+
+def _color(color):
+    return " ".join(f"{int(color[i:i + 2], 16) / 255:.3g}" for i in (0, 2, 4))
+
+def _content_stream(shapes, height):
+    # 도형 목록을 PDF 연산자로 변환 (선 굵기/색/점선 상태가 바뀔 때만 기록)
+    ops = []
+    state = {}
+
+    def set_state(name, value, op):
+        if state.get(name) != value:
+            state[name] = value
+            ops.append(op)
+
+    for shape in shapes:
+        kind = shape[0]
+        if kind == 'line':
+            _, x1, y1, x2, y2, width, color, dash = shape
+            set_state('w', width, f"{width:g} w")
+            set_state('RG', color, f"{_color(color)} RG")
+            set_state('d', dash, "[0.75 1.5] 0 d" if dash else "[] 0 d")
+            ops.append(f"{x1:.2f} {height - y1:.2f} m {x2:.2f} {height - y2:.2f} l S")
+        elif kind == 'rect':
+            _, x, y, w, h, width, color, fill = shape
+            paint = "f"
+            if fill:
+                set_state('rg', fill, f"{_color(fill)} rg")
+            if width:
+                set_state('w', width, f"{width:g} w")
+                set_state('RG', color, f"{_color(color)} RG")
+                set_state('d', None, "[] 0 d")
+                paint = "B" if fill else "S"
+            ops.append(f"{x:.2f} {height - y - h:.2f} {w:.2f} {h:.2f} re {paint}")
+        elif kind == 'text':
+            _, x, y, text, size, color, align, bold = shape
+            if align == 'center':
+                x -= _text_width(text, size) / 2
+            elif align == 'right':
+                x -= _text_width(text, size)
+            encoded = "".join(f"{ord(char):04X}" for char in text if ord(char) <= 0xFFFF)
+            set_state('rg', color, f"{_color(color)} rg")
+            if bold:
+                # 굵은 글꼴이 없으므로 글자 외곽선을 함께 그려 굵게 표시
+                set_state('RG', color, f"{_color(color)} RG")
+                set_state('w', size * 0.03, f"{size * 0.03:g} w")
+            ops.append(f"BT /F1 {size:g} Tf {2 if bold else 0} Tr {x:.2f} {height - y:.2f} Td <{encoded}> Tj ET")
+    return "\n".join(ops).encode("ascii")
+
+# 글꼴을 넣지 않는 한글 CID 글꼴 (Adobe-Korea1, 유니코드 UCS-2 인코딩)
+_FONT_OBJECTS = [
+    b"<< /Type /Font /Subtype /Type0 /BaseFont /HYSMyeongJo-Medium /Encoding /UniKS-UCS2-H "
+    b"/DescendantFonts [4 0 R] >>",
+    b"<< /Type /Font /Subtype /CIDFontType0 /BaseFont /HYSMyeongJo-Medium "
+    b"/CIDSystemInfo << /Registry (Adobe) /Ordering (Korea1) /Supplement 1 >> "
+    b"/FontDescriptor 5 0 R /DW 1000 /W [1 95 500] >>",
+    b"<< /Type /FontDescriptor /FontName /HYSMyeongJo-Medium /Flags 6 /FontBBox [0 -148 1001 880] "
+    b"/ItalicAngle 0 /Ascent 880 /Descent -120 /CapHeight 880 /StemV 50 >>",
+]
+
+def write_pdf(pages, size, output):
+    """도형 목록(페이지마다)을 PDF로 output에 기록
+
+    같은 도형 목록 객체를 쓰는 페이지는 content stream 하나를 함께 참조한다.
+    """
+    width, height = size
+    offsets = {}
+    position = 0
+
+    def write(data):
+        nonlocal position
+        output.write(data)
+        position += len(data)
+
+    def write_object(number, body, stream=None):
+        offsets[number] = position
+        write(f"{number} 0 obj\n".encode("ascii"))
+        write(body)
+        if stream is not None:
+            write(b"\nstream\n")
+            write(stream)
+            write(b"\nendstream")
+        write(b"\nendobj\n")
+
+    write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+    for number, body in enumerate(_FONT_OBJECTS, start=3):
+        write_object(number, body)
+
+    # 내용이 같은 페이지는 stream 하나를 공유
+    streams = {}
+    next_number = 6
+    for shapes in pages:
+        if id(shapes) in streams:
+            continue
+        data = zlib.compress(_content_stream(shapes, height))
+        streams[id(shapes)] = next_number
+        write_object(next_number, f"<< /Length {len(data)} /Filter /FlateDecode >>".encode("ascii"), data)
+        next_number += 1
+
+    page_numbers = []
+    for shapes in pages:
+        write_object(next_number, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width:g} {height:g}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {streams[id(shapes)]} 0 R >>"
+        ).encode("ascii"))
+        page_numbers.append(next_number)
+        next_number += 1
+
+    kids = " ".join(f"{number} 0 R" for number in page_numbers)
+    write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(page_numbers)} >>".encode("ascii"))
+
+    xref_position = position
+    write(f"xref\n0 {next_number}\n0000000000 65535 f \n".encode("ascii"))
+    for number in range(1, next_number):
+        write(f"{offsets[number]:010d} 00000 n \n".encode("ascii"))
+    write(f"trailer\n<< /Size {next_number} /Root 1 0 R >>\nstartxref\n{xref_position}\n%%EOF\n".encode("ascii"))
+
+def generate_pdf(config):
+    """설정(config)대로 노트를 그려 PDF 바이트로 반환"""
+    output = io.BytesIO()
+    write_pdf(notebook_pages(config), page_size(config["orientation"]), output)
+    return output.getvalue()
@@ -0,0 +1,56 @@
+"""python-docx 없이 배치 모델로 첫 페이지를 그리는 SVG 미리보기
+
+PDF 출력과 같은 도형 목록(notebook_pages)을 SVG 요소로 옮기므로
+Word/PDF 파일과 같은 위치에 같은 선이 보인다.
+"""
+from xml.sax.saxutils import escape
+
+from .catalog import PDF_TYPES
+from .pdf import notebook_pages, page_size
+
+# 미리보기를 그릴 수 있는 노트 (PDF와 같은 도형을 쓰는 노트)
+PREVIEW_TYPES = PDF_TYPES
+
+_ANCHORS = {'left': 'start', 'center': 'middle', 'right': 'end'}
+
+def _svg_element(shape):
+    kind = shape[0]
+    if kind == 'line':
+        _, x1, y1, x2, y2, width, color, dash = shape
+        dasharray = ' stroke-dasharray="0.75 1.5"' if dash else ''
+        return (f'<line x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}" '
+                f'stroke="#{color}" stroke-width="{width:g}"{dasharray}/>')
+    if kind == 'rect':
+        _, x, y, w, h, width, color, fill = shape
+        stroke = f' stroke="#{color}" stroke-width="{width:g}"' if width else ''
+        return (f'<rect x="{x:.2f}" y="{y:.2f}" width="{w:.2f}" height="{h:.2f}" '
+                f'fill="{"#" + fill if fill else "none"}"{stroke}/>')
+    _, x, y, text, size, color, align, bold = shape
+    weight = ' font-weight="bold"' if bold else ''
+    return (f'<text x="{x:.2f}" y="{y:.2f}" font-size="{size:g}" fill="#{color}" '
+            f'text-anchor="{_ANCHORS[align]}"{weight}>{escape(text)}</text>')
+
+def preview_svg(config, width=None):
+    """config의 첫 페이지를 SVG 문자열로 반환 (PREVIEW_TYPES만)
+
+    width를 주면 그 픽셀 너비로 표시하고, 없으면 용지 크기(pt) 그대로 표시한다.
+    """
+    if config["notebook_type"] not in PREVIEW_TYPES:
+        raise ValueError(f"미리보기를 그릴 수 없는 노트 종류: {config['notebook_type']}")
+
+    # 첫 페이지만 필요하므로 페이지 수를 1로 줄여 도형을 만든다
+    options = dict(config["options"])
+    options["num_months" if config["notebook_type"] == "달력" else "num_pages"] = 1
+    # (달력은 사용자 정보가 따로 첫 페이지에 있으므로 마지막 페이지인 첫 달을 보여 줌)
+    shapes = notebook_pages(dict(config, options=options))[-1]
+
+    page_width, page_height = page_size(config["orientation"])
+    display_width = width or page_width
+    display_height = display_width * page_height / page_width
+    return "\n".join([
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{display_width:g}" height="{display_height:.0f}" '
+        f'viewBox="0 0 {page_width:g} {page_height:g}" font-family="serif">',
+        f'<rect width="{page_width:g}" height="{page_height:g}" fill="#FFFFFF" stroke="#CCCCCC"/>',
+        *(_svg_element(shape) for shape in shapes),
+        '</svg>',
+    ])
@@ -0,0 +1,44 @@
+"""생성 함수의 페이지 반복 안에서 진행률을 알리고 취소를 받는 연결 고리
+
+생성 함수의 인자를 늘리지 않도록, 진행률 콜백은 progress_scope로 현재 실행 문맥(contextvars)에 건다.
+페이지를 만드는 반복문은 페이지마다 report_progress(done, total)를 부르고,
+콜백이 GenerationCancelled를 일으키면 그 자리에서 생성이 멈춘다.
+콜백이 걸려 있지 않으면 report_progress는 아무 일도 하지 않는다.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_progress_callback = ContextVar("notegen_progress_callback", default=None)
+
+class GenerationCancelled(Exception):
+    """진행률 콜백이 생성을 멈추게 할 때 일으키는 예외"""
+
+@contextmanager
+def progress_scope(callback):
+    """with 블록 안의 생성 함수가 callback(done, total)으로 진행률을 알리게 함"""
+    token = _progress_callback.set(callback)
+    try:
+        yield
+    finally:
+        _progress_callback.reset(token)
+
+def report_progress(done, total):
+    """total 단위(페이지, 날짜, 달) 중 done개를 마쳤음을 알림 (취소되었으면 GenerationCancelled)"""
+    callback = _progress_callback.get()
+    if callback is not None:
+        callback(done, total)
+
+@contextmanager
+def progress_stage(done, total):
+    """with 블록 안의 진행률 알림을 바깥 콜백에는 (done, total)로 바꿔 알림
+
+    여러 단계로 된 작업에서 한 단계 안의 페이지 진행률은 감추고 취소 확인만 이어 받는다.
+    """
+    outer = _progress_callback.get()
+    
+    def callback(_done, _total):
+        if outer is not None:
+            outer(done, total)
+    
+    with progress_scope(callback):
+        yield
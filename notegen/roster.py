@@ -0,0 +1,126 @@
+"""학급 명단으로 학생별 노트를 일괄 생성"""
+import csv
+import io
+import multiprocessing
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from docx import Document
+
+from .catalog import notebook_filename
+from .document import ZIP_TIMESTAMP, add_user_info, save_document
+from .notebook import generate_notebook
+from .progress import progress_stage, report_progress
+
+# 학급 명단 CSV의 필수 열 (add_user_info 인자와 같음)
+ROSTER_COLUMNS = ["school_name", "grade", "class_num", "student_name"]
+
+# 사용자 정보를 별도 첫 페이지에 넣는 노트
+OWN_PAGE_INFO_TYPES = ["다이어리", "달력"]
+
+def read_roster(data):
+    """학급 명단 CSV 바이트를 사용자 정보 dict 목록으로 변환 (UTF-8 또는 CP949)"""
+    for encoding in ("utf-8-sig", "cp949"):
+        try:
+            text = data.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        raise ValueError("CSV 파일 인코딩을 읽을 수 없습니다. UTF-8 또는 CP949로 저장해주세요.")
+    
+    reader = csv.DictReader(io.StringIO(text))
+    missing = [column for column in ROSTER_COLUMNS if column not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"CSV에 필요한 열이 없습니다: {', '.join(missing)}")
+    
+    students = []
+    for row in reader:
+        info = {column: (row[column] or "").strip() for column in ROSTER_COLUMNS}
+        if any(info.values()):
+            students.append(info)
+    return students
+
+def personalize_document(base_bytes, user_info, own_page=False):
+    """사용자 정보가 없는 문서 앞부분에 사용자 정보 블록을 끼워 넣어 바이트로 반환"""
+    doc = Document(io.BytesIO(base_bytes))
+    body = doc.element.body
+    
+    # 사용자 정보를 문서 끝(sectPr 앞)에 추가한 뒤 맨 앞으로 옮김
+    start = len(body) - (1 if body.sectPr is not None else 0)
+    if add_user_info(doc, **user_info) and own_page:
+        doc.add_page_break()
+    end = len(body) - (1 if body.sectPr is not None else 0)
+    for element in reversed(body[start:end]):
+        body.insert(0, element)
+    
+    doc_io = io.BytesIO()
+    save_document(doc, doc_io)
+    return doc_io.getvalue()
+
+# 작업 프로세스마다 한 번만 받아 두는 공통 본문
+_roster_base = None
+
+def _init_roster_worker(base_bytes):
+    global _roster_base
+    _roster_base = base_bytes
+
+def _personalize_roster_entry(user_info, own_page):
+    return personalize_document(_roster_base, user_info, own_page)
+
+def roster_entry_name(index, user_info, filename):
+    """ZIP 안의 학생별 파일명"""
+    name = user_info["student_name"] or f"학생{index + 1}"
+    name = "".join("_" if char in '\\/:*?"<>|' else char for char in name)
+    return f"{index + 1:02d}_{name}_{filename}"
+
+def generate_roster_zip(config, students, output, max_workers=None):
+    """학생마다 사용자 정보만 바꾼 노트를 만들어 ZIP으로 output에 기록
+
+    본문은 사용자 정보 없이 한 번만 만들고, 학생별 문서는 프로세스 풀에서 만든다.
+    output_format이 "pdf"이면 학생마다 PDF를 바로 그린다 (python-docx를 쓰지 않아 가벼우므로 이 프로세스에서).
+    완성된 문서는 순서대로 ZIP에 바로 기록하므로 전체 묶음을 메모리에 쌓지 않는다.
+    진행률은 학생 수 단위로 report_progress에 알린다 (취소되면 남은 학생은 만들지 않음).
+    """
+    if config.get("output_format") == "pdf":
+        _write_pdf_roster(config, students, output)
+        return
+    
+    base_config = dict(config, user_info=None)
+    with progress_stage(0, len(students)):
+        base_bytes = generate_notebook(base_config)
+    filename = notebook_filename(base_config)
+    own_page = config["notebook_type"] in OWN_PAGE_INFO_TYPES
+    
+    if max_workers is None:
+        max_workers = min(len(students), os.cpu_count() or 1) or 1
+    # 여러 스레드가 도는 서버 프로세스를 그대로 fork하면 자식이 남의 잠금(libxml2, logging)을 쥔 채 멈출 수 있으므로
+    # 깨끗한 서버 프로세스에서 fork하는 forkserver (없으면 spawn)를 쓴다
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    context = multiprocessing.get_context(start_method)
+    
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                             initializer=_init_roster_worker, initargs=(base_bytes,)) as executor, \
+            zipfile.ZipFile(output, 'w', zipfile.ZIP_STORED) as archive:
+        # .docx는 이미 압축되어 있으므로 ZIP에는 그대로 저장
+        results = executor.map(_personalize_roster_entry, students, [own_page] * len(students))
+        try:
+            for index, (user_info, doc_bytes) in enumerate(zip(students, results)):
+                archive.writestr(zipfile.ZipInfo(roster_entry_name(index, user_info, filename), ZIP_TIMESTAMP),
+                                 doc_bytes)
+                report_progress(index + 1, len(students))
+        except BaseException:
+            # 취소나 오류면 아직 시작하지 않은 학생 작업은 버림
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+def _write_pdf_roster(config, students, output):
+    # 학생마다 사용자 정보를 넣은 PDF를 그려 순서대로 ZIP에 기록
+    filename = notebook_filename(config)
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_STORED) as archive:
+        for index, user_info in enumerate(students):
+            with progress_stage(index, len(students)):
+                pdf_bytes = generate_notebook(dict(config, user_info=user_info))
+            archive.writestr(zipfile.ZipInfo(roster_entry_name(index, user_info, filename), ZIP_TIMESTAMP), pdf_bytes)
+            report_progress(index + 1, len(students))
@@ -0,0 +1,171 @@
+"""여러 사용자의 생성 작업을 동시 실행 수와 비용 예산 안에서 차례로 시작하는 전역 스케줄러"""
+import threading
+from collections import deque
+
+from .jobs import GenerationJob
+
+# 작업 비용의 단위는 대략 "만들어지는 셀(행, 칸) 하나"
+# 스트리밍 모드는 두 페이지만 만들고 나머지는 바이트 복사이므로 페이지당 비용을 이만큼으로 본다
+STREAMED_PAGE_COST = 0.05
+
+def estimate_cost(config):
+    """설정만 보고 계산한 작업 비용 (셀 수 x 페이지 수, 날짜 수 등)"""
+    notebook_type = config["notebook_type"]
+    options = config["options"]
+    if notebook_type == "다이어리":
+        return options["num_days"] * 40
+    if notebook_type == "달력":
+        return options["num_months"] * 60
+
+    if notebook_type == "줄공책":
+        per_page = options["lines_per_page"]
+    elif notebook_type == "칸공책":
+        per_page = options["rows"] if options.get("lean") else options["rows"] * options["cols"]
+    elif notebook_type == "영어노트 (4선)":
+        per_page = options["lines_per_page"] * 4
+    elif notebook_type == "음악 오선지":
+        per_page = options["staves_per_page"] * 5
+    elif notebook_type == "한자노트":
+        # 칸마다 한자 칸, 뜻 칸, 십자 가이드 내부 표 네 칸 (경량 모드는 가이드가 도형 하나)
+        per_page = options["rows_per_page"] * options["chars_per_row"] * (3 if options.get("lean") else 6)
+    elif notebook_type == "수학 오답노트":
+        grid_rows = max(6, int(20 / options["problems_per_page"]))
+        per_page = options["problems_per_page"] * (grid_rows * 15 + 10)
+    else:
+        per_page = 10
+
+    pages = options["num_pages"]
+    if config.get("output_format") == "pdf":
+        # PDF는 같은 페이지 내용을 한 번만 그리고 페이지는 참조만 추가
+        return per_page + pages
+    if config.get("streaming"):
+        return per_page * (min(pages, 2) + pages * STREAMED_PAGE_COST)
+    return per_page * pages
+
+class JobRejected(Exception):
+    """스케줄러가 작업을 받지 않을 때 (비용 초과, 대기열 가득 참)"""
+
+class GenerationScheduler:
+    """동시 실행 수와 실행 중 비용 합계를 제한하며 생성 작업을 시작하는 스케줄러
+
+    비용이 light_cost 이하인 작은 작업은 빠른 대기열에 들어가 먼저 시작하고,
+    큰 작업은 max_running - 1개까지만 동시에 돌아 작은 작업 자리가 늘 하나 남는다.
+    큰 작업은 실행 중인 작업 비용의 합이 cost_budget을 넘지 않을 때만 시작한다
+    (아무것도 돌지 않으면 예산과 관계없이 시작).
+    비용이 max_job_cost를 넘거나 대기열이 max_queue개로 가득 차면 JobRejected를 일으킨다.
+    submit에 key(설정 해시)를 주면 같은 key로 대기 중이거나 실행 중인 작업을 새로 만들지 않고
+    그 작업의 대기자로 합류시킨다 (한 번만 생성하고 결과를 함께 씀).
+    """
+    
+    def __init__(self, max_running, cost_budget, max_job_cost, light_cost, max_queue):
+        self.max_running = max_running
+        self.cost_budget = cost_budget
+        self.max_job_cost = max_job_cost
+        self.light_cost = light_cost
+        self.max_queue = max_queue
+        self.rejected = 0
+        self.coalesced = 0
+        self._light = deque()
+        self._heavy = deque()
+        self._running = {}  # 작업 -> 비용
+        self._costs = {}
+        self._inflight = {}  # 설정 해시 -> 작업
+        self._lock = threading.Lock()
+    
+    def submit(self, run, cost, max_idle=None, key=None):
+        """run(report)을 실행할 GenerationJob을 만들어 바로 시작하거나 대기열에 넣고 반환
+
+        key가 같은 작업이 아직 끝나지 않았으면 그 작업에 대기자를 더해 반환한다.
+        """
+        with self._lock:
+            job = self._inflight.get(key)
+            if job is not None and not job.finished and job.waiters > 0:
+                job.add_waiter()
+                job.touch()
+                self.coalesced += 1
+                return job
+            if cost > self.max_job_cost:
+                self.rejected += 1
+                raise JobRejected(f"작업이 너무 큽니다 (비용 {cost:,.0f}, 한도 {self.max_job_cost:,.0f}).")
+            if len(self._light) + len(self._heavy) >= self.max_queue:
+                self.rejected += 1
+                raise JobRejected("대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도해주세요.")
+            job = GenerationJob(run, max_idle=max_idle, on_finish=self._release)
+            self._costs[job] = cost
+            if key is not None:
+                self._inflight[key] = job
+            (self._light if cost <= self.light_cost else self._heavy).append(job)
+            self._dispatch()
+        return job
+    
+    def position(self, job):
+        """대기열에서 앞에 있는 작업 수 (0이면 다음 차례, 대기 중이 아니면 None)"""
+        with self._lock:
+            self._dispatch()
+            if job in self._light:
+                return self._light.index(job)
+            if job in self._heavy:
+                return len(self._light) + self._heavy.index(job)
+            return None
+    
+    def waiters(self, key):
+        """key로 진행 중인 작업을 기다리는 사용자 수 (없으면 0)"""
+        with self._lock:
+            job = self._inflight.get(key)
+            return job.waiters if job is not None and not job.finished else 0
+    
+    def stats(self):
+        """실행 중/대기 중 작업 수와 비용, 거절/합류 횟수, 진행 중인 설정 해시별 대기자 수"""
+        with self._lock:
+            return {
+                "running": len(self._running),
+                "running_cost": sum(self._running.values()),
+                "queued_light": len(self._light),
+                "queued_heavy": len(self._heavy),
+                "rejected": self.rejected,
+                "coalesced": self.coalesced,
+                "waiters": {key: job.waiters for key, job in self._inflight.items()},
+            }
+    
+    def _release(self, job):
+        # 생성 스레드에서 작업이 끝나면 자리를 비우고 다음 작업 시작
+        with self._lock:
+            self._running.pop(job, None)
+            self._costs.pop(job, None)
+            self._forget(job)
+            self._dispatch()
+    
+    def _drop_abandoned(self, queue):
+        # 시작 전에 취소되었거나 화면을 떠난 사용자의 작업은 대기열에서 뺌
+        for job in [job for job in queue if job.finished or job.idle]:
+            job.abort()
+            queue.remove(job)
+            self._costs.pop(job, None)
+            self._forget(job)
+    
+    def _forget(self, job):
+        # 잠금 안에서 호출: 끝난 작업을 진행 중 목록에서 뺌
+        for key in [key for key, inflight in self._inflight.items() if inflight is job]:
+            del self._inflight[key]
+    
+    def _dispatch(self):
+        # 잠금 안에서 호출: 자리와 예산이 허락하는 만큼 작업 시작 (작은 작업 먼저)
+        self._drop_abandoned(self._light)
+        self._drop_abandoned(self._heavy)
+        heavy_slots = max(1, self.max_running - 1)
+        while len(self._running) < self.max_running:
+            if self._light:
+                job = self._light.popleft()
+            elif self._heavy and self._heavy_can_start(heavy_slots):
+                job = self._heavy.popleft()
+            else:
+                break
+            self._running[job] = self._costs[job]
+            job.start()
+    
+    def _heavy_can_start(self, heavy_slots):
+        heavy_running = sum(1 for cost in self._running.values() if cost > self.light_cost)
+        if heavy_running >= heavy_slots:
+            return False
+        running_cost = sum(self._running.values())
+        return not self._running or running_cost + self._costs[self._heavy[0]] <= self.cost_budget
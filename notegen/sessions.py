@@ -0,0 +1,151 @@
+"""세션마다 마지막으로 만든 문서를 재실행 사이에 들고 있는 보관소
+
+화면 세션(브라우저 탭)마다 마지막 결과 하나만 둔다.
+메모리의 바이트는 세션당 한도와 전체 한도를 넘지 않게 두고,
+넘치면 오래 보지 않은 세션부터 바이트를 내려놓고 설정 해시(참조)만 남긴다.
+참조만 남은 결과는 공유 캐시나 디스크 저장소에서 다시 꺼내 쓴다.
+max_idle초 동안 찾지 않은 세션은 통째로 지운다 (임시 파일은 닫음).
+같은 생성 작업에 합류한 세션들은 결과 임시 파일 하나를 함께 들고 있으므로
+파일은 마지막으로 들고 있던 세션이 내려놓을 때 닫고, 읽기는 세션마다 ArtifactReader로 따로 한다.
+"""
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+
+def _close(artifact):
+    if artifact is not None and not isinstance(artifact, bytes):
+        artifact.close()
+
+class ArtifactReader(io.RawIOBase):
+    """결과 임시 파일을 자기 위치에서 읽는 읽기 전용 파일 (os.pread, 공유 파일의 위치는 건드리지 않음)
+
+    여러 세션이 같은 파일을 동시에 내려받아도 서로의 읽기 위치를 옮기지 않는다.
+    닫아도 원래 파일은 닫지 않는다.
+    """
+    
+    def __init__(self, artifact):
+        self._artifact = artifact
+        artifact.flush()  # 버퍼에 남은 쓰기가 있으면 파일에 내림
+        self._fd = artifact.fileno()
+        self._offset = 0
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return True
+    
+    def readinto(self, buffer):
+        data = os.pread(self._fd, len(buffer), self._offset)
+        buffer[:len(data)] = data
+        self._offset += len(data)
+        return len(data)
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._offset
+        elif whence == io.SEEK_END:
+            offset += os.fstat(self._fd).st_size
+        self._offset = max(0, offset)
+        return self._offset
+    
+    def tell(self):
+        return self._offset
+
+class SessionArtifacts:
+    """세션 ID -> (설정 해시, 결과) 보관소 (바이트 예산, 방치 세션 만료)
+
+    결과는 bytes 또는 읽기용 파일 객체이고, 파일은 디스크에 있으므로 예산에 넣지 않는다.
+    """
+    
+    def __init__(self, max_session_bytes, max_bytes, max_idle):
+        self.max_session_bytes = max_session_bytes
+        self.max_bytes = max_bytes
+        self.max_idle = max_idle
+        self.expired = 0
+        self.released = 0
+        self._sessions = OrderedDict()  # 세션 ID -> [설정 해시, 결과, 마지막 사용 시각]
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    def put(self, session_id, key, artifact):
+        """세션의 마지막 결과를 바꿈 (이전 결과는 내려놓음, 세션 한도보다 큰 바이트는 참조만 둠)"""
+        if isinstance(artifact, bytes) and len(artifact) > self.max_session_bytes:
+            artifact = None
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+            self._sessions[session_id] = [key, artifact, time.monotonic()]
+            if entry is not None:
+                self._size -= self._bytes(entry[1])
+                self._release(entry[1])
+            self._size += self._bytes(artifact)
+            self._expire()
+            self._release_over_budget()
+    
+    def get(self, session_id, key):
+        """세션이 들고 있는 key의 결과 (참조만 남았거나 없으면 None)"""
+        with self._lock:
+            self._expire()
+            entry = self._sessions.get(session_id)
+            if entry is None or entry[0] != key:
+                return None
+            entry[2] = time.monotonic()
+            self._sessions.move_to_end(session_id)
+            return entry[1]
+    
+    def discard(self, session_id):
+        """세션의 결과를 지움"""
+        with self._lock:
+            self._drop(session_id)
+    
+    def stats(self):
+        """세션 수, 바이트를 들고 있는 세션 수, 사용량, 만료/내려놓은 횟수"""
+        with self._lock:
+            self._expire()
+            return {
+                "sessions": len(self._sessions),
+                "holding": sum(1 for _, artifact, _ in self._sessions.values() if artifact is not None),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "expired": self.expired,
+                "released": self.released,
+            }
+    
+    @staticmethod
+    def _bytes(artifact):
+        return len(artifact) if isinstance(artifact, bytes) else 0
+    
+    def _drop(self, session_id):
+        # 잠금 안에서 호출
+        entry = self._sessions.pop(session_id, None)
+        if entry is not None:
+            self._size -= self._bytes(entry[1])
+            self._release(entry[1])
+    
+    def _release(self, artifact):
+        # 잠금 안에서 호출: 내려놓은 파일을 아무 세션도 들고 있지 않으면 닫음
+        if any(entry[1] is artifact for entry in self._sessions.values()):
+            return
+        _close(artifact)
+    
+    def _expire(self):
+        # 잠금 안에서 호출: 오래 찾지 않은 세션 제거 (가장 오래된 것부터 순서대로 있음)
+        deadline = time.monotonic() - self.max_idle
+        while self._sessions:
+            session_id, (_, _, last_seen) = next(iter(self._sessions.items()))
+            if last_seen > deadline:
+                break
+            self._drop(session_id)
+            self.expired += 1
+    
+    def _release_over_budget(self):
+        # 잠금 안에서 호출: 전체 예산을 넘으면 오래 보지 않은 세션부터 바이트를 내려놓고 참조만 남김
+        for entry in self._sessions.values():
+            if self._size <= self.max_bytes:
+                break
+            if isinstance(entry[1], bytes):
+                self._size -= len(entry[1])
+                entry[1] = None
+                self.released += 1
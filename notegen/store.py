@@ -0,0 +1,134 @@
+"""여러 서버 프로세스가 함께 쓰는 디스크 기반 생성 결과 저장소
+
+설정 해시(config_key)를 파일 이름으로 쓰는 내용 주소 방식이다.
+파일은 임시 파일에 다 쓴 뒤 os.replace로 한 번에 바꿔 넣으므로 읽는 쪽은 완성된 파일만 본다.
+쓰기와 정리는 저장소 잠금 파일(fcntl.flock)로 프로세스 사이에서 한 번에 하나만 한다.
+읽을 때마다 파일 수정 시각을 갱신하여, 예산을 넘으면 가장 오래 쓰지 않은 파일부터 지운다.
+"""
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 사이 잠금 없이 스레드 잠금만 사용
+    fcntl = None
+
+_LOCK_NAME = ".lock"
+_TEMP_PREFIX = ".tmp-"
+
+class ArtifactStore:
+    """생성된 파일을 설정 해시로 보관하는 디스크 LRU 저장소 (전체 바이트 예산 제한)"""
+    
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._thread_lock = threading.Lock()
+        try:
+            os.makedirs(root, exist_ok=True)
+        except OSError:
+            # 만들 수 없으면 put/get이 OSError를 일으키고, 부르는 쪽에서 캐시 없이 진행한다
+            pass
+    
+    def _path(self, key):
+        return os.path.join(self.root, key)
+    
+    @contextmanager
+    def _locked(self):
+        # 같은 프로세스의 스레드끼리, 그리고 다른 프로세스와도 배타적으로
+        with self._thread_lock, open(os.path.join(self.root, _LOCK_NAME), "a+b") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def get(self, key):
+        """저장된 파일을 읽기용으로 열어 반환하고 최근 사용으로 표시 (없으면 None)
+
+        열린 파일은 그 뒤에 정리되어 지워져도 (POSIX에서는) 끝까지 읽을 수 있다.
+        """
+        try:
+            f = open(self._path(key), "rb")
+        except FileNotFoundError:
+            with self._thread_lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(f.fileno())
+        except OSError:
+            pass
+        with self._thread_lock:
+            self.hits += 1
+        return f
+    
+    def put(self, key, data):
+        """bytes 또는 바이너리 파일 객체(처음부터)를 원자적으로 저장하고 예산을 넘으면 오래된 것부터 제거"""
+        fd, temp_path = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=self.root)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if isinstance(data, bytes):
+                    f.write(data)
+                else:
+                    data.seek(0)
+                    shutil.copyfileobj(data, f)
+                size = f.tell()
+            if size > self.max_bytes:
+                os.unlink(temp_path)
+                return
+            with self._locked():
+                os.replace(temp_path, self._path(key))
+                self._evict()
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        finally:
+            if not isinstance(data, bytes):
+                data.seek(0)
+    
+    def _entries(self):
+        # (수정 시각, 크기, 경로) 목록, 잠금 파일과 쓰는 중인 임시 파일은 제외
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+    
+    def _evict(self):
+        # 잠금 안에서 호출: 예산을 넘는 만큼 가장 오래 쓰지 않은 파일부터 삭제
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+    
+    def stats(self):
+        """이 프로세스의 적중/미스 횟수와 저장소 전체 사용량"""
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,70 @@
+"""python-docx 객체 모델을 거치지 않고 반복 페이지를 스트리밍으로 기록"""
+import io
+import zipfile
+
+from docx.oxml.ns import qn
+from lxml import etree
+
+from .catalog import STREAMABLE_TYPES
+from .document import save_document
+from .progress import report_progress
+
+_PAGE_MARK = 'notegen-page'
+
+def save_streamed(doc, num_pages, output, notebook_type):
+    """두 번째 페이지의 XML을 반복 기록하여 num_pages 페이지 문서를 output에 저장
+
+    doc에는 python-docx로 만든 첫 페이지(사용자 정보 포함)와 두 번째 페이지만 있으면 된다.
+    word/document.xml은 페이지 단위 청크로 압축 스트림에 바로 기록하므로
+    페이지 수가 늘어나도 메모리 사용량은 한 페이지 분량으로 유지된다.
+    페이지를 하나 기록할 때마다 report_progress로 진행률을 알린다.
+    모든 페이지가 같은 노트(STREAMABLE_TYPES)에만 쓸 수 있고, 그 밖의 notebook_type이면 ValueError.
+    """
+    if notebook_type not in STREAMABLE_TYPES:
+        raise ValueError(f"스트리밍으로 기록할 수 없는 노트 종류: {notebook_type}")
+    body = doc.element.body
+    page_breaks = [
+        element for element in body
+        if element.tag == qn('w:p') and element.xpath('./w:r/w:br[@w:type="page"]')
+    ]
+    if num_pages < 2 or not page_breaks:
+        save_document(doc, output)
+        return
+    
+    # 두 번째 페이지(앞의 페이지 나누기 포함)를 주석으로 표시한 뒤 저장
+    start_mark = etree.Comment(_PAGE_MARK)
+    end_mark = etree.Comment(_PAGE_MARK)
+    page_breaks[-1].addprevious(start_mark)
+    if body.sectPr is not None:
+        body.sectPr.addprevious(end_mark)
+    else:
+        body.append(end_mark)
+    package = io.BytesIO()
+    try:
+        save_document(doc, package)
+    finally:
+        body.remove(start_mark)
+        body.remove(end_mark)
+    
+    mark = f'<!--{_PAGE_MARK}-->'.encode()
+    with zipfile.ZipFile(package) as source, \
+            zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            if info.filename != 'word/document.xml':
+                target.writestr(info, source.read(info))
+                continue
+            
+            head, page, tail = source.read(info).split(mark)
+            document_info = zipfile.ZipInfo(info.filename, info.date_time)
+            document_info.compress_type = zipfile.ZIP_DEFLATED
+            with target.open(document_info, 'w') as stream:
+                for chunk in _document_chunks(head, page, tail, num_pages):
+                    stream.write(chunk)
+
+def _document_chunks(head, page, tail, num_pages):
+    # 첫 페이지까지의 머리말, 반복되는 페이지, 구역 설정(sectPr)을 차례로 내보냄
+    yield head
+    for index in range(num_pages - 1):
+        yield page
+        report_progress(index + 2, num_pages)
+    yield tail
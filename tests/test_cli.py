@@ -0,0 +1,21 @@
+"""명령줄 batch: 잘못된 작업은 번호와 함께 알리고 나머지 작업은 계속하는지 확인"""
+import json
+
+from notegen.cli import main
+
+def test_batch_reports_bad_job_and_keeps_going(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    jobs = tmp_path / "jobs.json"
+    jobs.write_text(json.dumps([
+        {"type": "lined", "output": 5},
+        {"type": "lined", "school": 7},
+        {"type": "lined", "lines": 12, "output": "good.docx"},
+    ]), encoding="utf-8")
+
+    assert main(["batch", str(jobs)]) == 1
+
+    assert (tmp_path / "good.docx").stat().st_size > 0
+    errors = capsys.readouterr().err
+    assert "작업 1: lined 작업의 output 값은 문자열이어야 합니다." in errors
+    assert "작업 2: lined 작업의 school 값은 문자열이어야 합니다." in errors
+    assert "3개 작업 중 2개 실패" in errors
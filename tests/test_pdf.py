@@ -0,0 +1,26 @@
+"""PDF 배치가 docx와 같은 페이지 구성을 따르는지 확인"""
+from notegen.pdf import notebook_pages
+
+USER_INFO = {"school_name": "경북초등학교", "grade": "3학년", "class_num": "2반", "student_name": "홍길동"}
+
+def _texts(shapes):
+    return [shape[3] for shape in shapes if shape[0] == 'text']
+
+def test_calendar_user_info_on_own_first_page():
+    config = {"notebook_type": "달력", "orientation": "세로", "user_info": USER_INFO,
+              "options": {"year": 2026, "month": 12, "num_months": 2}}
+    pages = notebook_pages(config)
+
+    assert len(pages) == 3
+    assert any("홍길동" in text for text in _texts(pages[0]))
+    assert not any(text.endswith("월") for text in _texts(pages[0]))
+    assert ["2026년 12월" in _texts(pages[1]), "2027년 1월" in _texts(pages[2])] == [True, True]
+    assert not any("홍길동" in text for page in pages[1:] for text in _texts(page))
+
+def test_calendar_without_user_info_starts_with_month():
+    config = {"notebook_type": "달력", "orientation": "가로", "user_info": None,
+              "options": {"year": 2026, "month": 1, "num_months": 1}}
+    pages = notebook_pages(config)
+
+    assert len(pages) == 1
+    assert "2026년 1월" in _texts(pages[0])
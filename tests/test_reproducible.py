@@ -0,0 +1,119 @@
+"""같은 설정이 실행(프로세스)마다 항상 같은 바이트(SHA-256)가 되는지 확인
+
+모든 노트 종류를 지원하는 모드(기본, 압축 스타일, 경량 그리기, 스트리밍, PDF)와 두 용지 방향으로 만들고,
+학교 서식(letterhead)을 쓴 노트와 학급 명단 ZIP도 만든다.
+해시 시드(PYTHONHASHSEED)가 다른 두 자식 프로세스에서 zip 항목 시각이 달라지도록
+ZIP_GAP초 간격을 두고 만들어 해시를 비교한다.
+
+    python -m pytest tests/test_reproducible.py
+"""
+import hashlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# zip 항목 시각의 단위는 2초이므로 두 실행 사이에 그보다 긴 간격을 둔다
+ZIP_GAP = 2.5
+
+USER_INFO = {"school_name": "경북초등학교", "grade": "3학년", "class_num": "2반", "student_name": "홍길동"}
+
+# (노트 종류, 설정) - 스트리밍이 실제로 페이지를 반복하도록 3페이지
+CASES = [
+    ("줄공책", {"lines_per_page": 20, "num_pages": 3}),
+    ("칸공책", {"rows": 10, "cols": 10, "num_pages": 3}),
+    ("영어노트 (4선)", {"lines_per_page": 8, "num_pages": 3}),
+    ("코넬노트", {"num_pages": 3}),
+    ("음악 오선지", {"staves_per_page": 10, "num_pages": 3}),
+    ("한자노트", {"rows_per_page": 6, "chars_per_row": 8, "num_pages": 3}),
+    ("다이어리", {"start_date": date(2026, 1, 1), "num_days": 3}),
+    ("달력", {"year": 2026, "month": 1, "num_months": 2}),
+    ("수학 오답노트", {"problems_per_page": 2, "num_pages": 3}),
+]
+
+ORIENTATIONS = ["세로", "가로"]
+
+ROSTER = [
+    {"school_name": "경북초등학교", "grade": "3학년", "class_num": "2반", "student_name": "김하나"},
+    {"school_name": "경북초등학교", "grade": "3학년", "class_num": "2반", "student_name": "이두리"},
+]
+
+def variants(notebook_type):
+    """노트가 지원하는 (모드 이름, 설정에 더할 값) 목록"""
+    from notegen import COMPACT_TYPES, LEAN_TYPES, PDF_TYPES, STREAMABLE_TYPES
+    result = [("docx", {})]
+    if notebook_type in COMPACT_TYPES:
+        result.append(("compact", {"options": {"compact": True}}))
+    if notebook_type in LEAN_TYPES:
+        result.append(("lean", {"options": {"lean": True}}))
+    if notebook_type in STREAMABLE_TYPES:
+        result.append(("stream", {"streaming": True}))
+    if notebook_type in PDF_TYPES:
+        result.append(("pdf", {"output_format": "pdf"}))
+    return result
+
+def write_letterhead(path):
+    """머리글과 바닥글에 글이 있는 학교 서식 .docx"""
+    from docx import Document
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = "경북초등학교"
+    doc.sections[0].footer.paragraphs[0].text = "경북초등학교 3학년 2반"
+    doc.save(path)
+
+def case_hashes(letterhead):
+    """케이스 이름 -> 결과 SHA-256 (자식 프로세스에서 실행)"""
+    from notegen import generate_notebook, generate_roster_zip
+    hashes = {}
+    for orientation in ORIENTATIONS:
+        for notebook_type, options in CASES:
+            for mode, extra in variants(notebook_type):
+                config = {
+                    "notebook_type": notebook_type,
+                    "orientation": orientation,
+                    "user_info": USER_INFO,
+                    "options": dict(options, **extra.get("options", {})),
+                    "streaming": extra.get("streaming", False),
+                    "output_format": extra.get("output_format", "docx"),
+                }
+                hashes[f"{orientation}/{notebook_type}/{mode}"] = hashlib.sha256(generate_notebook(config)).hexdigest()
+                if mode == "docx":
+                    config["letterhead"] = letterhead
+                    hashes[f"{orientation}/{notebook_type}/letterhead"] = \
+                        hashlib.sha256(generate_notebook(config)).hexdigest()
+
+    notebook_type, options = CASES[0]
+    roster_zip = io.BytesIO()
+    roster_config = {"notebook_type": notebook_type, "orientation": "세로", "user_info": None,
+                     "options": options, "streaming": False}
+    generate_roster_zip(roster_config, ROSTER, roster_zip, max_workers=1)
+    hashes["학급 명단 ZIP"] = hashlib.sha256(roster_zip.getvalue()).hexdigest()
+    return hashes
+
+def _run_child(seed, letterhead):
+    environment = dict(os.environ, PYTHONHASHSEED=str(seed), PYTHONPATH=str(ROOT))
+    command = [sys.executable, __file__, str(letterhead)]
+    completed = subprocess.run(command, capture_output=True, text=True, check=True, env=environment, cwd=ROOT)
+    return json.loads(completed.stdout)
+
+def test_same_bytes_across_processes(tmp_path):
+    letterhead = tmp_path / "letterhead.docx"
+    write_letterhead(letterhead)
+
+    first = _run_child(1, letterhead)
+    time.sleep(ZIP_GAP)
+    second = _run_child(2, letterhead)
+
+    assert first.keys() == second.keys()
+    assert any(name.startswith("가로/") for name in first)
+    mismatched = [name for name in first if first[name] != second[name]]
+    assert not mismatched, f"실행마다 결과가 다른 케이스: {mismatched}"
+
+if __name__ == "__main__":
+    # 자식 프로세스: 모든 케이스의 해시를 JSON으로 출력
+    print(json.dumps(case_hashes(sys.argv[1])))
@@ -0,0 +1,24 @@
+"""학급 명단 ZIP이 고른 파일 형식으로 학생별 문서를 담는지 확인"""
+import io
+import zipfile
+
+from notegen import generate_roster_zip
+
+STUDENTS = [
+    {"school_name": "경북초등학교", "grade": "3학년", "class_num": "2반", "student_name": "김하나"},
+    {"school_name": "경북초등학교", "grade": "3학년", "class_num": "2반", "student_name": "이두리"},
+]
+
+def test_pdf_roster_contains_pdfs():
+    config = {"notebook_type": "칸공책", "orientation": "세로", "user_info": None,
+              "options": {"rows": 10, "cols": 10, "num_pages": 2}, "streaming": False, "output_format": "pdf"}
+    output = io.BytesIO()
+    generate_roster_zip(config, STUDENTS, output)
+
+    with zipfile.ZipFile(output) as archive:
+        names = archive.namelist()
+        assert names == ["01_김하나_칸공책_2페이지.pdf", "02_이두리_칸공책_2페이지.pdf"]
+        documents = [archive.read(name) for name in names]
+    assert all(data.startswith(b"%PDF") for data in documents)
+    # 학생마다 첫 페이지의 사용자 정보가 다름
+    assert documents[0] != documents[1]
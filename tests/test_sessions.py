@@ -0,0 +1,35 @@
+"""세션 보관소: 같은 결과 임시 파일을 함께 든 세션들이 서로의 파일을 닫거나 읽기 위치를 옮기지 않는지 확인"""
+import tempfile
+
+from notegen import ArtifactReader, SessionArtifacts
+
+def _spilled(data):
+    # 생성 작업이 큰 결과를 돌려줄 때처럼 디스크로 넘어간 임시 파일
+    artifact = tempfile.SpooledTemporaryFile(max_size=1)
+    artifact.write(data)
+    artifact.seek(0)
+    return artifact
+
+def test_discard_keeps_file_for_other_session():
+    data = b"notebook" * 1000
+    artifact = _spilled(data)
+    artifacts = SessionArtifacts(max_session_bytes=1024, max_bytes=4096, max_idle=3600)
+    artifacts.put("first", "key", artifact)
+    artifacts.put("second", "key", artifact)
+
+    artifacts.discard("first")
+    held = artifacts.get("second", "key")
+    assert held is artifact and not artifact.closed
+    assert ArtifactReader(held).read() == data
+
+    artifacts.discard("second")
+    assert artifact.closed
+
+def test_readers_keep_their_own_position():
+    data = bytes(range(256)) * 10
+    artifact = _spilled(data)
+    first, second = ArtifactReader(artifact), ArtifactReader(artifact)
+    assert first.read(100) == data[:100]
+    assert second.read() == data
+    assert first.read() == data[100:]
+    assert artifact.tell() == 0